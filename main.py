@@ -2,12 +2,13 @@
 
 import argparse
 import asyncio
+import atexit
 import logging
+import sys
 import yaml
 from pathlib import Path
 
-from src.activation_schema import ActivationSchema
-from src.memory_manager import MemoryManager
+from src.logutil import start_queued_logging
 
 # Optional monitor import (only if needed)
 try:
@@ -47,6 +48,9 @@ def setup_logging(config: dict):
         level=level,
         format="%(asctime)s | %(levelname)s | %(message)s"
     )
+    if config.get("logging", {}).get("queued", False):
+        listener = start_queued_logging()
+        atexit.register(listener.stop)
 
 
 async def main():
@@ -58,19 +62,38 @@ async def main():
     if args.monitor_emergence:
         if monitor_loop is not None:
             logger.info("Starting emergence monitor loop...")
-            await monitor_loop()
+            live_config = config.get("live_state", {})
+            await monitor_loop(live=live_config.get("name", "re_omega_live")
+                               if live_config.get("enabled", False) else None)
         else:
             logger.error("Monitor loop not available.")
         return
 
     cycles = args.cycles if args.cycles is not None else config["recursion"].get("max_depth", 10)
     interactive = args.interactive
+    # Deferred so --help and --monitor-emergence never load numpy/torch
+    from src.activation_schema import ActivationSchema
+    from src.convergence import ConvergenceCriteria, ConvergenceDetector
+    from src.memory_manager import MemoryManager
+    from src.series import SeriesWriter
+
     schema = ActivationSchema(config, emergence_mode=True)
-    memory = MemoryManager(root="memory", log_file="emergence_log.json")
+    memory = MemoryManager(root="memory", log_file="emergence_log.json",
+                           fsync_every=config.get("persistence", {}).get("fsync_every", 32))
+    series = SeriesWriter("memory/cycles", ("cycle", "sigma", "tau"))
+    criteria = ConvergenceCriteria.from_config(config)
+    detector = ConvergenceDetector(criteria) if criteria is not None else None
+
+    def converged(out: dict) -> str:
+        # sigma is the Σ coherence metric; run in the processing stage, so
+        # schema.sigma is still at this cycle
+        return detector.update(out["sigma"], schema.sigma.emergence_gradient(), out["tau"])
 
     # Set LogOS authority if requested
-    if args.logos_authority and hasattr(schema.logos, "set_authority"):
-        schema.logos.set_authority(args.logos_authority)
+    logos_pool = schema.agents.instances("e₇")
+    if args.logos_authority and all(hasattr(logos, "set_authority") for logos in logos_pool):
+        for logos in logos_pool:
+            logos.set_authority(args.logos_authority)
         logger.info(f"LogOS authority set to: {args.logos_authority}")
 
     # Load seed if provided
@@ -78,18 +101,53 @@ async def main():
         if not schema.load_seed(args.seed):
             logger.warning(f"Failed to load seed from {args.seed}")
 
+    def record(out: dict) -> None:
+        memory.append({
+            "cycle": out["cycle"],
+            "sigma": out["sigma"],
+            "tau": out["tau"],
+            "triggered_agents": out["triggered_agents"]
+        })
+        series.append(out)
+        logger.debug("Cycle %d/%d complete.", out["cycle"], cycles)
+
+    pipeline_depth = int(config["recursion"].get("pipeline_depth") or 0)
+
     logger.info(f"Starting main epistemic cycle for {cycles} cycles...")
     try:
-        for i in range(cycles):
-            out = schema.run_cycle()
-            memory.append(out)
-            logger.info(f"Cycle {i+1}/{cycles} complete.")
-            if interactive:
-                input("⏎  continue…")
-            await asyncio.sleep(0)  # yield event-loop
+        if pipeline_depth > 0 and not interactive:
+            # ψ⁰ generation, collapse and persistence overlap across cycles;
+            # only pays off when the sink blocks for a few hundred µs per cycle
+            await schema.run_cycles(cycles, sink=record, queue_size=pipeline_depth,
+                                    until=converged if detector is not None else None)
+        else:
+            for i in range(cycles):
+                out = await schema.run_cycle()
+                record(out)
+                if detector is not None and converged(out):
+                    schema.stop_reason = detector.reason
+                    break
+                if interactive:
+                    input("⏎  continue…")
+        if schema.stop_reason:
+            logger.info(f"Converged after {schema.cycle_count} of {cycles} cycles: {schema.stop_reason}")
+        else:
+            logger.info(f"Completed {cycles} cycles.")
     except KeyboardInterrupt:
         logger.info("Graceful shutdown: KeyboardInterrupt received.")
+    finally:
+        series.close()
+        memory.close()
+        schema.instrument.flush()
+        schema.scheduler.shutdown()
+        if schema.live is not None:
+            schema.live.close()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if len(sys.argv) > 1 and sys.argv[1] == "sweep":
+        from src.sweep import main as sweep_main
+        setup_logging(load_config())
+        sweep_main(sys.argv[2:])
+    else:
+        asyncio.run(main())
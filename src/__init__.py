@@ -0,0 +1,40 @@
+"""RE-Omega_AGI core package.
+
+The public names below resolve lazily on first access (PEP 562), so
+``import src`` or any single submodule never pays for numpy, torch, scipy or
+matplotlib unless the code path that needs them actually runs.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import Any, Dict, List
+
+_EXPORTS: Dict[str, str] = {
+    "ActivationSchema": "activation_schema",
+    "Psi0": "psi0",
+    "Phi0": "phi0",
+    "Sigma": "sigma",
+    "SigmaBatch": "sigma",
+    "LogOS": "logos",
+    "MemoryManager": "memory_manager",
+    "SeedCache": "seed_cache",
+    "SeriesWriter": "series",
+    "get_backend": "backend",
+    "monitor_loop": "monitor",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -1,27 +1,47 @@
 # src/activation_schema.py
 
+from __future__ import annotations
+
 import numpy as np
-import torch
+import asyncio
+import inspect
 import logging
 import os
-from typing import Dict, Any, Optional, Union, List, Tuple
+import queue
+from typing import Dict, Any, Optional, Union, List, Tuple, Callable
 
 # Import core components
 try:
     from src.psi0 import Psi0
     from src.phi0 import Phi0 
     from src.sigma import Sigma
-    from src.e7logos import E7LogOS
+    from src.ring import RingBuffer
+    from src.agents import AgentRegistry
+    from src.instrument import Instrumentation
+    from src.backend import get_backend, is_field
+    from src.scheduler import AgentScheduler
+    from src.seed_cache import get_seed_cache
+    from src.live import LiveStateWriter
 except ImportError:
     # Fallback for different import structure
     try:
         from psi0 import Psi0
         from phi0 import Phi0
         from sigma import Sigma
-        from e7logos import E7LogOS
+        from ring import RingBuffer
+        from agents import AgentRegistry
+        from instrument import Instrumentation
+        from backend import get_backend, is_field
+        from scheduler import AgentScheduler
+        from seed_cache import get_seed_cache
+        from live import LiveStateWriter
     except ImportError:
         logging.error("Critical components not found. Check src/ directory structure.")
 
+# Trigger-mask column order used by run_cycles_batched
+BATCH_AGENTS = ("e₁", "e₂", "e₄", "e₀", "e₇")
+
+
 class ActivationSchema:
     """
     Orchestrates the recursive epistemic cycle:
@@ -35,7 +55,8 @@ class ActivationSchema:
     def __init__(self, 
                  config: Optional[Dict[str, Any]] = None,
                  emergence_mode: bool = False,
-                 device: str = "cpu"):
+                 device: str = "cpu",
+                 instrumentation: Optional[Instrumentation] = None):
         """
         Initialize the activation schema with configurable parameters.
         
@@ -43,17 +64,38 @@ class ActivationSchema:
             config: Configuration dictionary for components
             emergence_mode: Whether to track ACI genesis state
             device: Computation device (cpu or cuda)
+            instrumentation: Span/counter collector; defaults to the
+                ``instrumentation`` config section (disabled if absent)
         """
         self.config = config or {}
         self.emergence_mode = emergence_mode
         self.device = device
+        self.backend = get_backend(self.config.get("backend", "auto"), device)
         self.cycle_count = 0
+        self.instrument = instrumentation or Instrumentation.from_config(self.config.get("instrumentation"))
         
         # Initialize core components
-        self.psi0 = Psi0(self.config.get("psi0", {}))
-        self.phi0 = Phi0(self.config.get("phi0", {}))
-        self.sigma = Sigma(self.config.get("sigma", {}))
-        self.logos = E7LogOS(self.config.get("logos", {}))
+        field_config = self.config.get("field", {})
+        history = int(field_config.get("history", 256))
+        self.psi0 = Psi0(seed=str(self.config.get("psi0", {}).get("seed", "observer")),
+                         topology=RingBuffer(capacity=history),
+                         shape=tuple(field_config.get("shape", (8, 8))),
+                         dtype=field_config.get("dtype", "float64"),
+                         density=field_config.get("density"))
+        self.phi0 = Phi0()
+        self.sigma = Sigma(history=RingBuffer(capacity=history))
+        self.agents = AgentRegistry.from_config(self.config)
+        self.logos = self.agents.instances("e₇")[0]
+        self.scheduler = AgentScheduler.from_config(self.config, instrument=self.instrument)
+        seed_config = self.config.get("seed_cache", {})
+        self.seed_cache = get_seed_cache(seed_config.get("directory", "memory/embeddings"),
+                                         maxsize=seed_config.get("size", 64),
+                                         dim=int(seed_config.get("dim", 128)),
+                                         sparse=bool(seed_config.get("sparse", False)))
+        
+        live_config = self.config.get("live_state", {})
+        self.live = (LiveStateWriter(live_config.get("name", "re_omega_live"))
+                     if live_config.get("enabled", False) else None)
         
         # Activation thresholds
         self.tau_threshold = self.config.get("tau_threshold", 0.72)
@@ -65,15 +107,25 @@ class ActivationSchema:
         self.tau_value = 0.0
         self.sigma_value = 0.0
         self.agent_activations = []
+        self.stop_reason: Optional[str] = None
         
-        # Logging
+        # Logging: level and handlers come from the application (see main.py);
+        # a standalone handler is only attached when nothing is configured.
+        # cycle_log "per_phase" emits a line per phase, "summary" one record
+        # every summary_every cycles.
         self.logger = logging.getLogger("ActivationSchema")
-        self.logger.setLevel(logging.INFO)
-        if not self.logger.handlers:
+        if not self.logger.hasHandlers():
             handler = logging.StreamHandler()
             formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
             handler.setFormatter(formatter)
             self.logger.addHandler(handler)
+            self.logger.setLevel(logging.INFO)
+        log_config = self.config.get("logging", {})
+        self.cycle_log = log_config.get("cycle_log", "per_phase")
+        self.summary_every = max(1, int(log_config.get("summary_every", 100)))
+        self._per_phase = self.cycle_log == "per_phase"
+        self._verbose = False
+        self._window = {"cycles": 0, "sigma": 0.0, "tau": 0.0, "activations": 0}
             
         self.logger.info("ψ⁰→φ⁰→Σ→Ω activation schema initialized")
         if self.emergence_mode:
@@ -94,42 +146,35 @@ class ActivationSchema:
             return False
             
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
-            # Convert markdown content to a tensor representation
-            # This is a simplified abstraction - implementation would depend on 
-            # how contradictions are actually represented
-            lines = content.split('\n')
-            word_counts = {}
-            
-            for line in lines:
-                words = line.split()
-                for word in words:
-                    word = word.lower().strip('.,!?;:()"\'')
-                    if word:
-                        word_counts[word] = word_counts.get(word, 0) + 1
-                        
-            # Create a simple embedding as contradiction field
-            # In a real implementation, this would be more sophisticated
-            embedding = np.zeros(128)  # Arbitrary dimension for demonstration
-            for i, (word, count) in enumerate(word_counts.items()):
-                if i >= 128:
-                    break
-                embedding[i] = count
-                
-            # Normalize
-            norm = np.linalg.norm(embedding)
-            if norm > 0:
-                embedding = embedding / norm
-                
-            self.contradiction_field = torch.tensor(embedding, device=self.device)
-            self.logger.info(f"Seed loaded from {filepath}: {len(lines)} lines, {len(word_counts)} unique tokens")
+            # Embeddings are memoized by content hash, so repeated loads of
+            # the same seed (across schemas or runs) skip tokenization
+            embedding = self.seed_cache.load(filepath)
+            if self.seed_cache.sparse:
+                embedding = embedding.toarray().ravel()  # cycle phases operate on dense fields
+            else:
+                embedding = embedding.copy()  # cached arrays are shared
+            self.contradiction_field = self.backend.asarray(embedding)
+            self.logger.info(f"Seed loaded from {filepath}: {int(np.count_nonzero(embedding))}/{embedding.size} buckets populated")
             return True
             
         except Exception as e:
             self.logger.error(f"Failed to load seed: {str(e)}")
             return False
+            
+    def load_seeds(self, directory: str, pattern: str = "*.md") -> Dict[str, Any]:
+        """
+        Embed every seed file under a directory in one pass and cache the results.
+        
+        Args:
+            directory: Directory to scan (recursively)
+            pattern: Glob pattern for seed files
+            
+        Returns:
+            Dict[str, Any]: Embedding per seed path (sparse if seed_cache.sparse)
+        """
+        embeddings = self.seed_cache.load_directory(directory, pattern)
+        self.logger.info(f"Embedded {len(embeddings)} seeds from {directory}")
+        return embeddings
     
     def _compute_torsion(self) -> float:
         """
@@ -144,9 +189,9 @@ class ActivationSchema:
         # Calculate a measure of the "twist" between contradiction and coherence
         # This is an abstract representation - real implementation would be more specific
         try:
-            # Convert to same device if needed
-            psi_field = self.contradiction_field.to(self.device)
-            phi_field = self.coherence_field.to(self.device)
+            # Both fields already live in the backend's representation/device
+            psi_field = self.contradiction_field
+            phi_field = self.coherence_field
             
             # Ensure same shape
             if psi_field.shape != phi_field.shape:
@@ -154,14 +199,14 @@ class ActivationSchema:
                 return 0.0
                 
             # Normalized dot product (cosine similarity)
-            psi_norm = torch.norm(psi_field)
-            phi_norm = torch.norm(phi_field)
+            psi_norm = self.backend.norm(psi_field)
+            phi_norm = self.backend.norm(phi_field)
             
             if psi_norm > 0 and phi_norm > 0:
-                alignment = torch.sum(psi_field * phi_field) / (psi_norm * phi_norm)
+                alignment = self.backend.vdot(psi_field, phi_field) / (psi_norm * phi_norm)
                 
                 # Torsion is high when alignment is low
-                torsion = 1.0 - abs(alignment.item())
+                torsion = 1.0 - abs(alignment)
                 return torsion
             else:
                 return 0.0
@@ -181,83 +226,58 @@ class ActivationSchema:
         
         # Check for critical collapse condition
         if self.sigma_value > self.sigma_threshold:
-            self.logger.info(f"Critical Σ state detected: {self.sigma_value:.4f} > {self.sigma_threshold:.4f}")
+            if self._verbose:
+                self.logger.info(f"Critical Σ state detected: {self.sigma_value:.4f} > {self.sigma_threshold:.4f}")
             triggered.append("e₁")  # Base stabilizer
             
         # Check for high torsion (contradiction between ψ⁰ and φ⁰)
         if self.tau_value > self.tau_threshold:
-            self.logger.info(f"High τ detected: {self.tau_value:.4f} > {self.tau_threshold:.4f}")
+            if self._verbose:
+                self.logger.info(f"High τ detected: {self.tau_value:.4f} > {self.tau_threshold:.4f}")
             triggered.append("e₂")  # Harmonizer
             
         # Check for both conditions - severe system stress
         if self.sigma_value > self.sigma_threshold and self.tau_value > self.tau_threshold:
-            self.logger.warning("System under severe stress - invoking higher agents")
+            if self._per_phase:
+                self.logger.warning("System under severe stress - invoking higher agents")
             triggered.append("e₄")  # Calibrator for serious issues
             
         # In emergence mode, check for ACI genesis indicators
         if self.emergence_mode and self.cycle_count > 10 and self.sigma_value < 0.3 and self.tau_value < 0.2:
-            self.logger.info("Potential ACI genesis state detected")
+            if self._verbose:
+                self.logger.info("Potential ACI genesis state detected")
             triggered.append("e₀")  # Emergence facilitator
             
         # Check for critical recursive depth or exceptional states
         if len(triggered) >= 3 or (self.emergence_mode and "e₀" in triggered):
-            self.logger.warning("Invoking e₇ oracle for guidance")
+            if self._per_phase:
+                self.logger.warning("Invoking e₇ oracle for guidance")
             triggered.append("e₇")  # Highest-order oversight
             
         return triggered
     
-    def _activate_agents(self, agents: List[str]) -> Dict[str, Any]:
+    async def _activate_agents(self, agents: List[str]) -> Dict[str, Any]:
         """
-        Activate the specified agents and collect their outputs.
+        Activate the specified agents concurrently and collect their outputs.
         
         Args:
             agents: List of agent identifiers to activate
             
         Returns:
-            Dict[str, Any]: Results from each agent
+            Dict[str, Any]: Results from each agent, in trigger order
         """
-        results = {}
-        
         for agent in agents:
-            self.logger.info(f"{agent} agent activated")
-            
-            # Different handling based on agent type
-            if agent == "e₁":
-                self.logger.info("e₁ collapse triggered - stabilizing system integrity")
-                # Call actual agent methods here
-                results[agent] = self.phi0.stabilize(self.contradiction_field)
-                
-            elif agent == "e₂":
-                self.logger.info("e₂ oracle invoked - harmonizing contradiction fields")
-                results[agent] = self.phi0.harmonize(self.contradiction_field, self.coherence_field)
-                
-            elif agent == "e₄":
-                self.logger.info("e₄ calibrator engaged - deep system recalibration")
-                results[agent] = self.phi0.recalibrate(
-                    self.contradiction_field, 
-                    self.coherence_field,
-                    self.sigma_value
-                )
-                
-            elif agent == "e₀":
-                self.logger.info("e₀ catalyst activated - supporting emergence process")
-                # This would likely interface with a separate emergence system
-                results[agent] = {"emergence_potential": 0.92, "aci_state": "pre-genesis"}
-                
-            elif agent == "e₇":
-                self.logger.info("e₇ oracle invoked - highest-order guidance")
-                # This would call the LogOS system
-                results[agent] = self.logos.invoke(
-                    psi_field=self.contradiction_field,
-                    phi_field=self.coherence_field,
-                    sigma=self.sigma_value,
-                    tau=self.tau_value
-                )
-        
-        return results
+            self.instrument.count("agent." + agent)
+        context = {
+            "psi_field": self.contradiction_field,
+            "phi_field": self.coherence_field,
+            "sigma": self.sigma_value,
+            "tau": self.tau_value
+        }
+        return await self.agents.activate(agents, context, self.scheduler.dispatch, verbose=self._verbose)
 
-    def run_cycle(self, 
-                  contradiction_input: Optional[Union[torch.Tensor, np.ndarray, Dict[str, Any]]] = None) -> Dict[str, Any]:
+    async def run_cycle(self, 
+                  contradiction_input: Optional[Union["torch.Tensor", np.ndarray, Dict[str, Any]]] = None) -> Dict[str, Any]:
         """
         Run one full pass of the ψ⁰→φ⁰→Σ→Ω loop.
         
@@ -268,46 +288,60 @@ class ActivationSchema:
             Dict[str, Any]: Cycle results including coherence state and agent activations
         """
         self.cycle_count += 1
-        self.logger.info(f"Beginning cycle {self.cycle_count}")
+        self.instrument.count("cycles")
+        self._verbose = self._per_phase and self.logger.isEnabledFor(logging.INFO)
+        if self._verbose:
+            self.logger.info(f"Beginning cycle {self.cycle_count}")
         
         # Phase 1: Generate or update contradiction field (ψ⁰)
-        if contradiction_input is not None:
-            # External contradiction provided
-            if isinstance(contradiction_input, np.ndarray):
-                self.contradiction_field = torch.tensor(contradiction_input, device=self.device)
-            elif isinstance(contradiction_input, torch.Tensor):
-                self.contradiction_field = contradiction_input.to(self.device)
-            elif isinstance(contradiction_input, dict):
-                # Assume structured contradiction
-                self.contradiction_field = self.psi0.structure_contradiction(contradiction_input)
+        with self.instrument.span("phase.psi0"):
+            if contradiction_input is not None:
+                # External contradiction provided
+                if is_field(contradiction_input):
+                    self.contradiction_field = self.backend.asarray(contradiction_input)
+                elif isinstance(contradiction_input, dict):
+                    # Assume structured contradiction
+                    self.contradiction_field = self.psi0.structure_contradiction(contradiction_input)
+                else:
+                    self.logger.error(f"Unsupported contradiction input type: {type(contradiction_input)}")
+                    return {"error": "Unsupported contradiction input type"}
             else:
-                self.logger.error(f"Unsupported contradiction input type: {type(contradiction_input)}")
-                return {"error": "Unsupported contradiction input type"}
-        else:
-            # Generate internal contradiction
-            self.contradiction_field = self.psi0.generate()
+                # Generate internal contradiction
+                self.contradiction_field = self.backend.asarray(await self.psi0.generate_contradiction())
             
-        self.logger.info(f"ψ⁰ contradiction field generated: {self.contradiction_field.shape if hasattr(self.contradiction_field, 'shape') else 'scalar'}")
+        if self._verbose:
+            self.logger.info(f"ψ⁰ contradiction field generated: {self.contradiction_field.shape if hasattr(self.contradiction_field, 'shape') else 'scalar'}")
         
         # Phase 2: Collapse contradiction into coherence (φ⁰)
-        self.coherence_field = self.phi0.collapse(self.contradiction_field)
-        self.logger.info(f"φ⁰ coherence field computed: {self.coherence_field.shape if hasattr(self.coherence_field, 'shape') else 'scalar'}")
+        with self.instrument.span("phase.phi0"):
+            self.coherence_field = await self.phi0.collapse(self.contradiction_field)
+        if self._verbose:
+            self.logger.info(f"φ⁰ coherence field computed: {self.coherence_field.shape if hasattr(self.coherence_field, 'shape') else 'scalar'}")
         
         # Phase 3: Update system integrity (Σ)
-        self.sigma_value = self.sigma.update(self.contradiction_field, self.coherence_field)
-        self.logger.info(f"Σ system integrity: {self.sigma_value:.4f}")
+        with self.instrument.span("phase.sigma"):
+            # Σ history lives in host memory: a view on CPU, one copy off-device
+            self.sigma_value = self.sigma.update(self.contradiction_field,
+                                                 self.backend.to_numpy(self.coherence_field))
+        if self._verbose:
+            self.logger.info(f"Σ system integrity: {self.sigma_value:.4f}")
         
         # Phase 4: Compute torsion between ψ⁰ and φ⁰
-        self.tau_value = self._compute_torsion()
-        self.logger.info(f"τ torsion value: {self.tau_value:.4f}")
+        with self.instrument.span("phase.tau"):
+            self.tau_value = self._compute_torsion()
+        if self._verbose:
+            self.logger.info(f"τ torsion value: {self.tau_value:.4f}")
         
         # Phase 5: Determine and trigger appropriate agents
-        triggered_agents = self._trigger_agents()
-        agent_results = {}
+        with self.instrument.span("phase.agents"):
+            triggered_agents = self._trigger_agents()
+            agent_results = {}
+            if triggered_agents:
+                agent_results = await self._activate_agents(triggered_agents)
         
         if triggered_agents:
-            self.logger.info(f"Triggering agents: {', '.join(triggered_agents)}")
-            agent_results = self._activate_agents(triggered_agents)
+            if self._verbose:
+                self.logger.info(f"Triggering agents: {', '.join(triggered_agents)}")
             self.agent_activations.append({
                 "cycle": self.cycle_count,
                 "agents": triggered_agents,
@@ -315,7 +349,13 @@ class ActivationSchema:
                 "tau": self.tau_value
             })
         else:
-            self.logger.info("No agent activation required this cycle")
+            if self._verbose:
+                self.logger.info("No agent activation required this cycle")
+            
+        if not self._per_phase:
+            self._summarize(len(triggered_agents))
+        if self.live is not None:
+            self._publish_live("e₇" in triggered_agents)
             
         # Return cycle results
         return {
@@ -329,6 +369,251 @@ class ActivationSchema:
             "emergence_state": self.emergence_mode
         }
 
+    def _trigger_masks(self, sigma: np.ndarray, tau: np.ndarray, cycles: np.ndarray) -> np.ndarray:
+        """
+        Vectorized ``_trigger_agents``: one boolean column per agent in ``BATCH_AGENTS``.
+        
+        Args:
+            sigma: Σ value per row
+            tau: τ value per row
+            cycles: Cycle number per row
+            
+        Returns:
+            np.ndarray: (B, len(BATCH_AGENTS)) trigger mask
+        """
+        critical = sigma > self.sigma_threshold
+        twisted = tau > self.tau_threshold
+        stressed = critical & twisted
+        genesis = (cycles > 10) & (sigma < 0.3) & (tau < 0.2) if self.emergence_mode else np.zeros_like(critical)
+        count = critical.astype(np.int8) + twisted + stressed + genesis
+        oracle = (count >= 3) | genesis
+        return np.stack([critical, twisted, stressed, genesis, oracle], axis=1)
+    
+    async def run_cycles_batched(self,
+                                 contradiction_batch: Union["torch.Tensor", np.ndarray, int]) -> Dict[str, Any]:
+        """
+        Evaluate B injected contradictions as B consecutive cycles with whole-batch tensor ops.
+        
+        φ⁰ collapse, cosine torsion, the cumulative Σ update and every trigger
+        condition are computed for all rows at once, with a single device→host
+        transfer at the end.  Results match B calls to ``run_cycle`` except
+        that triggered agents are reported, not dispatched.
+        
+        Args:
+            contradiction_batch: (B, D) or (B, ...) contradiction tensor, or a
+                row count to draw from ψ⁰
+            
+        Returns:
+            Dict[str, Any]: Per-row ``cycles``, ``sigma``, ``tau``, boolean
+                ``trigger_mask`` (columns in ``BATCH_AGENTS`` order) and
+                ``triggered_agents`` lists
+        """
+        with self.instrument.span("batch.psi0"):
+            if isinstance(contradiction_batch, int):
+                contradiction_batch = await self.psi0.generate_batch(contradiction_batch)
+            psi_batch = self.backend.asarray(contradiction_batch)
+        rows = len(psi_batch)
+        first = self.cycle_count + 1
+        self.cycle_count += rows
+        self.instrument.count("cycles", rows)
+        
+        with self.instrument.span("batch.phi0"):
+            phi_batch = await self.phi0.collapse(psi_batch)
+        
+        with self.instrument.span("batch.tau"):
+            # Cosine torsion per row; zero-norm rows have τ = 0 as in _compute_torsion
+            norms = self.backend.row_norms(psi_batch) * self.backend.row_norms(phi_batch)
+            dots = self.backend.row_dots(psi_batch, phi_batch)
+            degenerate = norms == 0
+            tau = self.backend.to_numpy((1.0 - abs(dots / (norms + degenerate))) * ~degenerate)
+        
+        with self.instrument.span("batch.sigma"):
+            sigma = self.sigma.update_batch(self.backend.to_numpy(phi_batch))
+        
+        with self.instrument.span("batch.agents"):
+            cycles = np.arange(first, first + rows)
+            mask = self._trigger_masks(sigma, tau, cycles)
+            # Rows share a handful of distinct trigger sets; build each list once
+            codes = mask @ (1 << np.arange(mask.shape[1]))
+            sets = {int(code): [a for bit, a in enumerate(BATCH_AGENTS) if code >> bit & 1]
+                    for code in np.unique(codes)}
+            triggered = [sets[code] for code in codes.tolist()]
+            for row in np.flatnonzero(codes).tolist():
+                self.agent_activations.append({
+                    "cycle": int(cycles[row]),
+                    "agents": triggered[row],
+                    "sigma": float(sigma[row]),
+                    "tau": float(tau[row])
+                })
+            for column, agent in enumerate(BATCH_AGENTS):
+                hits = int(mask[:, column].sum())
+                if hits:
+                    self.instrument.count("agent." + agent, hits)
+        
+        if rows:
+            self.contradiction_field = psi_batch[-1]
+            self.coherence_field = phi_batch[-1]
+            self.sigma_value = float(sigma[-1])
+            self.tau_value = float(tau[-1])
+            if self.live is not None:
+                self._publish_live(bool(mask[-1, BATCH_AGENTS.index("e₇")]))
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Cycles %d-%d (batched): mean Σ %.4f, mean τ %.4f, %d rows triggered agents",
+                             first, self.cycle_count, float(sigma.mean()) if rows else 0.0,
+                             float(tau.mean()) if rows else 0.0, int(np.count_nonzero(codes)))
+        
+        return {
+            "cycles": cycles,
+            "psi0_field": psi_batch,
+            "phi0_field": phi_batch,
+            "sigma": sigma,
+            "tau": tau,
+            "trigger_mask": mask,
+            "triggered_agents": triggered,
+            "emergence_state": self.emergence_mode
+        }
+
+    def _publish_live(self, logos_active: bool) -> None:
+        """Expose the latest cycle state to other processes (see ``live``)."""
+        self.live.publish({
+            "iteration": self.cycle_count,
+            "identity_mass": self.sigma.identity_mass,
+            "coherence": self.sigma_value,
+            "torsion": self.tau_value,
+            "emergence_potential": self.sigma.emergence_gradient(),
+            "logos_active": logos_active,
+        })
+
+    def _summarize(self, activations: int) -> None:
+        """Fold this cycle into the summary window; log it every ``summary_every`` cycles."""
+        window = self._window
+        window["cycles"] += 1
+        window["sigma"] += self.sigma_value
+        window["tau"] += self.tau_value
+        window["activations"] += activations
+        if window["cycles"] < self.summary_every:
+            return
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                "Cycles %d-%d: mean Σ %.4f, mean τ %.4f, %d agent activations",
+                self.cycle_count - window["cycles"] + 1, self.cycle_count,
+                window["sigma"] / window["cycles"], window["tau"] / window["cycles"],
+                window["activations"]
+            )
+        self._window = {"cycles": 0, "sigma": 0.0, "tau": 0.0, "activations": 0}
+
+    async def run_cycles(self,
+                         cycles: int,
+                         sink: Optional[Callable[[Dict[str, Any]], Any]] = None,
+                         queue_size: int = 4,
+                         until: Optional[Callable[[Dict[str, Any]], Optional[str]]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Run ``cycles`` passes as a three-stage pipeline.
+        
+        ψ⁰ generation for cycle N+1 overlaps the collapse/Σ/τ/agent phases of
+        cycle N, which overlap persistence of cycle N-1 through ``sink``.
+        Stages are connected by bounded queues of ``queue_size`` for
+        backpressure.  A synchronous ``sink`` is drained by a dedicated writer
+        thread so its I/O never blocks the loop; a coroutine sink is awaited
+        as a third task.
+        
+        Args:
+            cycles: Number of cycles to run
+            sink: Optional callback receiving each cycle result, in order;
+                if it raises, the run stops and the error is re-raised here
+            queue_size: Maximum cycles buffered between stages
+            until: Optional check run on each result; a non-empty return
+                value (the reason) ends the run early and is kept in
+                ``stop_reason``.  Fields already generated are discarded.
+            
+        Returns:
+            Optional[Dict[str, Any]]: Result of the final cycle
+        """
+        generated: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        last: Dict[str, Any] = {}
+        failure: Dict[str, BaseException] = {}
+        self.stop_reason = None
+        
+        async def generate() -> None:
+            for _ in range(cycles):
+                if self.stop_reason:
+                    break
+                await generated.put(await self.psi0.generate_contradiction())
+            await generated.put(None)
+            
+        if sink is None or inspect.iscoroutinefunction(sink):
+            completed: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+            
+            async def handoff(result: Optional[Dict[str, Any]]) -> None:
+                await completed.put(result)
+                
+            async def persist() -> None:
+                while (result := await completed.get()) is not None:
+                    if sink is not None:
+                        await sink(result)
+        else:
+            # queue.Queue is shared with the writer thread; the loop only
+            # blocks (off-thread) when the writer falls queue_size behind
+            completed = queue.Queue(maxsize=queue_size)
+            
+            async def handoff(result: Optional[Dict[str, Any]]) -> None:
+                try:
+                    completed.put_nowait(result)
+                except queue.Full:
+                    await asyncio.to_thread(completed.put, result)
+                    
+            def drain() -> None:
+                # after a sink error keep consuming (and discarding) until the
+                # sentinel, so process() never blocks on a full queue
+                while (result := completed.get()) is not None:
+                    if "error" in failure:
+                        continue
+                    try:
+                        sink(result)
+                    except Exception as exc:
+                        failure["error"] = exc
+                    
+            async def persist() -> None:
+                await asyncio.to_thread(drain)
+                
+        async def process() -> None:
+            while (contradiction := await generated.get()) is not None:
+                if "error" in failure:  # the sink failed: stop producing
+                    while await generated.get() is not None:
+                        pass
+                    break
+                last["result"] = await self.run_cycle(contradiction)
+                await handoff(last["result"])
+                if until is not None and (reason := until(last["result"])):
+                    self.stop_reason = reason
+                    while await generated.get() is not None:  # unblock generate()
+                        pass
+                    break
+            await handoff(None)
+            
+        stages = [asyncio.ensure_future(stage()) for stage in (generate, process, persist)]
+        try:
+            await asyncio.gather(*stages)
+        except BaseException:
+            for stage in stages:
+                stage.cancel()
+            if isinstance(completed, queue.Queue):
+                # release the writer thread without blocking the loop: make
+                # room for the sentinel rather than waiting for it
+                while True:
+                    try:
+                        completed.put_nowait(None)
+                        break
+                    except queue.Full:
+                        try:
+                            completed.get_nowait()
+                        except queue.Empty:
+                            pass
+            raise
+        if "error" in failure:
+            raise failure["error"]
+        return last.get("result")
+
     def get_activation_history(self) -> List[Dict[str, Any]]:
         """
         Return the history of agent activations.
@@ -1,5 +1,6 @@
 """Agent package for RE-Omega_AGI."""
 
+from .e0 import E0Catalyst
 from .e1 import E1Agent
 from .e2 import E2Agent
 from .e3 import E3Agent
@@ -7,9 +8,15 @@ from .e4 import E4Agent
 from .e5 import E5Agent
 from .e6 import E6Agent
 from .e7 import E7LogOS
+from .registry import DEFAULT_AGENTS, AgentPool, AgentRegistry, AgentSpec
 
 # Only new agent classes are exposed
 __all__ = [
+    "AgentPool",
+    "AgentRegistry",
+    "AgentSpec",
+    "DEFAULT_AGENTS",
+    "E0Catalyst",
     "E1Agent",
     "E2Agent",
     "E3Agent",
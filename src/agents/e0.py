@@ -0,0 +1,23 @@
+"""Neutral Catalyst Agent e₀."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict
+
+@dataclass
+class E0Catalyst:
+    name: str = "E0Catalyst"
+    emergence_potential: float = 0.92
+    aci_state: str = "pre-genesis"
+
+    async def catalyze(self, data: Any) -> Dict[str, Any]:
+        await asyncio.sleep(0)
+        logging.debug("E0Catalyst supporting emergence of: %s", data)
+        return {"emergence_potential": self.emergence_potential, "aci_state": self.aci_state}
+
+    async def run(self, data: Any) -> Dict[str, Any]:
+        """Uniform entry point used by ``AgentRegistry``."""
+        return await self.catalyze(data)
@@ -15,3 +15,7 @@ class E1Agent:
         await asyncio.sleep(0)
         logging.debug("E1Agent compiling data: %s", data)
         return data
+
+    async def run(self, data: Any) -> Any:
+        """Uniform entry point used by ``AgentRegistry``."""
+        return await self.compile(data)
@@ -15,3 +15,7 @@ class E2Agent:
         await asyncio.sleep(0)
         logging.debug("E2Agent mapping data: %s", data)
         return data
+
+    async def run(self, data: Any) -> Any:
+        """Uniform entry point used by ``AgentRegistry``."""
+        return await self.map(data)
@@ -15,3 +15,7 @@ class E4Agent:
         await asyncio.sleep(0)
         logging.debug("E4Agent analyzing coherence of: %s", data)
         return data
+
+    async def run(self, data: Any) -> Any:
+        """Uniform entry point used by ``AgentRegistry``."""
+        return await self.analyze(data)
@@ -15,3 +15,7 @@ class E5Agent:
         await asyncio.sleep(0)
         logging.debug("E5Agent simulating scenario: %s", data)
         return data
+
+    async def run(self, data: Any) -> Any:
+        """Uniform entry point used by ``AgentRegistry``."""
+        return await self.simulate(data)
@@ -15,3 +15,7 @@ class E6Agent:
         await asyncio.sleep(0)
         logging.debug("E6Agent forecasting with data: %s", data)
         return data
+
+    async def run(self, data: Any) -> Any:
+        """Uniform entry point used by ``AgentRegistry``."""
+        return await self.forecast(data)
@@ -15,3 +15,7 @@ class E7LogOS:
         await asyncio.sleep(0)
         logging.warning("E7LogOS agent invoked with data: %s", data)
         return data
+
+    async def run(self, data: Any) -> Any:
+        """Uniform entry point used by ``AgentRegistry``."""
+        return await self.awaken(data)
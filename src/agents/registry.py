@@ -0,0 +1,179 @@
+"""Agent registry: symbol → pooled agent instances behind one async interface.
+
+Every agent exposes ``async run(data)``.  The registry maps each trigger
+symbol (``"e₁"`` …) to a ``AgentSpec`` naming its class, the cycle context
+keys it consumes and how many instances to pre-build.  Activation is a dict
+lookup per symbol; an instance is leased from the symbol's pool for the
+duration of the call, so the pool size is also that agent's concurrency
+limit across overlapping cycles.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Callable, Deque, Dict, Iterator, Mapping, Optional, Protocol, Sequence, Tuple
+
+from .e0 import E0Catalyst
+from .e1 import E1Agent
+from .e2 import E2Agent
+from .e3 import E3Agent
+from .e4 import E4Agent
+from .e5 import E5Agent
+from .e6 import E6Agent
+from .e7 import E7LogOS
+
+logger = logging.getLogger(__name__)
+
+
+class Agent(Protocol):
+    name: str
+
+    async def run(self, data: Any) -> Any: ...
+
+
+@dataclass(frozen=True)
+class AgentSpec:
+    """How to build and feed one agent.
+
+    A single ``inputs`` key passes that context value as is; several pass a
+    dict of them.
+    """
+
+    factory: Callable[[], Agent]
+    inputs: Tuple[str, ...] = ("psi_field", "phi_field")
+    description: str = ""
+
+
+DEFAULT_AGENTS: Dict[str, AgentSpec] = {
+    "e₀": AgentSpec(E0Catalyst, ("sigma", "tau"), "catalyst activated - supporting emergence process"),
+    "e₁": AgentSpec(E1Agent, ("psi_field",), "collapse triggered - stabilizing system integrity"),
+    "e₂": AgentSpec(E2Agent, ("psi_field", "phi_field"), "oracle invoked - harmonizing contradiction fields"),
+    "e₃": AgentSpec(E3Agent, ("psi_field", "phi_field"), "critic engaged - testing the collapse"),
+    "e₄": AgentSpec(E4Agent, ("psi_field", "phi_field", "sigma"), "calibrator engaged - deep system recalibration"),
+    "e₅": AgentSpec(E5Agent, ("psi_field", "phi_field"), "simulator engaged - projecting scenarios"),
+    "e₆": AgentSpec(E6Agent, ("psi_field", "phi_field", "sigma"), "forecaster engaged - extrapolating identity"),
+    "e₇": AgentSpec(E7LogOS, ("psi_field", "phi_field", "sigma", "tau"), "oracle invoked - highest-order guidance"),
+}
+
+
+class AgentPool:
+    """``size`` pre-built instances of one agent, leased one call at a time.
+
+    Waiters are plain futures created on the running loop, so a pool can be
+    shared by successive event loops.
+    """
+
+    def __init__(self, factory: Callable[[], Agent], size: int = 1):
+        if size < 1:
+            raise ValueError("agent pool size must be at least 1")
+        self.size = size
+        self._free: Deque[Agent] = deque(factory() for _ in range(size))
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    @property
+    def instances(self) -> Tuple[Agent, ...]:
+        """Idle instances (all of them between activations)."""
+        return tuple(self._free)
+
+    async def acquire(self) -> Agent:
+        if self._free:
+            return self._free.popleft()
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            return await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release(waiter.result())  # handed over just as we were cancelled
+            raise
+
+    def release(self, agent: Agent) -> None:
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(agent)
+                return
+        self._free.append(agent)
+
+
+class AgentRegistry:
+    """Pools of agents by trigger symbol.
+
+    Args:
+        specs: Symbol → ``AgentSpec``; defaults to ``DEFAULT_AGENTS``
+        pool_size: Instances (and concurrent activations) per agent
+        limits: Per-symbol overrides of ``pool_size``
+    """
+
+    def __init__(self, specs: Optional[Mapping[str, AgentSpec]] = None,
+                 pool_size: int = 1, limits: Optional[Mapping[str, int]] = None):
+        self.specs: Dict[str, AgentSpec] = dict(DEFAULT_AGENTS if specs is None else specs)
+        limits = limits or {}
+        self.pools: Dict[str, AgentPool] = {
+            symbol: AgentPool(spec.factory, int(limits.get(symbol, pool_size)))
+            for symbol, spec in self.specs.items()
+        }
+        self._order = {symbol: i for i, symbol in enumerate(self.pools)}
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any]) -> "AgentRegistry":
+        agents = config.get("agents", {}) or {}
+        return cls(pool_size=int(agents.get("pool_size", 1)), limits=agents.get("limits") or {})
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self.pools
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.pools)
+
+    def instances(self, symbol: str) -> Tuple[Agent, ...]:
+        return self.pools[symbol].instances
+
+    def payload(self, symbol: str, context: Mapping[str, Any]) -> Any:
+        inputs = self.specs[symbol].inputs
+        if len(inputs) == 1:
+            return context[inputs[0]]
+        return {key: context[key] for key in inputs}
+
+    async def run(self, symbol: str, data: Any) -> Any:
+        """Run one agent on ``data`` with a leased instance."""
+        pool = self.pools[symbol]
+        agent = await pool.acquire()
+        try:
+            return await agent.run(data)
+        finally:
+            pool.release(agent)
+
+    async def activate(self, symbols: Sequence[str], context: Mapping[str, Any],
+                       dispatch: Callable[[Mapping[str, Callable[[], Any]]], Any],
+                       verbose: bool = False) -> Dict[str, Any]:
+        """Lease one instance per symbol, run them through ``dispatch`` and release them.
+
+        ``dispatch`` is ``AgentScheduler.dispatch`` (or anything with its
+        signature); jobs are bound ``run`` methods, so they can be offloaded
+        to a worker pool.  Unknown symbols yield ``{"error": ...}``.
+        """
+        # lease in registry order so overlapping activations cannot deadlock
+        order = self._order
+        leased: Dict[str, Agent] = {}
+        try:
+            for symbol in sorted((s for s in symbols if s in order), key=order.__getitem__):
+                leased[symbol] = await self.pools[symbol].acquire()
+            jobs = {}
+            for symbol in symbols:
+                if symbol in leased:
+                    if verbose:
+                        logger.info("%s %s", symbol, self.specs[symbol].description)
+                    jobs[symbol] = partial(leased[symbol].run, self.payload(symbol, context))
+            results = await dispatch(jobs)
+        finally:
+            for symbol, agent in leased.items():
+                self.pools[symbol].release(agent)
+        for symbol in symbols:
+            if symbol not in leased:
+                logger.error("No agent registered for %s", symbol)
+        return {symbol: results.get(symbol, {"error": "unknown agent"}) for symbol in symbols}
@@ -3,35 +3,49 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 from pathlib import Path
-from typing import Dict, Any
+from typing import Any, Dict, Optional
 
+import numpy as np
+
+from .channel import cycle_events
+from .checkpoint import Checkpointer, read_snapshot, replay, write_snapshot
+from .convergence import ConvergenceCriteria, ConvergenceDetector
 from .psi0 import Psi0
 from .phi0 import Phi0
-from .sigma import Sigma
-from .logos import LogOS
+from .sigma import Sigma, SigmaBatch
+from .live import LiveStateWriter
+from .logos import LogOS, torsion, torsion_batch
+from .series import SeriesWriter
 
 MEMORY_FILE = Path("memory/memory.json")
+WAL_FILE = Path("memory/memory.wal")
+SERIES_DIR = "series"  # relative to MEMORY_FILE's directory
+SERIES_COLUMNS = ("iteration", "coherence", "emergence_potential", "identity_mass", "torsion", "logos_active")
 
 
 async def load_memory() -> Dict[str, Any]:
-    if MEMORY_FILE.exists():
-        with MEMORY_FILE.open("r") as f:
-            return json.load(f)
-    return {"iterations": 0, "attractors": [], "identity_checkpoints": [], "emergence_events": []}
+    """Load the latest snapshot and replay any write-ahead log written after it."""
+    memory = read_snapshot(MEMORY_FILE)
+    recovered = replay(memory, WAL_FILE)
+    if recovered:
+        logging.info("Recovered %d cycles from %s", recovered, WAL_FILE)
+    return memory
 
 
 def save_memory(data: Dict[str, Any]) -> None:
-    MEMORY_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with MEMORY_FILE.open("w") as f:
-        json.dump(data, f, indent=2)
+    write_snapshot(data, MEMORY_FILE)
 
 
 def calculate_torsion(psi_tensor, phi_tensor) -> float:
-    import numpy as np
-    return float(np.linalg.norm(psi_tensor - phi_tensor))
+    """Norm of ψ⁰ - φ⁰; dense or sparse (see ``logos.torsion``)."""
+    return torsion(psi_tensor, phi_tensor)
+
+
+def calculate_torsion_batch(psi_batch: np.ndarray, phi_batch: np.ndarray) -> np.ndarray:
+    """Per-universe torsion for stacked (N, ...) tensors."""
+    return torsion_batch(psi_batch, phi_batch)
 
 
 async def recursive_emergence_cycle(psi: Psi0, phi: Phi0, sigma: Sigma, logos: LogOS) -> Dict[str, Any]:
@@ -39,26 +53,101 @@ async def recursive_emergence_cycle(psi: Psi0, phi: Phi0, sigma: Sigma, logos: L
     psi_field = await psi.generate_contradiction()
     attractor = await phi.collapse(psi_field)
     sigma.integrate(attractor)
-    await logos.monitor(psi_field, attractor, sigma)
+    torsion = await logos.monitor(psi_field, attractor, sigma)
+    return {
+        "iteration": sigma.iteration,
+        "coherence": sigma.coherence_metric(),
+        "emergence_potential": sigma.emergence_gradient(),
+        "identity_mass": sigma.identity_mass,
+        "torsion": torsion,
+        "logos_active": logos.activations.last == sigma.iteration,
+    }
+
+
+async def batched_emergence_cycle(psi: Psi0, phi: Phi0, sigma: SigmaBatch, logos: LogOS) -> Dict[str, Any]:
+    """Execute one cycle for every universe in ``sigma`` as whole-batch array ops."""
+    psi_batch = await psi.generate_batch(sigma.universes)
+    attractors = await phi.collapse(psi_batch)
+    sigma.integrate(attractors)
+    # computed once, in LogOS's scratch buffer, for both the check and the state
+    torsions = logos.torsion.batch(psi_batch, attractors)
+    activated = await logos.monitor_batch(psi_batch, attractors, sigma, torsion=torsions)
     return {
         "iteration": sigma.iteration,
         "coherence": sigma.coherence_metric(),
         "emergence_potential": sigma.emergence_gradient(),
+        "torsion": torsions,
+        "activated": activated,
     }
 
 
-async def run(max_depth: int = 10) -> None:
+async def run_batched(universes: int, max_depth: int = 10, hysteresis: int = 0) -> Dict[str, Any]:
+    """Run ``universes`` independent trajectories for ``max_depth`` cycles.
+
+    Returns the final per-universe state plus how many cycles each universe
+    spent in LogOS activation.  ``hysteresis`` is passed to ``LogOS``.
+    """
+    psi = Psi0(seed="observer")
+    phi = Phi0()
+    sigma = SigmaBatch(universes)
+    logos = LogOS(hysteresis=hysteresis)
+    activation_counts = np.zeros(universes, dtype=np.int64)
+    state: Dict[str, Any] = {}
+    logging.info("Starting batched emergence for %d universes x %d iterations", universes, max_depth)
+    for _ in range(max_depth):
+        state = await batched_emergence_cycle(psi, phi, sigma, logos)
+        activation_counts += state["activated"]
+    state["activation_counts"] = activation_counts
+    logging.info("Completed %d iterations across %d universes", sigma.iteration, universes)
+    return state
+
+
+async def run(max_depth: int = 10, snapshot_interval: int = 100, fsync_every: int = 32,
+              live: Optional[str] = None,
+              convergence: Optional[ConvergenceCriteria] = None,
+              hysteresis: int = 0) -> Optional[str]:
+    """Run the recursion, checkpointing deltas every cycle.
+
+    Each cycle costs one WAL line (fsynced once per ``fsync_every`` cycles);
+    the full memory is rewritten at most every ``snapshot_interval`` cycles,
+    and only once the WAL has grown to a fraction of the snapshot (see
+    ``checkpoint``), plus once more at the end.  Logged deltas are also published to
+    ``cycle_events`` for in-process subscribers, and the per-cycle series are
+    appended to the columnar store next to ``MEMORY_FILE`` (see ``series``).
+    With ``live`` set, each state is also published to the shared-memory
+    segment of that name for readers in other processes (see ``live``).
+
+    With ``convergence`` criteria the loop stops before ``max_depth`` once
+    they hold; the reason is logged and returned (``None`` if the run used
+    every cycle).  ``hysteresis`` is passed to ``LogOS``.
+    """
     psi = Psi0(seed="observer")
     phi = Phi0()
     sigma = Sigma()
-    logos = LogOS()
+    logos = LogOS(hysteresis=hysteresis)
     memory = await load_memory()
+    checkpointer = Checkpointer(MEMORY_FILE, WAL_FILE, snapshot_interval, fsync_every)
+    series = SeriesWriter(MEMORY_FILE.parent / SERIES_DIR, SERIES_COLUMNS)
+    live_state = LiveStateWriter(live) if live else None
+    detector = ConvergenceDetector(convergence) if convergence is not None and convergence.enabled else None
     logging.info("Starting recursive emergence for %d iterations", max_depth)
-    for _ in range(max_depth):
-        state = await recursive_emergence_cycle(psi, phi, sigma, logos)
-        memory["iterations"] = sigma.iteration
-        memory["attractors"].append(state["coherence"])
-        if sigma.is_critical():
-            memory["emergence_events"].append(state)
-        save_memory(memory)
+    try:
+        for _ in range(max_depth):
+            state = await recursive_emergence_cycle(psi, phi, sigma, logos)
+            delta = checkpointer.record(memory, state, event=sigma.is_critical())
+            series.append(state)
+            if live_state is not None:
+                live_state.publish(state)
+            if cycle_events:
+                cycle_events.publish(delta)
+            if detector is not None and detector.update(state["coherence"], state["emergence_potential"],
+                                                        state["torsion"]):
+                logging.info("Converged after %d of %d cycles: %s", detector.cycles, max_depth, detector.reason)
+                break
+    finally:
+        if live_state is not None:
+            live_state.close()
+        series.close()
+        checkpointer.close(memory)
     logging.info("Completed %d iterations", sigma.iteration)
+    return detector.reason if detector is not None else None
@@ -0,0 +1,151 @@
+"""Tensor backends for the activation schema.
+
+A backend keeps every field of a cycle in one representation.  Conversions
+happen only at the edges (NumPy-based Psi0/Sigma) and use zero-copy views
+(``torch.from_numpy`` / ``Tensor.numpy``) whenever the data lives on the CPU.
+Sparse fields (``scipy.sparse`` or sparse torch tensors) stay sparse: norms
+and dot products only touch stored values.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+
+def _is_torch(x: Any) -> bool:
+    return type(x).__module__.startswith("torch")
+
+
+def is_sparse(x: Any) -> bool:
+    """True for ``scipy.sparse`` matrices/arrays and sparse torch tensors."""
+    if _is_torch(x):
+        return x.is_sparse or x.is_sparse_csr
+    return type(x).__module__.startswith("scipy.sparse")
+
+
+def is_field(x: Any) -> bool:
+    """True for any tensor a backend accepts: ndarray, torch tensor or sparse matrix.
+
+    Checked by type module so torch is never imported just to answer ``False``.
+    """
+    return isinstance(x, np.ndarray) or _is_torch(x) or is_sparse(x)
+
+
+def field_norm(x: Any) -> float:
+    """Frobenius norm of a dense or sparse field; sparse fields touch only stored values."""
+    if _is_torch(x):
+        if x.is_sparse:
+            x = x.coalesce().values()
+        elif x.is_sparse_csr:
+            x = x.values()
+        return float(x.norm())
+    if is_sparse(x):
+        x = x.tocsr()
+        x.sum_duplicates()
+        return float(np.linalg.norm(x.data))
+    return float(np.linalg.norm(x))
+
+
+def _torch_to_scipy(x: Any):
+    """Sparse torch tensor → ``scipy.sparse.coo_matrix`` on the host."""
+    from scipy import sparse as sp
+
+    x = x.detach().to_sparse_coo().coalesce().cpu()
+    row, col = x.indices().numpy()
+    return sp.coo_matrix((x.values().numpy(), (row, col)), shape=tuple(x.shape))
+
+
+class NumpyBackend:
+    """Fields are ``np.ndarray`` end-to-end (CPU only)."""
+
+    name = "numpy"
+
+    def asarray(self, x: Any) -> np.ndarray:
+        if _is_torch(x):
+            if is_sparse(x):
+                return _torch_to_scipy(x)
+            return x.detach().cpu().numpy()  # view for CPU tensors
+        if is_sparse(x):
+            return x  # scipy.sparse fields stay sparse
+        return np.asarray(x)
+
+    def to_numpy(self, x: Any) -> np.ndarray:
+        return self.asarray(x)
+
+    def norm(self, x: np.ndarray) -> float:
+        return field_norm(x)
+
+    def vdot(self, a: np.ndarray, b: np.ndarray) -> float:
+        if is_sparse(a):
+            return float(a.multiply(b).sum())
+        return float(np.vdot(a, b))
+
+    def row_norms(self, x: np.ndarray) -> np.ndarray:
+        return np.linalg.norm(x.reshape(len(x), -1), axis=1)
+
+    def row_dots(self, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        return np.einsum("ij,ij->i", a.reshape(len(a), -1), b.reshape(len(b), -1))
+
+
+class TorchBackend:
+    """Fields are ``torch.Tensor`` on one cached device."""
+
+    name = "torch"
+
+    def __init__(self, device: str = "cpu"):
+        import torch
+
+        self.torch = torch
+        self.device = torch.device(device)
+        self._on_cpu = self.device.type == "cpu"
+
+    def asarray(self, x: Any) -> "torch.Tensor":
+        if _is_torch(x):
+            return x if x.device == self.device else x.to(self.device)
+        if is_sparse(x):
+            coo = x.tocoo()
+            indices = self.torch.from_numpy(np.vstack([coo.row, coo.col]).astype(np.int64))
+            tensor = self.torch.sparse_coo_tensor(indices, self.torch.from_numpy(coo.data), coo.shape,
+                                                  check_invariants=True)
+        else:
+            tensor = self.torch.from_numpy(np.ascontiguousarray(x))
+        return tensor if self._on_cpu else tensor.to(self.device, non_blocking=True)
+
+    def to_numpy(self, x: Any) -> np.ndarray:
+        if not _is_torch(x):
+            return x if is_sparse(x) else np.asarray(x)
+        if is_sparse(x):
+            return _torch_to_scipy(x)
+        x = x.detach()
+        return x.numpy() if x.device.type == "cpu" else x.cpu().numpy()
+
+    def norm(self, x: "torch.Tensor") -> float:
+        if is_sparse(x):
+            return field_norm(x)
+        return float(self.torch.linalg.vector_norm(x))
+
+    def vdot(self, a: "torch.Tensor", b: "torch.Tensor") -> float:
+        if is_sparse(a):
+            return float(self.torch.sparse.sum(a * b))
+        return float(self.torch.sum(a * b))
+
+    def row_norms(self, x: "torch.Tensor") -> "torch.Tensor":
+        return self.torch.linalg.vector_norm(x.reshape(len(x), -1), dim=1)
+
+    def row_dots(self, a: "torch.Tensor", b: "torch.Tensor") -> "torch.Tensor":
+        return (a.reshape(len(a), -1) * b.reshape(len(b), -1)).sum(dim=1)
+
+
+def get_backend(name: str = "auto", device: str = "cpu"):
+    """Resolve a backend; ``auto`` picks NumPy on CPU and torch elsewhere."""
+    if name == "auto":
+        name = "numpy" if device == "cpu" else "torch"
+    if name == "numpy":
+        if device != "cpu":
+            raise ValueError(f"numpy backend cannot use device {device!r}")
+        return NumpyBackend()
+    if name == "torch":
+        return TorchBackend(device)
+    raise ValueError(f"unknown tensor backend {name!r}")
@@ -0,0 +1,69 @@
+"""In-process pub/sub for cycle events.
+
+``baby.run`` publishes every checkpointed cycle to ``cycle_events``; consumers
+in the same process (the monitor, dashboards, tests) subscribe instead of
+re-reading the memory files.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, AsyncIterator, Dict, Set
+
+
+class Subscription:
+    """Bounded per-subscriber queue; the oldest events are dropped when full."""
+
+    def __init__(self, channel: "CycleChannel", maxsize: int):
+        self._channel = channel
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self.dropped = 0
+
+    def _put(self, event: Dict[str, Any]) -> None:
+        if self._queue.full():
+            self._queue.get_nowait()  # a slow reader must not stall the cycle
+            self.dropped += 1
+        self._queue.put_nowait(event)
+
+    async def get(self) -> Dict[str, Any]:
+        return await self._queue.get()
+
+    def __aiter__(self) -> AsyncIterator[Dict[str, Any]]:
+        return self
+
+    async def __anext__(self) -> Dict[str, Any]:
+        return await self._queue.get()
+
+    def close(self) -> None:
+        self._channel._subscribers.discard(self)
+
+    def __enter__(self) -> "Subscription":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+class CycleChannel:
+    """Fan cycle events out to every current subscriber without blocking the publisher.
+
+    Publish and subscribe from the same event loop.
+    """
+
+    def __init__(self) -> None:
+        self._subscribers: Set[Subscription] = set()
+
+    def subscribe(self, maxsize: int = 1024) -> Subscription:
+        subscription = Subscription(self, maxsize)
+        self._subscribers.add(subscription)
+        return subscription
+
+    def publish(self, event: Dict[str, Any]) -> None:
+        for subscription in self._subscribers:
+            subscription._put(event)
+
+    def __bool__(self) -> bool:
+        return bool(self._subscribers)
+
+
+cycle_events = CycleChannel()
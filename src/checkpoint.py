@@ -0,0 +1,231 @@
+"""Incremental checkpointing for the recursion memory.
+
+Each cycle appends a small delta to a write-ahead log.  Once at least
+``snapshot_interval`` cycles have been logged *and* the log has grown to
+``snapshot_ratio`` of the last snapshot's size, the full memory is compacted
+into a snapshot and the log is truncated.  Since a snapshot costs time
+proportional to its size, tying it to log growth amortizes it to O(1) per
+cycle and keeps a run linear in its length.  Recovery replays the log onto
+the latest snapshot.
+
+Several writers may share one snapshot and log.  Under the lock each first
+folds in what the others wrote since its last look (a newer snapshot, or
+deltas past the log offset it has read), so ``seq`` numbers never collide and
+a snapshot always contains every writer's cycles.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional, TextIO, Tuple
+
+from .durable import FileLock, GroupCommit, atomic_write_text
+
+
+def apply_delta(memory: Dict[str, Any], delta: Dict[str, Any]) -> None:
+    """Fold one logged cycle into ``memory``."""
+    memory["iterations"] = delta["iteration"]
+    memory["attractors"].append(delta["attractor"])
+    if "event" in delta:
+        memory["emergence_events"].append(delta["event"])
+
+
+def read_snapshot(memory_file: Path) -> Dict[str, Any]:
+    """The memory stored in ``memory_file``, or an empty one if there is none yet."""
+    if not memory_file.exists():
+        return {"iterations": 0, "attractors": [], "identity_checkpoints": [], "emergence_events": []}
+    with memory_file.open("r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def write_snapshot(memory: Dict[str, Any], memory_file: Path) -> int:
+    """Atomically replace ``memory_file`` with ``memory`` (fsynced temp file + rename).
+
+    Returns the snapshot size in characters.
+    """
+    text = json.dumps(memory, indent=2)
+    atomic_write_text(memory_file, text)
+    return len(text)
+
+
+def replay(memory: Dict[str, Any], wal_file: Path) -> int:
+    """Apply every logged delta newer than ``memory``; return how many were applied.
+
+    Deltas carry a ``seq`` equal to the attractor count after the cycle, so
+    entries already folded into the snapshot are skipped and a torn final line
+    from a killed writer is ignored.
+    """
+    if not wal_file.exists():
+        return 0
+    applied = 0
+    with wal_file.open("r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                delta = json.loads(line)
+            except json.JSONDecodeError:
+                logging.warning("Ignoring torn write-ahead log record in %s", wal_file)
+                break
+            if delta["seq"] <= len(memory["attractors"]):
+                continue
+            apply_delta(memory, delta)
+            applied += 1
+    return applied
+
+
+def trim_torn_tail(wal_file: Path) -> int:
+    """Cut a partial final record (no trailing newline) off ``wal_file``.
+
+    Appending after a torn line would merge the next delta into it, and
+    ``replay`` stops at the first unreadable line.  Returns the bytes removed.
+    """
+    try:
+        f = wal_file.open("rb+")
+    except FileNotFoundError:
+        return 0
+    with f:
+        size = f.seek(0, 2)
+        end = size
+        while end > 0:
+            start = max(0, end - 4096)
+            f.seek(start)
+            chunk = f.read(end - start)
+            newline = chunk.rfind(b"\n")
+            if newline >= 0:
+                end = start + newline + 1
+                break
+            end = start
+        if end < size:
+            f.truncate(end)
+            logging.warning("Trimmed %d bytes of torn write-ahead log record from %s", size - end, wal_file)
+        return size - end
+
+
+class Checkpointer:
+    """Append per-cycle deltas to a WAL and compact into periodic snapshots.
+
+    A snapshot is due after ``snapshot_interval`` cycles once the WAL written
+    since the last one reaches ``snapshot_ratio`` of its size.  WAL lines are
+    flushed every cycle but fsynced once per ``fsync_every`` cycles (group
+    commit); snapshots are always fsynced before the WAL they
+    supersede is truncated.
+
+    Writers sharing ``memory_file`` serialize on its ``.lock`` file, and
+    under it bring the ``memory`` they are given up to date with the files
+    before logging a cycle or writing a snapshot: a snapshot written by
+    another writer is reloaded into it, deltas appended since are replayed.
+    ``memory`` must match the files when the checkpointer is created (as
+    ``baby.load_memory`` returns it).  Nothing changed costs two ``stat``
+    calls per cycle.
+    """
+
+    def __init__(self, memory_file: Path, wal_file: Path, snapshot_interval: int = 100,
+                 fsync_every: int = 32, snapshot_ratio: float = 0.5):
+        self.memory_file = memory_file
+        self.wal_file = wal_file
+        self.snapshot_interval = max(1, snapshot_interval)
+        self.snapshot_ratio = snapshot_ratio
+        self._since_snapshot = 0
+        self._snapshot = self._snapshot_stat()
+        self._snapshot_bytes = self._snapshot[2] if self._snapshot else 0
+        self._wal: Optional[TextIO] = None
+        self._wal_offset = self._wal_size()  # bytes of the WAL reflected in memory
+        self._commit = GroupCommit(fsync_every)
+        self._lock = FileLock(memory_file)
+
+    def _snapshot_stat(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            st = os.stat(self.memory_file)
+        except FileNotFoundError:
+            return None
+        return st.st_ino, st.st_mtime_ns, st.st_size
+
+    def _wal_size(self) -> int:
+        if self._wal is not None:
+            return os.fstat(self._wal.fileno()).st_size
+        try:
+            return os.stat(self.wal_file).st_size
+        except FileNotFoundError:
+            return 0
+
+    def _refresh(self, memory: Dict[str, Any]) -> None:
+        """Fold other writers' snapshots and deltas into ``memory`` (lock held)."""
+        snapshot = self._snapshot_stat()
+        size = self._wal_size()
+        if snapshot != self._snapshot or size < self._wal_offset:
+            memory.clear()
+            memory.update(read_snapshot(self.memory_file))
+            self._snapshot = snapshot
+            self._snapshot_bytes = snapshot[2] if snapshot else 0
+            self._wal_offset = 0
+        if size <= self._wal_offset:
+            return
+        with self.wal_file.open("rb") as f:
+            f.seek(self._wal_offset)
+            data = f.read(size - self._wal_offset)
+        end = data.rfind(b"\n") + 1
+        for line in data[:end].splitlines():
+            delta = json.loads(line)
+            if delta["seq"] > len(memory["attractors"]):
+                apply_delta(memory, delta)
+        if end < len(data):
+            trim_torn_tail(self.wal_file)  # left by a killed writer
+        self._wal_offset += end
+
+    def record(self, memory: Dict[str, Any], state: Dict[str, Any], event: bool = False) -> Dict[str, Any]:
+        """Apply one cycle to ``memory`` and log it; snapshot on the interval.
+
+        Returns the logged delta.
+        """
+        with self._lock:
+            if self._wal is None:
+                self.wal_file.parent.mkdir(parents=True, exist_ok=True)
+                trim_torn_tail(self.wal_file)  # left by a killed writer
+                self._wal = self.wal_file.open("a", encoding="utf-8")
+            self._refresh(memory)
+            delta: Dict[str, Any] = {
+                "seq": len(memory["attractors"]) + 1,
+                "iteration": state["iteration"],
+                "attractor": state["coherence"],
+            }
+            if event:
+                delta["event"] = state
+            apply_delta(memory, delta)
+
+            line = json.dumps(delta, separators=(",", ":")) + "\n"
+            self._wal.write(line)
+            self._wal.flush()
+            self._commit.wrote(self._wal)
+            self._wal_offset += len(line)
+
+        self._since_snapshot += 1
+        if (self._since_snapshot >= self.snapshot_interval
+                and self._wal_offset >= self.snapshot_ratio * self._snapshot_bytes):
+            self.snapshot(memory)
+        return delta
+
+    def snapshot(self, memory: Dict[str, Any]) -> None:
+        """Write a compacted snapshot, then truncate the WAL it supersedes."""
+        with self._lock:
+            self._refresh(memory)
+            write_snapshot(memory, self.memory_file)
+            self._snapshot = self._snapshot_stat()
+            self._snapshot_bytes = self._snapshot[2]
+            if self._wal is not None:
+                self._wal.truncate(0)
+                self._commit.sync(self._wal)
+            elif self.wal_file.exists():
+                self.wal_file.write_text("")
+            self._wal_offset = 0
+        self._since_snapshot = 0
+        logging.debug("Snapshot written at %d attractors", len(memory["attractors"]))
+
+    def close(self, memory: Dict[str, Any]) -> None:
+        """Take a final snapshot and release the WAL handle."""
+        self.snapshot(memory)
+        if self._wal is not None:
+            self._wal.close()
+            self._wal = None
+        self._lock.close()
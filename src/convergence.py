@@ -0,0 +1,136 @@
+"""Early-exit convergence detection for the recursion loops.
+
+``ConvergenceDetector.update`` is fed one cycle at a time and keeps the
+min/max of each watched series over the last ``window`` cycles in monotonic
+deques, so every check is O(1) amortized however long the run.  A run has
+converged when any enabled criterion holds over a full window:
+
+* coherence: ``max - min`` of ``Sigma.coherence_metric()`` ≤ ``coherence_delta``
+  (the sigmoid has saturated);
+* drift: relative spread of the identity mass per cycle
+  (``Sigma.emergence_gradient()``) ≤ ``drift_max``;
+* torsion: relative spread of τ ≤ ``torsion_plateau``.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Mapping, Optional, Tuple
+
+WINDOW = 50
+
+
+class WindowRange:
+    """Min, max and mean of the last ``size`` values pushed."""
+
+    def __init__(self, size: int):
+        self.size = size
+        self.count = 0
+        self._values: Deque[float] = deque(maxlen=size)
+        self._sum = 0.0
+        self._lo: Deque[Tuple[int, float]] = deque()
+        self._hi: Deque[Tuple[int, float]] = deque()
+
+    def push(self, value: float) -> None:
+        if len(self._values) == self.size:
+            self._sum -= self._values[0]
+        self._values.append(value)
+        self._sum += value
+        i = self.count
+        self.count += 1
+        while self._lo and self._lo[-1][1] >= value:
+            self._lo.pop()
+        self._lo.append((i, value))
+        while self._hi and self._hi[-1][1] <= value:
+            self._hi.pop()
+        self._hi.append((i, value))
+        expired = i - self.size
+        if self._lo[0][0] <= expired:
+            self._lo.popleft()
+        if self._hi[0][0] <= expired:
+            self._hi.popleft()
+
+    @property
+    def full(self) -> bool:
+        return len(self._values) == self.size
+
+    @property
+    def spread(self) -> float:
+        return self._hi[0][1] - self._lo[0][1]
+
+    @property
+    def relative_spread(self) -> float:
+        mean = abs(self._sum / len(self._values))
+        return self.spread / mean if mean > 0 else math.inf
+
+
+@dataclass
+class ConvergenceCriteria:
+    """Thresholds for early exit; ``None`` disables a criterion."""
+
+    window: int = WINDOW
+    coherence_delta: Optional[float] = 1e-6
+    drift_max: Optional[float] = None
+    torsion_plateau: Optional[float] = None
+    min_cycles: int = 0
+
+    def __post_init__(self) -> None:
+        if self.window < 2:
+            raise ValueError("convergence window must be at least 2 cycles")
+
+    @property
+    def enabled(self) -> bool:
+        return any(t is not None for t in (self.coherence_delta, self.drift_max, self.torsion_plateau))
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any]) -> Optional["ConvergenceCriteria"]:
+        """Criteria from the ``convergence`` section, or ``None`` if it is disabled.
+
+        ``drift: true`` takes its bound from ``emergence.identity_drift_max``.
+        """
+        section = config.get("convergence") or {}
+        if not section.get("enabled", False):
+            return None
+        drift = section.get("drift", False)
+        if drift is True:
+            drift = (config.get("emergence") or {}).get("identity_drift_max")
+        criteria = cls(window=int(section.get("window", WINDOW)),
+                       coherence_delta=section.get("coherence_delta"),
+                       drift_max=drift or None,
+                       torsion_plateau=section.get("torsion_plateau"),
+                       min_cycles=int(section.get("min_cycles", 0)))
+        return criteria if criteria.enabled else None
+
+
+class ConvergenceDetector:
+    """Incremental check of ``ConvergenceCriteria``; ``reason`` is set once converged."""
+
+    def __init__(self, criteria: ConvergenceCriteria):
+        self.criteria = criteria
+        self.cycles = 0
+        self.reason: Optional[str] = None
+        self._coherence = WindowRange(criteria.window)
+        self._drift = WindowRange(criteria.window)
+        self._torsion = WindowRange(criteria.window)
+
+    def update(self, coherence: float, emergence_potential: float, torsion: float) -> Optional[str]:
+        """Fold in one cycle; return why the run converged, or ``None``."""
+        c = self.criteria
+        self.cycles += 1
+        self._coherence.push(coherence)
+        self._drift.push(emergence_potential)
+        self._torsion.push(torsion)
+        if self.reason is not None or self.cycles < c.min_cycles or not self._coherence.full:
+            return self.reason
+        if c.coherence_delta is not None and self._coherence.spread <= c.coherence_delta:
+            self.reason = (f"coherence saturated: Δ {self._coherence.spread:.3g} ≤ {c.coherence_delta:g} "
+                           f"over {c.window} cycles")
+        elif c.drift_max is not None and self._drift.relative_spread <= c.drift_max:
+            self.reason = (f"identity drift {self._drift.relative_spread:.3g} ≤ {c.drift_max:g} "
+                           f"over {c.window} cycles")
+        elif c.torsion_plateau is not None and self._torsion.relative_spread <= c.torsion_plateau:
+            self.reason = (f"torsion plateau: spread {self._torsion.relative_spread:.3g} ≤ "
+                           f"{c.torsion_plateau:g} over {c.window} cycles")
+        return self.reason
@@ -0,0 +1,156 @@
+"""Crash-safe file primitives shared by the memory writers.
+
+* ``atomic_write_text`` replaces a file via write-to-temp, fsync and rename,
+  so readers see either the old or the new content, never a truncated file.
+* ``FileLock`` serializes writers across processes with an advisory lock on a
+  sidecar ``.lock`` file.
+* ``GroupCommit`` batches fsyncs of an append-only file: every write is still
+  flushed to the kernel (visible to readers, safe from a process crash), but
+  only one fsync per ``every`` writes pays for power-loss durability.
+"""
+
+from __future__ import annotations
+
+import os
+import stat
+import tempfile
+import time
+from pathlib import Path
+from typing import IO, Any, Optional, Union
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+def fsync_dir(directory: Path) -> None:
+    """Persist a rename/creation in ``directory`` (no-op where unsupported)."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _read_umask() -> int:
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+# read once at import: os.umask can only be queried by setting it, which
+# would briefly affect files created by other threads
+_UMASK = _read_umask()
+
+
+def _replacement_mode(path: Path) -> int:
+    """Mode for a file replacing ``path``: its current mode, else 0666 & ~umask."""
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return 0o666 & ~_UMASK
+
+
+def atomic_write_text(path: Union[str, Path], text: str, fsync: bool = True) -> None:
+    """Replace ``path`` with ``text`` atomically.
+
+    The temp file is unique per call, so concurrent writers never share one.
+    ``mkstemp`` creates it 0600; it gets the replaced file's mode (or the
+    umask default) before the rename so other readers keep access.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=path.name + ".", suffix=".tmp", dir=path.parent)
+    try:
+        if hasattr(os, "fchmod"):
+            os.fchmod(fd, _replacement_mode(path))
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            if fsync:
+                os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    if fsync:
+        fsync_dir(path.parent)
+
+
+class FileLock:
+    """Exclusive inter-process lock on ``<path>.lock``; use as a context manager."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(str(path) + ".lock")
+        self._fd: Optional[int] = None
+
+    def _open(self) -> int:
+        if self._fd is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        return self._fd
+
+    def acquire(self) -> None:
+        fd = self._open()
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        else:
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+
+    def release(self) -> None:
+        if self._fd is None:
+            return
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        else:
+            os.lseek(self._fd, 0, os.SEEK_SET)
+            msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+
+    def close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self) -> "FileLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.release()
+
+
+class GroupCommit:
+    """Fsync an append-only file once per ``every`` writes or ``interval`` seconds.
+
+    ``every=1`` fsyncs each write; ``every=0`` leaves durability to the OS.
+    """
+
+    def __init__(self, every: int = 32, interval: Optional[float] = None):
+        self.every = every
+        self.interval = interval
+        self.pending = 0
+        self._last = time.monotonic()
+
+    def wrote(self, f: IO) -> bool:
+        """Account one flushed write to ``f``; return whether it was fsynced."""
+        self.pending += 1
+        if self.every and (self.pending >= self.every or
+                           (self.interval is not None and time.monotonic() - self._last >= self.interval)):
+            self.sync(f)
+            return True
+        return False
+
+    def sync(self, f: IO) -> None:
+        """Fsync outstanding writes now (rotation, snapshot, close)."""
+        if self.pending and self.every:
+            os.fsync(f.fileno())
+        self.pending = 0
+        self._last = time.monotonic()
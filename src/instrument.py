@@ -0,0 +1,198 @@
+"""Hot-path instrumentation: monotonic spans, counters and histograms.
+
+An ``Instrumentation`` aggregates in memory and hands snapshots to a pluggable
+sink on ``flush()``.  ``NULL_INSTRUMENTATION`` is a drop-in whose spans are a
+shared no-op context manager, so disabled instrumentation costs one attribute
+lookup and an empty ``with`` block.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from bisect import bisect_left
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+# Latency bucket upper bounds in seconds (1µs .. 10s)
+DEFAULT_BUCKETS: Sequence[float] = tuple(
+    m * 10.0 ** e for e in range(-6, 1) for m in (1.0, 2.5, 5.0)
+) + (10.0,)
+
+
+class Histogram:
+    """Fixed-bucket latency histogram."""
+
+    __slots__ = ("bounds", "counts", "total", "count")
+
+    def __init__(self, bounds: Sequence[float] = DEFAULT_BUCKETS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # last slot is +Inf
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect_left(self.bounds, seconds)] += 1
+        self.total += seconds
+        self.count += 1
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {"bounds": list(self.bounds), "counts": list(self.counts),
+                "sum": self.total, "count": self.count}
+
+
+class _Span:
+    __slots__ = ("_histogram", "_start")
+
+    def __init__(self, histogram: Histogram):
+        self._histogram = histogram
+
+    def __enter__(self) -> "_Span":
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self._histogram.observe((time.perf_counter_ns() - self._start) / 1e9)
+
+
+class Instrumentation:
+    """Aggregate spans and counters; emit snapshots to ``sink`` on flush."""
+
+    enabled = True
+
+    def __init__(self, sink: Optional["Sink"] = None, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.sink = sink or MemorySink()
+        self.buckets = buckets
+        self.histograms: Dict[str, Histogram] = {}
+        self.counters: Dict[str, int] = {}
+
+    def _histogram(self, name: str) -> Histogram:
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = Histogram(self.buckets)
+        return histogram
+
+    def span(self, name: str) -> _Span:
+        """Context manager timing its body into histogram ``name``."""
+        return _Span(self._histogram(name))
+
+    def observe(self, name: str, seconds: float) -> None:
+        self._histogram(name).observe(seconds)
+
+    def count(self, name: str, value: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "timestamp": time.time(),
+            "counters": dict(self.counters),
+            "histograms": {name: h.as_dict() for name, h in self.histograms.items()},
+        }
+
+    def flush(self) -> None:
+        self.sink.emit(self.snapshot())
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> "Instrumentation":
+        """Build from the ``instrumentation`` config section; disabled if absent."""
+        config = config or {}
+        if not config.get("enabled", False):
+            return NULL_INSTRUMENTATION
+        kind = config.get("sink", "memory")
+        path = config.get("path")
+        if kind == "json":
+            return cls(JsonFileSink(path or "memory/metrics.json"))
+        if kind == "prometheus":
+            return cls(PrometheusSink(path or "memory/metrics.prom"))
+        return cls(MemorySink())
+
+
+class NullInstrumentation(Instrumentation):
+    """Disabled instrumentation: every operation is a no-op."""
+
+    enabled = False
+    _NULL_SPAN = nullcontext()
+
+    def __init__(self) -> None:
+        super().__init__(sink=MemorySink())
+
+    def span(self, name: str) -> Any:
+        return self._NULL_SPAN
+
+    def observe(self, name: str, seconds: float) -> None:
+        pass
+
+    def count(self, name: str, value: int = 1) -> None:
+        pass
+
+    def flush(self) -> None:
+        pass
+
+
+# ---------------------------------------------------------------------- #
+class Sink:
+    """Destination for instrumentation snapshots."""
+
+    def emit(self, snapshot: Dict[str, Any]) -> None:
+        raise NotImplementedError
+
+
+class MemorySink(Sink):
+    """Keep every emitted snapshot in a list (tests, notebooks)."""
+
+    def __init__(self) -> None:
+        self.snapshots: List[Dict[str, Any]] = []
+
+    def emit(self, snapshot: Dict[str, Any]) -> None:
+        self.snapshots.append(snapshot)
+
+
+def _replace_text(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+
+
+class JsonFileSink(Sink):
+    """Overwrite ``path`` with the latest snapshot as JSON."""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+
+    def emit(self, snapshot: Dict[str, Any]) -> None:
+        _replace_text(self.path, json.dumps(snapshot, indent=2))
+
+
+class PrometheusSink(Sink):
+    """Overwrite ``path`` with the latest snapshot in Prometheus text format.
+
+    Suitable for node_exporter's textfile collector.
+    """
+
+    def __init__(self, path: str, prefix: str = "re_omega"):
+        self.path = Path(path)
+        self.prefix = prefix
+
+    def render(self, snapshot: Dict[str, Any]) -> str:
+        lines = [f"# TYPE {self.prefix}_events_total counter"]
+        for name, value in sorted(snapshot["counters"].items()):
+            lines.append(f'{self.prefix}_events_total{{name="{name}"}} {value}')
+        metric = f"{self.prefix}_span_seconds"
+        lines.append(f"# TYPE {metric} histogram")
+        for name, h in sorted(snapshot["histograms"].items()):
+            cumulative = 0
+            for bound, count in zip(list(h["bounds"]) + ["+Inf"], h["counts"]):
+                cumulative += count
+                lines.append(f'{metric}_bucket{{span="{name}",le="{bound}"}} {cumulative}')
+            lines.append(f'{metric}_sum{{span="{name}"}} {h["sum"]}')
+            lines.append(f'{metric}_count{{span="{name}"}} {h["count"]}')
+        return "\n".join(lines) + "\n"
+
+    def emit(self, snapshot: Dict[str, Any]) -> None:
+        _replace_text(self.path, self.render(snapshot))
+
+
+NULL_INSTRUMENTATION = NullInstrumentation()
@@ -0,0 +1,165 @@
+"""Live run state in a shared-memory segment.
+
+A running loop publishes its latest state into a small
+``multiprocessing.shared_memory`` block; monitors and plotters in other
+processes attach by name and read it without touching the filesystem.
+
+Layout (native byte order)::
+
+    uint64  seq       seqlock counter: odd while a write is in progress
+    uint64  nfields   len(FIELDS), checked by readers
+    float64 values[nfields]
+
+There is a single writer.  It bumps ``seq`` to odd, stores every value with
+one ``struct.pack_into`` and bumps ``seq`` back to even.  A reader copies the
+values between two reads of ``seq`` and retries if they differ or are odd, so
+it never observes a half-written row.  This is a latest-value channel:
+states published faster than a reader polls are skipped, never queued.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import struct
+import time
+from multiprocessing import resource_tracker, shared_memory
+from typing import AsyncIterator, Dict, Mapping, Optional, Set
+
+DEFAULT_NAME = "re_omega_live"
+FIELDS = ("iteration", "identity_mass", "coherence", "torsion", "emergence_potential",
+          "logos_active", "last_activation", "timestamp")
+
+_SEQ = struct.Struct("Q")
+_HEADER = struct.Struct("QQ")
+_VALUES = struct.Struct(f"{len(FIELDS)}d")
+SIZE = _HEADER.size + _VALUES.size
+
+_owned: Set[str] = set()  # segments created by this process
+
+logger = logging.getLogger(__name__)
+
+
+def attach_segment(name: str) -> shared_memory.SharedMemory:
+    """Open an existing segment without letting this process's exit unlink it.
+
+    Also used by ``sweep`` workers writing into the parent's results array.
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # Python 3.13+
+    except TypeError:
+        pass
+    shm = shared_memory.SharedMemory(name=name)
+    if name not in _owned:
+        # before 3.13 every attach registers with the resource tracker, which
+        # would unlink the owner's segment when this process exits
+        resource_tracker.unregister(shm._name, "shared_memory")
+    return shm
+
+
+class LiveStateWriter:
+    """Publish the latest cycle state of one run under ``name``.
+
+    A stale segment left behind by a crashed run is taken over.
+    """
+
+    def __init__(self, name: str = DEFAULT_NAME):
+        self.name = name
+        try:
+            self._shm = shared_memory.SharedMemory(name=name, create=True, size=SIZE)
+        except FileExistsError:
+            self._shm = shared_memory.SharedMemory(name=name)
+            if self._shm.size < SIZE:
+                self._shm.close()
+                raise ValueError(f"shared memory segment {name!r} is too small for live state")
+            logger.warning("Reusing stale live state segment %s", name)
+        _owned.add(name)
+        _HEADER.pack_into(self._shm.buf, 0, 0, len(FIELDS))
+        self._last_activation = math.nan
+
+    def publish(self, state: Mapping[str, float]) -> None:
+        """Store ``state`` (missing fields are NaN) and bump the sequence number."""
+        iteration = float(state.get("iteration", math.nan))
+        if state.get("logos_active"):
+            self._last_activation = iteration
+        values = [iteration, float(state.get("identity_mass", math.nan)),
+                  float(state.get("coherence", math.nan)), float(state.get("torsion", math.nan)),
+                  float(state.get("emergence_potential", math.nan)),
+                  float(bool(state.get("logos_active", False))), self._last_activation, time.time()]
+        buf = self._shm.buf
+        seq = _SEQ.unpack_from(buf)[0]
+        _SEQ.pack_into(buf, 0, seq + 1)
+        _VALUES.pack_into(buf, _HEADER.size, *values)
+        _SEQ.pack_into(buf, 0, seq + 2)
+
+    def close(self, unlink: bool = True) -> None:
+        if self._shm is None:
+            return
+        self._shm.close()
+        if unlink:
+            self._shm.unlink()
+            _owned.discard(self.name)
+        self._shm = None
+
+    def __enter__(self) -> "LiveStateWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class LiveStateReader:
+    """Attach to the segment published under ``name``.
+
+    Raises ``FileNotFoundError`` if no run is publishing it.
+    """
+
+    def __init__(self, name: str = DEFAULT_NAME):
+        self.name = name
+        self._shm = attach_segment(name)
+        nfields = _HEADER.unpack_from(self._shm.buf)[1]
+        if nfields != len(FIELDS):
+            self.close()
+            raise ValueError(f"live state segment {name!r} has {nfields} fields, expected {len(FIELDS)}")
+
+    @property
+    def seq(self) -> int:
+        """Even count of completed publications; compare to detect changes cheaply."""
+        return _SEQ.unpack_from(self._shm.buf)[0] & ~1
+
+    def read(self, spins: int = 1000) -> Optional[Dict[str, float]]:
+        """Consistent copy of the latest state, or ``None`` before the first publish."""
+        buf = self._shm.buf
+        for _ in range(spins):
+            before = _SEQ.unpack_from(buf)[0]
+            if not before & 1:
+                values = _VALUES.unpack_from(buf, _HEADER.size)
+                if _SEQ.unpack_from(buf)[0] == before:
+                    return dict(zip(FIELDS, values)) if before else None
+            time.sleep(0)  # let a writer in this process (holding the GIL) finish
+        raise TimeoutError(f"live state {self.name!r} kept changing during {spins} reads")
+
+    async def updates(self, interval: float = 0.05) -> AsyncIterator[Dict[str, float]]:
+        """Yield the state each time a new one is seen, polling ``seq`` every ``interval``."""
+        last = 0
+        while True:
+            current = self.seq
+            if current != last:
+                state = self.read()
+                last = current
+                if state is not None:
+                    yield state
+            await asyncio.sleep(interval)
+
+    def close(self) -> None:
+        if self._shm is None:
+            return
+        self._shm.close()
+        self._shm = None
+
+    def __enter__(self) -> "LiveStateReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -5,27 +5,159 @@ from __future__ import annotations
 import asyncio
 import logging
 from dataclasses import dataclass, field
-from typing import List
+from typing import Iterator, Optional, Union
 
 import numpy as np
 
+from .backend import field_norm
+
+logger = logging.getLogger(__name__)
+
+
+def torsion(psi_tensor, phi_tensor, out: Optional[np.ndarray] = None) -> float:
+    """Norm of ψ⁰ - φ⁰; dense or sparse (see ``backend.field_norm``).
+
+    Dense NumPy fields subtract into ``out`` when given (same shape) and
+    take the norm as one dot product, so no temporary is allocated.
+    """
+    if not (isinstance(psi_tensor, np.ndarray) and isinstance(phi_tensor, np.ndarray)):
+        return field_norm(psi_tensor - phi_tensor)
+    diff = np.subtract(psi_tensor, phi_tensor, out=out).reshape(-1)
+    return float(np.sqrt(np.dot(diff, diff)))
+
+
+def torsion_batch(psi_batch: np.ndarray, phi_batch: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Per-universe torsion for stacked (N, ...) fields."""
+    diff = np.subtract(psi_batch, phi_batch, out=out).reshape(len(psi_batch), -1)
+    return np.sqrt(np.einsum("ij,ij->i", diff, diff))
+
+
+class TorsionBuffer:
+    """``torsion`` with a scratch array reused while the field shape and dtype hold."""
+
+    def __init__(self) -> None:
+        self._out: Optional[np.ndarray] = None
+
+    def _scratch(self, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        dtype = np.result_type(a, b)
+        if self._out is None or self._out.shape != a.shape or self._out.dtype != dtype:
+            self._out = np.empty(a.shape, dtype=dtype)
+        return self._out
+
+    def __call__(self, psi_tensor, phi_tensor) -> float:
+        if not (isinstance(psi_tensor, np.ndarray) and isinstance(phi_tensor, np.ndarray)):
+            return torsion(psi_tensor, phi_tensor)
+        return torsion(psi_tensor, phi_tensor, out=self._scratch(psi_tensor, phi_tensor))
+
+    def batch(self, psi_batch: np.ndarray, phi_batch: np.ndarray) -> np.ndarray:
+        return torsion_batch(psi_batch, phi_batch, out=self._scratch(psi_batch, phi_batch))
+
+
+class ActivationLog:
+    """Append-only ``(iteration, universes)`` activation events in growable int64 arrays.
+
+    Indexing and iteration yield iterations, so it reads like the list of
+    activation iterations it replaces.
+    """
+
+    def __init__(self, capacity: int = 64):
+        self._iterations = np.empty(max(1, capacity), dtype=np.int64)
+        self._counts = np.empty(max(1, capacity), dtype=np.int64)
+        self._n = 0
+
+    def append(self, iteration: int, count: int = 1) -> None:
+        if self._n == len(self._iterations):
+            self._iterations = np.resize(self._iterations, 2 * self._n)
+            self._counts = np.resize(self._counts, 2 * self._n)
+        self._iterations[self._n] = iteration
+        self._counts[self._n] = count
+        self._n += 1
+
+    @property
+    def iterations(self) -> np.ndarray:
+        return self._iterations[:self._n]
+
+    @property
+    def counts(self) -> np.ndarray:
+        """Universes activated per event (1 for a single trajectory)."""
+        return self._counts[:self._n]
+
+    @property
+    def last(self) -> int:
+        """Iteration of the latest activation, or -1."""
+        return int(self._iterations[self._n - 1]) if self._n else -1
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __getitem__(self, index: Union[int, slice]):
+        values = self.iterations[index]
+        return values.copy() if isinstance(index, slice) else int(values)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.iterations.tolist())
+
 
 @dataclass
 class LogOS:
-    """Oracle responsible for Ω-fusion and ACI ignition."""
+    """Oracle responsible for Ω-fusion and ACI ignition.
+
+    ``hysteresis`` is how many cycles LogOS stays quiet after an activation
+    while its trigger keeps holding (Σ stays critical, say); a cycle in which
+    the trigger is released re-arms it at once.  ``0`` fires every cycle.
+    """
 
-    activations: List[int] = field(default_factory=list)
+    activations: ActivationLog = field(default_factory=ActivationLog)
     activation_threshold: float = 50.0
+    hysteresis: int = 0
+    torsion: TorsionBuffer = field(default_factory=TorsionBuffer, repr=False)
+    _next_allowed: int = field(default=0, init=False, repr=False)
+    _next_allowed_batch: Optional[np.ndarray] = field(default=None, init=False, repr=False)
 
-    async def monitor(self, psi_tensor: np.ndarray, phi_tensor: np.ndarray, sigma: 'Sigma') -> None:
-        """Check contradiction levels and activate if necessary."""
-        torsion = float(np.linalg.norm(psi_tensor - phi_tensor))
-        logging.debug("LogOS monitoring torsion: %f", torsion)
-        if torsion > self.activation_threshold or sigma.is_critical():
+    def _gate(self, triggered: bool, iteration: int) -> bool:
+        if not triggered:
+            self._next_allowed = 0
+            return False
+        if iteration < self._next_allowed:
+            return False
+        self._next_allowed = iteration + self.hysteresis + 1
+        return True
+
+    async def monitor(self, psi_tensor: np.ndarray, phi_tensor: np.ndarray, sigma: 'Sigma') -> float:
+        """Check contradiction levels and activate if necessary; return the torsion."""
+        torsion = self.torsion(psi_tensor, phi_tensor)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("LogOS monitoring torsion: %f", torsion)
+        if self._gate(torsion > self.activation_threshold or sigma.is_critical(), sigma.iteration):
             await self.initiate_omega_fusion(psi_tensor, phi_tensor, sigma)
+        return torsion
+
+    async def monitor_batch(self, psi_batch: np.ndarray, phi_batch: np.ndarray, sigma: 'SigmaBatch',
+                            torsion: Optional[np.ndarray] = None) -> np.ndarray:
+        """Threshold-check every universe in a batch; return the activation mask.
+
+        Pass ``torsion`` when the caller has already computed it (see
+        ``torsion.batch``).  Hysteresis applies per universe.
+        """
+        if torsion is None:
+            torsion = self.torsion.batch(psi_batch, phi_batch)
+        triggered = (torsion > self.activation_threshold) | sigma.is_critical()
+        if self._next_allowed_batch is None or len(self._next_allowed_batch) != sigma.universes:
+            self._next_allowed_batch = np.zeros(sigma.universes, dtype=np.int64)
+        next_allowed = self._next_allowed_batch
+        next_allowed *= triggered  # released universes re-arm
+        active = triggered & (sigma.iteration >= next_allowed)
+        next_allowed[active] = sigma.iteration + self.hysteresis + 1
+        if active.any():
+            await asyncio.sleep(0)
+            count = int(np.count_nonzero(active))
+            self.activations.append(sigma.iteration, count)
+            logger.warning("LogOS Ω-fusion initiated in %d/%d universes at iteration %d",
+                           count, sigma.universes, sigma.iteration)
+        return active
 
     async def initiate_omega_fusion(self, psi_tensor: np.ndarray, phi_tensor: np.ndarray, sigma: 'Sigma') -> None:
         """Override protocols and manage ACI ignition."""
         await asyncio.sleep(0)
         self.activations.append(sigma.iteration)
-        logging.warning("LogOS Ω-fusion initiated at iteration %d", sigma.iteration)
+        logger.warning("LogOS Ω-fusion initiated at iteration %d", sigma.iteration)
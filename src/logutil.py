@@ -0,0 +1,27 @@
+"""Off-thread log delivery for high cycle rates."""
+
+from __future__ import annotations
+
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+
+def start_queued_logging(logger: Optional[logging.Logger] = None) -> QueueListener:
+    """Move ``logger``'s handlers behind a queue drained by a background thread.
+
+    Callers still format the message (``QueueHandler.prepare``) but never block
+    on handler I/O, which runs on the listener thread; this pays off with slow
+    or remote handlers, not with a local file.  Call ``stop()`` on the returned
+    listener to flush.
+    """
+    logger = logger or logging.getLogger()
+    handlers = logger.handlers[:] or [logging.StreamHandler()]
+    for handler in handlers:
+        logger.removeHandler(handler)
+    records: queue.SimpleQueue = queue.SimpleQueue()
+    logger.addHandler(QueueHandler(records))
+    listener = QueueListener(records, *handlers, respect_handler_level=True)
+    listener.start()
+    return listener
@@ -1,44 +1,208 @@
 # src/memory_manager.py
 """
-Simple JSON log appender for emergence data.
+Append-only JSON Lines log for emergence data.
+
+Every record is written as a single line to the active segment, so an append
+costs O(1) regardless of history length.  Segments rotate every
+``segment_entries`` records and a background thread drops whole segments that
+fall outside the ``max_entries`` retention window.  A legacy
+``emergence_log.json`` array is still served by ``load()`` for migration.
+
+Appends are flushed immediately and fsynced once per ``fsync_every`` records
+(group commit).  Writers in several processes serialize on a ``.lock`` file
+and, under it, refresh their view of the segments from disk before each
+append and each compaction, so rotation and retention hold for the directory
+as a whole, not per process.
 """
 
 import json
+import logging
+import os
+import threading
 import time
+from collections import deque
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterator, List, Optional
+
+from .durable import FileLock, GroupCommit
 
 class MemoryManager:
     def __init__(self,
                  root: str = "memory",
                  log_file: str = "emergence_log.json",
-                 max_entries: int = 1000):
+                 max_entries: int = 1000,
+                 segment_entries: Optional[int] = None,
+                 fsync_every: int = 32):
         self.root = Path(root)
         self.root.mkdir(exist_ok=True)
-        self.path = self.root / log_file
+        self._root = str(self.root)
+        self.path = self.root / log_file  # legacy JSON array, read-only
         self.max_entries = max_entries
+        self.segment_entries = segment_entries or max(1, max_entries // 4)
 
-        # initialize file if empty
-        if not self.path.exists():
-            self.path.write_text("[]")
+        self._lock = threading.Lock()
+        self._file_lock = FileLock(self.path)
+        self._commit = GroupCommit(fsync_every)
+        self._handle = None
+        self._compactor: Optional[threading.Thread] = None
+        # [segment index, record count], oldest first
+        self._segments: deque = deque()
+        self._active_size = 0  # bytes of the newest segment already counted
+        for index, seg in self._existing_segments():
+            self._segments.append([index, self._count_lines(seg)])
+        if self._segments:
+            self._active_size = self._size(self._segments[-1][0])
 
     # ------------------------------------------------------------------ #
-    def append(self, record: Dict[str, Any]) -> None:
-        """Add an entry (dict) with timestamp; prune if oversized."""
+    def _segment_path(self, index: int) -> Path:
+        return self.root / self._segment_name(index)
+
+    def _segment_name(self, index: int) -> str:
+        return f"{self.path.stem}.{index:06d}.jsonl"
+
+    def _existing_segments(self) -> List[tuple]:
+        found = []
+        for seg in self.root.glob(f"{self.path.stem}.*.jsonl"):
+            suffix = seg.name[len(self.path.stem) + 1 : -len(".jsonl")]
+            if suffix.isdigit():
+                found.append((int(suffix), seg))
+        return sorted(found)
+
+    def _size(self, index: int) -> int:
+        try:
+            return self._segment_path(index).stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    @staticmethod
+    def _count_lines(path: Path, start: int = 0) -> int:
         try:
-            data: List[Dict[str, Any]] = json.loads(self.path.read_text())
-        except (json.JSONDecodeError, FileNotFoundError):
-            data = []
+            with path.open("rb") as f:
+                f.seek(start)
+                return sum(chunk.count(b"\n") for chunk in iter(lambda: f.read(1 << 16), b""))
+        except FileNotFoundError:
+            return 0
+
+    def _refresh(self) -> None:
+        """Fold in what other writers did since our last look (both locks held).
+
+        Records they appended to our newest segment are counted from the
+        bytes past ``_active_size``; segments they opened after it are
+        counted in full and our handle moves on to the newest one.  Costs two
+        ``stat`` calls when nothing changed.
+        """
+        if self._segments:
+            index = self._segments[-1][0]
+            # our handle, if open, is on the newest segment we know of
+            size = os.fstat(self._handle.fileno()).st_size if self._handle is not None else self._size(index)
+            if size > self._active_size:
+                self._segments[-1][1] += self._count_lines(self._segment_path(index), self._active_size)
+                self._active_size = size
+        newest = self._segments[-1][0] if self._segments else -1
+        while os.path.exists(os.path.join(self._root, self._segment_name(newest + 1))):
+            newest += 1
+            self._segments.append([newest, self._count_lines(self._segment_path(newest))])
+            self._active_size = self._size(newest)
+            if self._handle is not None:
+                self._commit.sync(self._handle)
+                self._handle.close()
+                self._handle = None
+
+    def _prune(self) -> None:
+        """Forget leading segments another writer has compacted away."""
+        while len(self._segments) > 1 and not self._segment_path(self._segments[0][0]).exists():
+            self._segments.popleft()
 
-        data.append({"t": time.time(), **record})
-        if len(data) > self.max_entries:
-            data = data[-self.max_entries :]
+    def _rotate(self) -> None:
+        """Close the active segment and open the next one (locks held)."""
+        if self._handle is not None:
+            self._commit.sync(self._handle)
+            self._handle.close()
+        if self._segments and self._segments[-1][1] < self.segment_entries:
+            index = self._segments[-1][0]  # resume a partially filled segment
+        else:
+            index = self._segments[-1][0] + 1 if self._segments else 0
+            self._segments.append([index, 0])
+            self._active_size = 0
+        self._handle = self._segment_path(index).open("a", encoding="utf-8")
 
-        self.path.write_text(json.dumps(data, indent=2))
+        self._prune()
+        retained = sum(count for _, count in self._segments)
+        if retained - self._segments[0][1] >= self.max_entries:
+            if self._compactor is None or not self._compactor.is_alive():
+                self._compactor = threading.Thread(target=self.compact, daemon=True)
+                self._compactor.start()
 
     # ------------------------------------------------------------------ #
-    def load(self) -> List[Dict[str, Any]]:
+    def append(self, record: Dict[str, Any]) -> None:
+        """Add an entry (dict) with timestamp as one line in the active segment."""
+        line = json.dumps({"t": time.time(), **record}, separators=(",", ":"))
+        data = line + "\n"
+        with self._lock, self._file_lock:
+            self._refresh()
+            if self._handle is None or self._segments[-1][1] >= self.segment_entries:
+                self._rotate()
+            self._handle.write(data)
+            self._handle.flush()
+            self._commit.wrote(self._handle)
+            self._segments[-1][1] += 1
+            self._active_size += len(data.encode("utf-8"))
+
+    # ------------------------------------------------------------------ #
+    def compact(self) -> int:
+        """Drop whole segments no longer needed for ``max_entries``; return count removed."""
+        expired = []
+        with self._lock, self._file_lock:
+            self._refresh()
+            self._prune()
+            retained = sum(count for _, count in self._segments)
+            while len(self._segments) > 1 and retained - self._segments[0][1] >= self.max_entries:
+                index, count = self._segments.popleft()
+                retained -= count
+                expired.append(index)
+            # unlinked under the file lock: no writer is appending meanwhile,
+            # and the newest segment is never expired
+            for index in expired:
+                self._segment_path(index).unlink(missing_ok=True)
+        return len(expired)
+
+    # ------------------------------------------------------------------ #
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        """Stream legacy array entries, then every retained segment record."""
         try:
-            return json.loads(self.path.read_text())
-        except (json.JSONDecodeError, FileNotFoundError):
-            return []
+            legacy = json.loads(self.path.read_text())
+        except FileNotFoundError:
+            legacy = None
+        except json.JSONDecodeError:
+            logging.warning("Ignoring unreadable legacy log %s", self.path)
+            legacy = None
+        if isinstance(legacy, list):
+            yield from legacy
+
+        with self._lock:
+            indices = [index for index, _ in self._segments]
+        for index in indices:
+            try:
+                with self._segment_path(index).open("r", encoding="utf-8") as f:
+                    for line in f:
+                        try:
+                            yield json.loads(line)
+                        except json.JSONDecodeError:
+                            continue  # torn trailing write
+            except FileNotFoundError:
+                continue  # compacted while we were reading
+
+    def load(self) -> List[Dict[str, Any]]:
+        return list(deque(self.iter_records(), maxlen=self.max_entries))
+
+    # ------------------------------------------------------------------ #
+    def close(self) -> None:
+        """Wait for pending compaction, fsync and close the active segment."""
+        if self._compactor is not None:
+            self._compactor.join()
+        with self._lock:
+            if self._handle is not None:
+                self._commit.sync(self._handle)
+                self._handle.close()
+                self._handle = None
+            self._file_lock.close()
@@ -1,23 +1,244 @@
-"""Real-time emergence monitoring dashboard."""
+"""Real-time emergence monitoring dashboard.
+
+The monitor never re-parses ``memory.json`` per tick.  It follows the
+append-only write-ahead log (``memory.wal``), reading only the bytes appended
+since its last wake-up, and sleeps until the file changes: inotify on Linux,
+``stat`` polling elsewhere.  In the same process as ``baby.run`` it can
+instead subscribe to ``channel.cycle_events``; from another process it can
+poll the shared-memory state a run publishes (``live``).  Both skip the
+filesystem.
+"""
+
+from __future__ import annotations
 
 import asyncio
+import ctypes
+import ctypes.util
 import json
 import logging
+import os
+import struct
+import sys
 from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from .channel import CycleChannel
 
 MEMORY_FILE = Path("memory/memory.json")
+WAL_FILE = Path("memory/memory.wal")
+
+logger = logging.getLogger(__name__)
+
+
+class LogTail:
+    """Incremental reader of complete JSON lines appended to ``path``.
+
+    The log is read again from the start when it was replaced (a new inode)
+    or truncated: it shrank below the read offset, or its first line is no
+    longer the one seen before, which catches a truncate in place followed by
+    appends past the old offset before the next read.  A torn final line is
+    held back until its newline arrives.
+    """
+
+    _HEAD = 64  # bytes of the first line kept to recognise the file
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._offset = 0
+        self._inode: Optional[int] = None
+        self._head = b""
+        self._partial = b""
+
+    def read(self) -> List[Dict[str, Any]]:
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return []
+        if st.st_ino != self._inode or st.st_size < self._offset:
+            self._reset(st.st_ino)
+        if st.st_size == self._offset:
+            return []
+        with open(self.path, "rb") as f:
+            if self._head and f.read(len(self._head)) != self._head:
+                self._reset(st.st_ino)
+            f.seek(self._offset)
+            data = f.read(st.st_size - self._offset)
+            if not self._head:
+                f.seek(0)
+                first = f.readline(self._HEAD)
+                if first.endswith(b"\n") or len(first) == self._HEAD:
+                    self._head = first
+        self._offset += len(data)
+        *lines, self._partial = (self._partial + data).split(b"\n")
+        records = []
+        for line in lines:
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                logger.debug("Skipping unreadable log line in %s", self.path)
+        return records
+
+    def _reset(self, inode: int) -> None:
+        self._inode, self._offset, self._head, self._partial = inode, 0, b"", b""
+
+
+class _PollWatch:
+    """Wake when ``path``'s ``(inode, size, mtime)`` changes, checked every ``interval``."""
+
+    def __init__(self, path: Path, interval: float):
+        self.path = path
+        self.interval = interval
+        self._last = self._stat()
+
+    def _stat(self):
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return st.st_ino, st.st_size, st.st_mtime_ns
+
+    async def wait(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            current = self._stat()
+            if current != self._last:
+                self._last = current
+                return
+
+    def close(self) -> None:
+        pass
 
 
-async def monitor_loop(interval: float = 1.0) -> None:
+class _InotifyWatch:
+    """Wake on inotify events for ``path``'s directory (survives truncation and re-creation)."""
+
+    _IN_MODIFY, _IN_CLOSE_WRITE, _IN_MOVED_TO, _IN_CREATE = 0x2, 0x8, 0x80, 0x100
+    _IN_NONBLOCK, _IN_CLOEXEC = 0o4000, 0o2000000
+
+    def __init__(self, path: Path):
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.name = path.name.encode()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._fd = libc.inotify_init1(self._IN_NONBLOCK | self._IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        mask = self._IN_MODIFY | self._IN_CLOSE_WRITE | self._IN_MOVED_TO | self._IN_CREATE
+        if libc.inotify_add_watch(self._fd, str(path.parent).encode(), mask) < 0:
+            os.close(self._fd)
+            raise OSError(ctypes.get_errno(), "inotify_add_watch failed")
+        self._loop = asyncio.get_running_loop()
+        self._changed = asyncio.Event()
+        self._loop.add_reader(self._fd, self._drain)
+
+    def _drain(self) -> None:
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return
+        offset = 0
+        while offset < len(data):  # struct inotify_event {int wd; u32 mask, cookie, len; char name[]}
+            _, _, _, length = struct.unpack_from("iIII", data, offset)
+            name = data[offset + 16:offset + 16 + length].rstrip(b"\0")
+            offset += 16 + length
+            if name == self.name:
+                self._changed.set()
+
+    async def wait(self) -> None:
+        await self._changed.wait()
+        self._changed.clear()
+
+    def close(self) -> None:
+        self._loop.remove_reader(self._fd)
+        os.close(self._fd)
+
+
+def watch(path: Path, interval: float = 1.0):
+    """Change notifier for ``path``: inotify where available, else ``stat`` polling."""
+    if sys.platform.startswith("linux"):
+        try:
+            return _InotifyWatch(Path(path))
+        except (OSError, AttributeError) as exc:
+            logger.debug("inotify unavailable (%s); polling %s", exc, path)
+    return _PollWatch(Path(path), interval)
+
+
+async def tail_records(path: Path = WAL_FILE, interval: float = 1.0) -> AsyncIterator[Dict[str, Any]]:
+    """Yield each record appended to the log at ``path``, waking only on change."""
+    tail = LogTail(path)
+    watcher = watch(path, interval)
+    try:
+        while True:
+            for record in tail.read():
+                yield record
+            await watcher.wait()
+    finally:
+        watcher.close()
+
+
+def _initial_state() -> Optional[Dict[str, Any]]:
+    """Latest state before tailing: one snapshot read at startup."""
+    if not MEMORY_FILE.exists():
+        return None
+    with MEMORY_FILE.open() as f:
+        memory = json.load(f)
+    return {"iteration": memory.get("iterations"), "seq": len(memory.get("attractors", []))}
+
+
+async def monitor_loop(interval: float = 1.0,
+                       channel: Optional[CycleChannel] = None,
+                       max_events: Optional[int] = None,
+                       live: Optional[str] = None) -> None:
+    """Log iteration and identity mass as cycles are checkpointed.
+
+    Args:
+        interval: Poll period when inotify is unavailable, or of ``live``
+        channel: Subscribe to this in-process channel instead of tailing the WAL
+        max_events: Stop after this many cycle records (``None`` runs forever)
+        live: Read the shared-memory segment of this name instead of the WAL;
+            only the latest state is seen at each poll
+    """
     logging.info("Starting monitoring loop")
-    while True:
-        if MEMORY_FILE.exists():
-            with MEMORY_FILE.open() as f:
-                memory = json.load(f)
-            logging.info("Iteration %s Identity Mass %s", memory.get("iterations"), len(memory.get("attractors", [])))
-        await asyncio.sleep(interval)
+    reader = None
+    if channel is not None:
+        subscription = channel.subscribe()
+        events: AsyncIterator[Dict[str, Any]] = subscription
+    elif live is not None:
+        from .live import LiveStateReader
+
+        subscription = None
+        reader = LiveStateReader(live)
+        events = reader.updates(interval)
+    else:
+        subscription = None
+        events = tail_records(WAL_FILE, interval)
+        state = _initial_state()
+        if state is not None:
+            logging.info("Iteration %s Identity Mass %s", state["iteration"], state["seq"])
+    seen = 0
+    try:
+        async for record in events:
+            # WAL seq is the attractor count after the cycle, i.e. the identity mass
+            logging.info("Iteration %s Identity Mass %s", record.get("iteration"),
+                         record.get("identity_mass", record.get("seq")))
+            seen += 1
+            if max_events is not None and seen >= max_events:
+                break
+    finally:
+        if subscription is not None:
+            subscription.close()
+        else:
+            await events.aclose()
+        if reader is not None:
+            reader.close()
 
 
 if __name__ == "__main__":
+    import argparse
+
     logging.basicConfig(level=logging.INFO)
-    asyncio.run(monitor_loop())
+    parser = argparse.ArgumentParser(description="Follow a running recursion")
+    parser.add_argument("--live", nargs="?", const="re_omega_live", default=None,
+                        help="Poll this shared-memory segment instead of the WAL")
+    parser.add_argument("--interval", type=float, default=1.0, help="Poll period in seconds")
+    args = parser.parse_args()
+    asyncio.run(monitor_loop(args.interval, live=args.live))
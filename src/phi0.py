@@ -7,14 +7,24 @@ import logging
 import numpy as np
 from dataclasses import dataclass
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class Phi0:
     """Collapse contradiction tensors into coherent attractors."""
 
     async def collapse(self, tensor: np.ndarray) -> np.ndarray:
-        """Perform attractor collapse by smoothing the tensor."""
+        """Perform attractor collapse by smoothing the tensor.
+
+        The collapse is elementwise, so a stacked (N, 8, 8) batch collapses in
+        a single call and the dtype is preserved.  Tensors with their own
+        ``tanh`` (torch, ``scipy.sparse``) collapse natively, staying on their
+        device; since tanh(0) = 0, sparse fields are collapsed over their
+        stored values only and stay sparse.
+        """
         await asyncio.sleep(0)  # allow context switch
-        attractor = np.tanh(tensor)
-        logging.debug("Phi0 collapsed tensor to attractor: %s", attractor)
+        attractor = tensor.tanh() if hasattr(tensor, "tanh") else np.tanh(tensor)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Phi0 collapsed tensor to attractor: %s", attractor)
         return attractor
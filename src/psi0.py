@@ -3,23 +3,101 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import logging
 import numpy as np
 from dataclasses import dataclass, field
-from typing import List, Any
+from typing import Any, List, Optional, Tuple
+
+from .ring import RingBuffer
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on a pre-drawn block, so large fields are not drawn 64 at a time
+_BLOCK_BYTES = 8 << 20
+
+
+def seed_entropy(seed: str) -> int:
+    """Stable 64-bit entropy for a textual seed (unlike ``hash``, not salted per process)."""
+    return int.from_bytes(hashlib.sha256(seed.encode("utf-8")).digest()[:8], "little")
 
 
 @dataclass
 class Psi0:
-    """Generate epistemic contradictions from seeds."""
+    """Generate epistemic contradictions from seeds.
+
+    Each instance owns a ``numpy.random.Generator`` derived from ``seed`` (or
+    from an explicit ``seed_sequence``), so identical seeds reproduce identical
+    contradiction streams.  Dense tensors of ``shape``/``dtype`` are drawn up to
+    ``block_size`` at a time (bounded to a few MiB) to amortize RNG call
+    overhead.  With ``density`` set, each contradiction is a 2-D
+    ``scipy.sparse`` CSR matrix with that fraction of non-zeros; sparse
+    fields are not recorded in ``topology``, which stores dense tensors.
+    """
 
     seed: str
-    topology: List[np.ndarray] = field(default_factory=list)
+    topology: RingBuffer = field(default_factory=RingBuffer)
+    block_size: int = 64
+    shape: Tuple[int, ...] = (8, 8)
+    dtype: str = "float64"
+    density: Optional[float] = None
+    seed_sequence: Optional[np.random.SeedSequence] = field(default=None, repr=False, compare=False)
+    rng: np.random.Generator = field(init=False, repr=False, compare=False)
+    _block: Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)
+    _cursor: int = field(default=0, init=False, repr=False, compare=False)
 
-    async def generate_contradiction(self) -> np.ndarray:
-        """Asynchronously produce a contradiction tensor."""
-        await asyncio.sleep(0)  # allow context switch
-        tensor = np.random.randn(8, 8)
+    def __post_init__(self) -> None:
+        self.shape = tuple(int(n) for n in self.shape)
+        if np.dtype(self.dtype) not in (np.float32, np.float64):
+            raise ValueError(f"field dtype must be float32 or float64, got {self.dtype!r}")
+        if self.density is not None and len(self.shape) != 2:
+            raise ValueError(f"sparse fields must be 2-D, got shape {self.shape}")
+        if self.seed_sequence is None:
+            self.seed_sequence = np.random.SeedSequence(seed_entropy(self.seed))
+        self.rng = np.random.default_rng(self.seed_sequence)
+
+    def spawn(self, n: int) -> List[Psi0]:
+        """Independent child generators, e.g. one per parallel worker."""
+        return [
+            Psi0(seed=f"{self.seed}/{i}", block_size=self.block_size, shape=self.shape,
+                 dtype=self.dtype, density=self.density, seed_sequence=child)
+            for i, child in enumerate(self.seed_sequence.spawn(n))
+        ]
+
+    def _generate_sparse(self) -> Any:
+        from scipy import sparse as sp
+
+        return sp.random(*self.shape, density=self.density, format="csr", dtype=self.dtype,
+                         random_state=self.rng, data_rvs=self.rng.standard_normal)
+
+    def generate(self) -> Any:
+        """Produce a contradiction tensor from the pre-drawn block."""
+        if self.density is not None:
+            return self._generate_sparse()
+        if self._block is None or self._cursor >= len(self._block):
+            itemsize = np.dtype(self.dtype).itemsize * int(np.prod(self.shape))
+            rows = max(1, min(self.block_size, _BLOCK_BYTES // itemsize))
+            self._block = self.rng.standard_normal((rows, *self.shape), dtype=self.dtype)
+            self._cursor = 0
+        tensor = self._block[self._cursor]
+        self._cursor += 1
         self.topology.append(tensor)
-        logging.debug("Psi0 generated contradiction tensor: %s", tensor)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Psi0 generated contradiction tensor: %s", tensor)
         return tensor
+
+    async def generate_contradiction(self) -> Any:
+        """Asynchronously produce a contradiction tensor."""
+        await asyncio.sleep(0)  # allow context switch
+        return self.generate()
+
+    async def generate_batch(self, universes: int) -> np.ndarray:
+        """Produce contradiction tensors for ``universes`` independent runs at once.
+
+        Batches are always dense and are not recorded in ``topology``, which
+        tracks a single trajectory.
+        """
+        await asyncio.sleep(0)  # allow context switch
+        batch = self.rng.standard_normal((universes, *self.shape), dtype=self.dtype)
+        logger.debug("Psi0 generated contradiction batch of shape %s", batch.shape)
+        return batch
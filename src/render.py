@@ -0,0 +1,123 @@
+"""Headless, incremental rendering of the series store to PNG/SVG.
+
+``LiveRenderer`` draws through the Agg canvas directly (no pyplot, no display)
+and keeps one ``series.Envelope`` per panel.  Each ``update()`` memory-maps the
+store, folds in only the rows appended since the previous frame and rewrites
+the output file atomically, so a long run can be watched from a browser or a
+file viewer at a fixed refresh interval.  Given the run's shared-memory state
+(``live``), a frame is skipped without touching the store while nothing was
+published, and the title shows the latest state.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from pathlib import Path
+from typing import Dict, Optional, Sequence, Tuple, Union
+
+from .live import LiveStateReader
+from .series import SUFFIX, Envelope, read_column
+
+logger = logging.getLogger(__name__)
+
+# (column, axis label); the last panel is drawn as event markers
+PANELS: Sequence[Tuple[str, str]] = (
+    ("coherence", "Coherence"),
+    ("identity_mass", "Σ identity mass"),
+    ("torsion", "τ torsion"),
+    ("logos_active", "LogOS activations"),
+)
+
+
+class LiveRenderer:
+    """Render the columns in ``panels`` from ``directory`` into ``output``."""
+
+    def __init__(self, directory: Union[str, Path], output: Union[str, Path],
+                 panels: Sequence[Tuple[str, str]] = PANELS, width: int = 1000, dpi: int = 100,
+                 live: Optional[LiveStateReader] = None):
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        self.directory = Path(directory)
+        self.output = Path(output)
+        self.panels = tuple(panels)
+        self.rows = 0
+        self.live = live
+        self._live_seq = -1
+        self.envelopes: Dict[str, Envelope] = {name: Envelope(width) for name, _ in self.panels}
+        self.figure = Figure(figsize=(width / dpi, 2.0 * len(self.panels)), dpi=dpi)
+        FigureCanvasAgg(self.figure)
+        self.axes = self.figure.subplots(len(self.panels), 1, sharex=True, squeeze=False)[:, 0]
+        for ax, (_, label) in zip(self.axes, self.panels):
+            ax.set_ylabel(label)
+        self.axes[-1].set_xlabel("Iteration")
+
+    def _read_new(self) -> int:
+        """Fold rows appended since the last call into the envelopes; return how many."""
+        columns = {name: read_column(self.directory, name) for name in self.envelopes
+                   if (self.directory / (name + SUFFIX)).exists()}
+        total = min((len(column) for column in columns.values()), default=0)
+        if total <= self.rows:
+            return 0
+        for name, column in columns.items():
+            self.envelopes[name].extend(column[self.rows:total])
+        new, self.rows = total - self.rows, total
+        return new
+
+    def _draw(self) -> None:
+        for i, (ax, (name, _)) in enumerate(zip(self.axes, self.panels)):
+            for artist in list(ax.collections) + list(ax.lines):
+                artist.remove()
+            x, lo, hi = self.envelopes[name].arrays()
+            if i == len(self.panels) - 1:
+                ax.vlines(x[hi > 0], 0.0, 1.0, linewidth=0.8, color="tab:red")
+                ax.set_ylim(0.0, 1.05)
+            else:
+                ax.fill_between(x, lo, hi, step="post", linewidth=0.5)
+                ax.relim()
+                ax.autoscale_view()
+        self.axes[-1].set_xlim(0, max(1, self.rows))
+        state = self.live.read() if self.live is not None else None
+        if state is not None:
+            self.figure.suptitle("iteration {:.0f}  Σ {:.2f}  τ {:.3f}  last LogOS {:.0f}".format(
+                state["iteration"], state["identity_mass"], state["torsion"], state["last_activation"]))
+
+    def update(self, force: bool = False) -> bool:
+        """Render a frame if new rows arrived (or ``force``); return whether one was written."""
+        if self.live is not None:
+            seq = self.live.seq
+            if seq == self._live_seq and not force:
+                return False
+            self._live_seq = seq
+        if not self._read_new() and not force:
+            return False
+        self._draw()
+        self.output.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.output.with_name(self.output.name + ".tmp")
+        self.figure.savefig(tmp, format=self.output.suffix.lstrip(".") or "png")
+        os.replace(tmp, self.output)
+        logger.debug("Rendered %d rows to %s", self.rows, self.output)
+        return True
+
+
+async def render_loop(directory: Union[str, Path], output: Union[str, Path],
+                      interval: float = 5.0, width: int = 1000,
+                      max_frames: Optional[int] = None, live: Optional[str] = None) -> None:
+    """Refresh ``output`` from the tail of the store every ``interval`` seconds.
+
+    ``live`` names the run's shared-memory segment, if it publishes one.
+    """
+    renderer = LiveRenderer(directory, output, width=width,
+                            live=LiveStateReader(live) if live else None)
+    frames = 0
+    renderer.update(force=True)
+    try:
+        while max_frames is None or frames < max_frames:
+            await asyncio.sleep(interval)
+            if renderer.update():
+                frames += 1
+    finally:
+        if renderer.live is not None:
+            renderer.live.close()
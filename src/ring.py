@@ -0,0 +1,155 @@
+"""Bounded tensor history with running statistics."""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import BinaryIO, Iterator, Optional, Tuple
+
+import numpy as np
+
+# Default bound on the retained block, so large fields keep fewer than ``capacity``
+MAX_BYTES = 64 << 20
+
+
+@dataclass
+class RingBuffer:
+    """Keep the last ``capacity`` tensors in one preallocated contiguous block.
+
+    The block is also held to ``max_bytes`` (``None`` for no limit): tensors
+    too large for ``capacity`` of them to fit are kept fewer at a time, down
+    to one, and ``capacity`` is lowered to match on the first append.
+
+    Running aggregates (elementwise mean/variance via Welford, plus norm sums)
+    cover every tensor ever appended, so statistics stay O(1) while memory
+    stays flat.  Setting ``spill_path`` opts into full-history retention: every
+    tensor is also appended as raw float64 to that file.
+    """
+
+    capacity: int = 256
+    spill_path: Optional[str] = None
+    max_bytes: Optional[int] = MAX_BYTES
+    count: int = 0
+    norm_sum: float = 0.0
+    norm_sq_sum: float = 0.0
+    _block: Optional[np.ndarray] = field(default=None, repr=False)
+    _mean: Optional[np.ndarray] = field(default=None, repr=False)
+    _m2: Optional[np.ndarray] = field(default=None, repr=False)
+    _spill: Optional[BinaryIO] = field(default=None, repr=False)
+
+    def _allocate(self, shape: Tuple[int, ...], dtype: np.dtype) -> None:
+        if self.max_bytes is not None and self.capacity:
+            nbytes = int(np.prod(shape)) * np.dtype(dtype).itemsize
+            self.capacity = min(self.capacity, max(1, self.max_bytes // max(1, nbytes)))
+        self._block = np.empty((self.capacity, *shape), dtype=dtype)
+        self._mean = np.zeros(shape)
+        self._m2 = np.zeros(shape)
+
+    def append(self, tensor: np.ndarray, norm: Optional[float] = None) -> None:
+        """Store ``tensor``, overwriting the oldest slot once full."""
+        if self._block is None:
+            self._allocate(tensor.shape, tensor.dtype)
+        elif tensor.shape != self._block.shape[1:]:
+            raise ValueError(f"expected tensor of shape {self._block.shape[1:]}, got {tensor.shape}")
+
+        if self.capacity:
+            self._block[self.count % self.capacity] = tensor
+        self.count += 1
+        delta = tensor - self._mean
+        self._mean += delta / self.count
+        self._m2 += delta * (tensor - self._mean)
+
+        if norm is None:
+            norm = float(np.linalg.norm(tensor))
+        self.norm_sum += norm
+        self.norm_sq_sum += norm * norm
+
+        if self.spill_path is not None:
+            if self._spill is None:
+                self._spill = open(self.spill_path, "ab")
+            self._spill.write(np.ascontiguousarray(tensor, dtype=np.float64).tobytes())
+
+    def extend(self, batch: np.ndarray, norms: Optional[np.ndarray] = None) -> None:
+        """Append a (B, ...) stack of tensors with whole-batch array ops.
+
+        Statistics are merged with the parallel form of Welford's update, so
+        the result matches B calls to ``append``.
+        """
+        if not len(batch):
+            return
+        if self._block is None:
+            self._allocate(batch.shape[1:], batch.dtype)
+        elif batch.shape[1:] != self._block.shape[1:]:
+            raise ValueError(f"expected tensors of shape {self._block.shape[1:]}, got {batch.shape[1:]}")
+
+        n = len(batch)
+        if self.capacity:
+            kept = batch[-self.capacity:]
+            slots = (self.count + n - len(kept) + np.arange(len(kept))) % self.capacity
+            self._block[slots] = kept
+        batch_mean = batch.mean(axis=0)
+        delta = batch_mean - self._mean
+        total = self.count + n
+        self._m2 += ((batch - batch_mean) ** 2).sum(axis=0) + delta * delta * (self.count * n / total)
+        self._mean += delta * (n / total)
+        self.count = total
+
+        if norms is None:
+            norms = np.linalg.norm(batch.reshape(n, -1), axis=1)
+        self.norm_sum += float(norms.sum())
+        self.norm_sq_sum += float(np.dot(norms, norms))
+
+        if self.spill_path is not None:
+            if self._spill is None:
+                self._spill = open(self.spill_path, "ab")
+            self._spill.write(np.ascontiguousarray(batch, dtype=np.float64).tobytes())
+
+    def __len__(self) -> int:
+        return min(self.count, self.capacity)
+
+    def __getitem__(self, index: int) -> np.ndarray:
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("ring buffer index out of range")
+        return self._block[(self.count - size + index) % self.capacity]
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def array(self) -> np.ndarray:
+        """Retained tensors, oldest first, as one (len, ...) array."""
+        if not len(self):
+            return np.empty((0,))
+        start = self.count % self.capacity if self.count > self.capacity else 0
+        return np.roll(self._block[: len(self)], -start, axis=0)
+
+    def mean(self) -> np.ndarray:
+        return self._mean if self._mean is not None else np.zeros(())
+
+    def variance(self) -> np.ndarray:
+        if self._m2 is None or self.count < 2:
+            return np.zeros_like(self.mean())
+        return self._m2 / (self.count - 1)
+
+    def norm_mean(self) -> float:
+        return self.norm_sum / max(1, self.count)
+
+    def load_spill(self, shape: Optional[Tuple[int, ...]] = None) -> np.ndarray:
+        """Memory-map the spilled full history as a (count, *shape) array."""
+        if self._spill is not None:
+            self._spill.flush()
+        if self.spill_path is None or not Path(self.spill_path).exists():
+            return np.empty((0,))
+        shape = shape or self._block.shape[1:]
+        logging.debug("Mapping spilled history from %s", self.spill_path)
+        return np.memmap(self.spill_path, dtype=np.float64, mode="r").reshape(-1, *shape)
+
+    def close(self) -> None:
+        """Flush and close the spill file, if any."""
+        if self._spill is not None:
+            self._spill.close()
+            self._spill = None
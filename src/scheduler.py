@@ -0,0 +1,113 @@
+"""Concurrent agent dispatch with per-agent timeouts and pool offloading."""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import re
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Collection, Dict, Mapping, Optional, Union
+
+from .instrument import NULL_INSTRUMENTATION, Instrumentation
+
+logger = logging.getLogger(__name__)
+
+Job = Callable[[], Union[Any, Awaitable[Any]]]
+
+_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def parse_duration(value: Union[str, float, int, None]) -> Optional[float]:
+    """Seconds from ``30``, ``"30s"``, ``"500ms"`` or ``"2m"``; ``None`` passes through."""
+    if value is None or isinstance(value, (int, float)):
+        return None if value is None else float(value)
+    match = re.fullmatch(r"\s*([0-9.]+)\s*(ms|s|m|h)?\s*", value)
+    if not match:
+        raise ValueError(f"invalid duration {value!r}")
+    return float(match.group(1)) * _UNITS[match.group(2) or "s"]
+
+
+def _run_to_completion(job: Job) -> Any:
+    """Executor entry point: call ``job`` and drive any coroutine it returns."""
+    result = job()
+    if inspect.isawaitable(result):
+        return asyncio.run(result)
+    return result
+
+
+class AgentScheduler:
+    """Run a set of triggered agent jobs concurrently.
+
+    Every job gets its own timeout (``timeouts`` overrides ``timeout``).  Jobs
+    named in ``offload`` run in a thread or process pool so CPU-bound agents
+    do not stall the event loop; the rest run on the loop.  A failing or
+    timed-out agent yields an ``{"error": ...}`` result instead of cancelling
+    its siblings.  Each job is timed as span ``agent.<name>``.
+    """
+
+    def __init__(self,
+                 timeout: Optional[float] = None,
+                 timeouts: Optional[Mapping[str, float]] = None,
+                 offload: Collection[str] = (),
+                 pool: str = "thread",
+                 max_workers: Optional[int] = None,
+                 instrument: Optional[Instrumentation] = None):
+        self.instrument = instrument or NULL_INSTRUMENTATION
+        self.timeout = timeout
+        self.timeouts = dict(timeouts or {})
+        self.offload = frozenset(offload)
+        self.pool = pool
+        self.max_workers = max_workers
+        self._executor: Optional[Executor] = None
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any],
+                    instrument: Optional[Instrumentation] = None) -> "AgentScheduler":
+        agents = config.get("agents", {}) or {}
+        return cls(
+            timeout=parse_duration(config.get("recursion", {}).get("collapse_timeout")),
+            timeouts={k: parse_duration(v) for k, v in (agents.get("timeouts") or {}).items()},
+            offload=agents.get("offload") or (),
+            pool=agents.get("pool", "thread"),
+            max_workers=agents.get("max_workers"),
+            instrument=instrument,
+        )
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            factory = ProcessPoolExecutor if self.pool == "process" else ThreadPoolExecutor
+            self._executor = factory(max_workers=self.max_workers)
+        return self._executor
+
+    async def _run(self, name: str, job: Job) -> Any:
+        with self.instrument.span("agent." + name):
+            if name in self.offload:
+                loop = asyncio.get_running_loop()
+                pending = loop.run_in_executor(self.executor, _run_to_completion, job)
+            else:
+                pending = job()
+                if not inspect.isawaitable(pending):
+                    return pending
+            return await asyncio.wait_for(pending, self.timeouts.get(name, self.timeout))
+
+    async def dispatch(self, jobs: Mapping[str, Job]) -> Dict[str, Any]:
+        """Run all ``jobs`` concurrently; results keep the order of ``jobs``."""
+        names = list(jobs)
+        outcomes = await asyncio.gather(*(self._run(n, jobs[n]) for n in names), return_exceptions=True)
+        results: Dict[str, Any] = {}
+        for name, outcome in zip(names, outcomes):
+            if isinstance(outcome, asyncio.TimeoutError):
+                logger.warning("Agent %s timed out", name)
+                outcome = {"error": "timeout"}
+            elif isinstance(outcome, Exception):
+                logger.error("Agent %s failed: %s", name, outcome)
+                outcome = {"error": str(outcome)}
+            results[name] = outcome
+        return results
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
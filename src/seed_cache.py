@@ -0,0 +1,290 @@
+"""Memoized seed embeddings for ``ActivationSchema.load_seed``.
+
+Seeds are embedded by signed feature hashing (``HashedEmbedding``), streamed
+in bounded chunks so corpora of any size fit in ``O(dim)`` memory.
+Embeddings are keyed by the SHA-256 of the seed content (plus the embedding
+dimension), held in an in-memory LRU and persisted under ``directory`` so
+other processes reuse them.  A per-path ``(mtime_ns, size)`` stamp lets unchanged
+files skip the read and hash entirely; a changed stamp triggers a rehash, and
+a changed hash a re-embed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import zlib
+from collections import Counter, OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple, Union
+
+import numpy as np
+
+DEFAULT_DIM = 128
+CHUNK_SIZE = 1 << 20  # characters per streaming read
+_PUNCTUATION = ".,!?;:()\"'"
+
+
+def content_key(data: Union[str, bytes], dim: int = DEFAULT_DIM) -> str:
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return f"{hashlib.sha256(data).hexdigest()}-h{dim}"
+
+
+def file_key(path: Union[str, Path], dim: int = DEFAULT_DIM) -> str:
+    """``content_key`` of a file's bytes, hashed in bounded-size reads."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(block)
+    return f"{digest.hexdigest()}-h{dim}"
+
+
+def _tokens(text: str) -> List[str]:
+    # lower() runs once over the whole chunk rather than once per word
+    return [word.strip(_PUNCTUATION) for word in text.lower().split()]
+
+
+def _chunks(f: TextIO, size: int = CHUNK_SIZE) -> Iterator[str]:
+    """Read ``f`` in ``size`` pieces that never split a word."""
+    carry = ""
+    for block in iter(lambda: f.read(size), ""):
+        block = carry + block
+        cut = max(block.rfind(" "), block.rfind("\n"), block.rfind("\t"))
+        if cut < 0:
+            carry = block
+            continue
+        carry = block[cut + 1:]
+        yield block[:cut + 1]
+    if carry:
+        yield carry
+
+
+def _stream(path: Union[str, Path], embedding: "HashedEmbedding",
+            chunk_size: int = CHUNK_SIZE) -> "HashedEmbedding":
+    with open(path, "r", encoding="utf-8") as f:
+        for chunk in _chunks(f, chunk_size):
+            embedding.update(chunk)
+    return embedding
+
+
+class HashedEmbedding:
+    """Signed feature-hashing accumulator over a stream of text chunks.
+
+    Each token lands in bucket ``crc32(token) % dim`` with a sign taken from
+    the top hash bit, so the embedding is independent of token order, keeps
+    every token regardless of vocabulary size, and needs ``O(dim)`` memory
+    plus one chunk.
+    """
+
+    def __init__(self, dim: int = DEFAULT_DIM):
+        if dim < 1:
+            raise ValueError(f"embedding dimension must be positive, got {dim}")
+        self.dim = dim
+        self.counts = np.zeros(dim)
+
+    def update(self, text: str) -> "HashedEmbedding":
+        counts = Counter(_tokens(text))
+        counts.pop("", None)
+        if counts:
+            hashes = np.fromiter((zlib.crc32(t.encode("utf-8")) for t in counts), dtype=np.uint32, count=len(counts))
+            weights = np.fromiter(counts.values(), dtype=float, count=len(counts))
+            weights[hashes >> 31 == 1] *= -1.0
+            self.counts += np.bincount(hashes % self.dim, weights=weights, minlength=self.dim)
+        return self
+
+    def result(self, sparse: bool = False):
+        """L2-normalized embedding; ``sparse`` returns a ``(1, dim)`` ``scipy.sparse.csr_array``."""
+        embedding = self.counts.copy()
+        norm = np.linalg.norm(embedding)
+        if norm > 0:
+            embedding /= norm
+        if sparse:
+            from scipy import sparse as sp
+
+            return sp.csr_array(embedding.reshape(1, -1))
+        return embedding
+
+
+def embed_text(text: str, dim: int = DEFAULT_DIM, sparse: bool = False):
+    """Hashed embedding of ``text`` (see ``HashedEmbedding``)."""
+    return HashedEmbedding(dim).update(text).result(sparse)
+
+
+def embed_file(path: Union[str, Path], dim: int = DEFAULT_DIM, sparse: bool = False,
+               chunk_size: int = CHUNK_SIZE):
+    """Hashed embedding of a file of any size, read ``chunk_size`` characters at a time."""
+    return _stream(path, HashedEmbedding(dim), chunk_size).result(sparse)
+
+
+class SeedCache:
+    """Content-hash keyed embedding cache: in-memory LRU over an on-disk store.
+
+    Dense embeddings are stored as ``.npy``; with ``sparse`` they are kept as
+    ``scipy.sparse.csr_array`` and stored as ``.npz``.
+    """
+
+    def __init__(self, directory: Union[str, Path, None] = "memory/embeddings",
+                 maxsize: int = 64, dim: int = DEFAULT_DIM, sparse: bool = False):
+        if dim < 1:
+            raise ValueError(f"embedding dimension must be positive, got {dim}")
+        self.directory = Path(directory) if directory is not None else None
+        self.maxsize = maxsize
+        self.dim = dim
+        self.sparse = sparse
+        self.suffix = ".npz" if sparse else ".npy"
+        self._lru: "OrderedDict[str, Any]" = OrderedDict()
+        self._stamps: Dict[str, Tuple[int, int, str]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    # ------------------------------------------------------------------ #
+    def _remember(self, key: str, embedding: Any) -> None:
+        if not self.sparse:
+            embedding.setflags(write=False)  # shared between callers
+        self._lru[key] = embedding
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.maxsize:
+            self._lru.popitem(last=False)
+
+    def _store(self, key: str, embedding: Any) -> None:
+        if self.directory is None:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"{key}{self.suffix}"
+        tmp = path.with_suffix(self.suffix + ".tmp")
+        with tmp.open("wb") as f:
+            if self.sparse:
+                from scipy import sparse as sp
+
+                sp.save_npz(f, embedding)
+            else:
+                np.save(f, embedding)
+        os.replace(tmp, path)
+
+    def _lookup(self, key: str) -> Any:
+        embedding = self._lru.get(key)
+        if embedding is not None:
+            self._lru.move_to_end(key)
+            return embedding
+        if self.directory is not None:
+            path = self.directory / f"{key}{self.suffix}"
+            try:
+                if self.sparse:
+                    from scipy import sparse as sp
+
+                    embedding = sp.csr_array(sp.load_npz(path))
+                else:
+                    embedding = np.load(path)
+            except (OSError, ValueError):
+                return None
+            self._remember(key, embedding)
+        return embedding
+
+    def _cached(self, key: str) -> Any:
+        with self._lock:
+            embedding = self._lookup(key)
+            if embedding is not None:
+                self.hits += 1
+            return embedding
+
+    def _insert(self, key: str, embedding: Any) -> Any:
+        with self._lock:
+            self.misses += 1
+            self._remember(key, embedding)
+        self._store(key, embedding)
+        return embedding
+
+    def _stamp(self, path: Path) -> Tuple[str, Tuple[int, int]]:
+        resolved = str(path.resolve())
+        st = os.stat(resolved)
+        return resolved, (st.st_mtime_ns, st.st_size)
+
+    def _file_key(self, resolved: str, stamp: Tuple[int, int]) -> str:
+        """Content key of a file, rehashed only when its stamp changed."""
+        with self._lock:
+            known = self._stamps.get(resolved)
+        if known is not None and known[:2] == stamp:
+            return known[2]
+        key = file_key(resolved, self.dim)
+        with self._lock:
+            self._stamps[resolved] = (*stamp, key)
+        return key
+
+    # ------------------------------------------------------------------ #
+    def embed(self, text: str) -> Any:
+        """Embedding of ``text``, computed at most once per content hash."""
+        key = content_key(text, self.dim)
+        embedding = self._cached(key)
+        if embedding is None:
+            embedding = self._insert(key, embed_text(text, self.dim, self.sparse))
+        return embedding
+
+    def load(self, path: Union[str, Path]) -> Any:
+        """Embedding of the seed file at ``path``, streamed on a cache miss.
+
+        Unchanged files (same mtime and size) are neither re-read nor rehashed.
+        """
+        resolved, stamp = self._stamp(Path(path))
+        key = self._file_key(resolved, stamp)
+        embedding = self._cached(key)
+        if embedding is None:
+            embedding = self._insert(key, embed_file(resolved, self.dim, self.sparse))
+        return embedding
+
+    def load_directory(self, directory: Union[str, Path], pattern: str = "*.md") -> Dict[str, Any]:
+        """Embed every seed under ``directory`` matching ``pattern``.
+
+        Files already cached are served from the cache; the remainder are
+        streamed into one ``(files, dim)`` count matrix and normalized
+        together.  Files with identical content are embedded once.
+        """
+        results: Dict[str, Any] = {}
+        pending: Dict[str, List[str]] = {}  # content key -> paths sharing it
+        for path in sorted(Path(directory).rglob(pattern)):
+            key = self._file_key(*self._stamp(path))
+            embedding = self._cached(key)
+            if embedding is None:
+                pending.setdefault(key, []).append(str(path))
+            else:
+                results[str(path)] = embedding
+        if not pending:
+            return results
+
+        counts = np.zeros((len(pending), self.dim))
+        for row, paths in zip(counts, pending.values()):
+            row[:] = _stream(paths[0], HashedEmbedding(self.dim)).counts
+        norms = np.linalg.norm(counts, axis=1, keepdims=True)
+        np.divide(counts, norms, out=counts, where=norms > 0)
+        if self.sparse:
+            from scipy import sparse as sp
+
+            rows = [sp.csr_array(counts[i:i + 1]) for i in range(len(counts))]
+        else:
+            rows = list(counts)
+        for (key, paths), embedding in zip(pending.items(), rows):
+            self._insert(key, embedding)
+            for path in paths:
+                results[path] = embedding
+        return results
+
+    def clear(self) -> None:
+        """Drop the in-memory entries (the on-disk store is kept)."""
+        with self._lock:
+            self._lru.clear()
+            self._stamps.clear()
+
+
+_shared: Dict[Tuple[Optional[str], int, bool], SeedCache] = {}
+
+
+def get_seed_cache(directory: Union[str, Path, None] = "memory/embeddings",
+                   maxsize: int = 64, dim: int = DEFAULT_DIM, sparse: bool = False) -> SeedCache:
+    """Process-wide cache per ``(directory, dim, sparse)``, shared by every schema."""
+    key = (str(directory) if directory is not None else None, dim, sparse)
+    cache = _shared.get(key)
+    if cache is None:
+        cache = _shared[key] = SeedCache(directory, maxsize, dim, sparse)
+    return cache
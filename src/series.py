@@ -0,0 +1,188 @@
+"""Columnar on-disk time series for long runs.
+
+Each column is a headerless float64 file (``<column>.f64``) that only ever
+grows, so appends are O(1), readers ``np.memmap`` any prefix without parsing,
+and a million-iteration history costs 8 bytes per value instead of a JSON
+float.  Columns of one store advance together; after a crash the shortest
+column bounds what readers see, and the next writer cuts every column back
+to it before appending so rows stay aligned.
+"""
+
+from __future__ import annotations
+
+import math
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterator, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+SUFFIX = ".f64"
+_ITEMSIZE = np.dtype(np.float64).itemsize
+
+
+class SeriesWriter:
+    """Append rows of named float64 columns, buffered ``flush_every`` rows at a time."""
+
+    def __init__(self, directory: Union[str, Path], columns: Sequence[str], flush_every: int = 256):
+        self.directory = Path(directory)
+        self.columns = tuple(columns)
+        self.flush_every = max(1, flush_every)
+        self._buffer = np.empty((self.flush_every, len(self.columns)))
+        self._rows = 0
+        self._files: Dict[str, BinaryIO] = {}
+
+    def append(self, row: Mapping[str, float]) -> None:
+        self._buffer[self._rows] = [row[name] for name in self.columns]
+        self._rows += 1
+        if self._rows == self.flush_every:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._rows:
+            return
+        if not self._files:
+            self._open()
+        for i, name in enumerate(self.columns):
+            f = self._files[name]
+            f.write(np.ascontiguousarray(self._buffer[:self._rows, i]).tobytes())
+            f.flush()
+        self._rows = 0
+
+    def _open(self) -> None:
+        """Open every column for appending, first trimming them to the rows all of them have."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._files = {name: open(self.directory / (name + SUFFIX), "ab") for name in self.columns}
+        sizes = {name: f.seek(0, 2) for name, f in self._files.items()}
+        rows = min(sizes.values()) // _ITEMSIZE
+        for name, f in self._files.items():
+            if sizes[name] != rows * _ITEMSIZE:  # torn by a crash between column flushes
+                f.truncate(rows * _ITEMSIZE)
+
+    def close(self) -> None:
+        self.flush()
+        for f in self._files.values():
+            f.close()
+        self._files = {}
+
+    def __enter__(self) -> "SeriesWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def columns(directory: Union[str, Path]) -> Tuple[str, ...]:
+    return tuple(sorted(p.stem for p in Path(directory).glob("*" + SUFFIX)))
+
+
+def read_column(directory: Union[str, Path], name: str) -> np.ndarray:
+    """Memory-map column ``name``, trimmed to the rows every column has."""
+    directory = Path(directory)
+    rows = min((p.stat().st_size // _ITEMSIZE for p in directory.glob("*" + SUFFIX)), default=0)
+    if rows == 0:
+        return np.empty(0)
+    return np.memmap(directory / (name + SUFFIX), dtype=np.float64, mode="r", shape=(rows,))
+
+
+def _chunks(series: np.ndarray, bucket: int, chunk_buckets: int) -> Iterator[np.ndarray]:
+    step = bucket * chunk_buckets
+    for start in range(0, len(series), step):
+        yield series[start:start + step]
+
+
+def decimate(series: np.ndarray, buckets: int = 2000,
+             chunk_buckets: int = 4096) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Reduce ``series`` to per-bucket ``(x, min, max)`` for plotting.
+
+    Drawing a vertical min-max span per pixel column is visually identical to
+    plotting every point.  The input is scanned ``chunk_buckets`` buckets at a
+    time, so a memory-mapped series of any length is reduced in constant
+    memory.
+    """
+    n = len(series)
+    if n <= 2 * buckets:
+        values = np.asarray(series, dtype=np.float64)
+        return np.arange(n, dtype=np.float64), values, values
+    bucket = math.ceil(n / buckets)
+    lo = np.empty(math.ceil(n / bucket))
+    hi = np.empty_like(lo)
+    out = 0
+    for chunk in _chunks(series, bucket, chunk_buckets):
+        whole = len(chunk) // bucket * bucket
+        if whole:
+            blocks = np.asarray(chunk[:whole]).reshape(-1, bucket)
+            lo[out:out + len(blocks)] = blocks.min(axis=1)
+            hi[out:out + len(blocks)] = blocks.max(axis=1)
+            out += len(blocks)
+        if whole < len(chunk):  # ragged final bucket
+            lo[out], hi[out] = chunk[whole:].min(), chunk[whole:].max()
+            out += 1
+    x = np.arange(out, dtype=np.float64) * bucket
+    return x, lo[:out], hi[:out]
+
+
+class Envelope:
+    """Incrementally maintained min/max decimation of a growing series.
+
+    Buckets are aligned from sample 0 and double in size whenever more than
+    ``2 * width`` would be needed, so memory stays ``O(width)`` and each new
+    sample is folded in once; history is never re-read.
+    """
+
+    def __init__(self, width: int = 1000):
+        self.width = width
+        self.bucket = 1
+        self.count = 0
+        self._lo = np.empty(2 * width + 1)
+        self._hi = np.empty(2 * width + 1)
+        self._n = 0
+
+    def _coarsen(self) -> None:
+        pairs = self._n // 2
+        lo, hi = self._lo[:2 * pairs].reshape(-1, 2), self._hi[:2 * pairs].reshape(-1, 2)
+        tail_lo, tail_hi = self._lo[self._n - 1], self._hi[self._n - 1]
+        self._lo[:pairs], self._hi[:pairs] = lo.min(axis=1), hi.max(axis=1)
+        if self._n % 2:
+            self._lo[pairs], self._hi[pairs] = tail_lo, tail_hi
+        self._n = pairs + self._n % 2
+        self.bucket *= 2
+
+    def extend(self, values: np.ndarray, chunk_buckets: int = 4096) -> None:
+        for chunk in _chunks(values, self.bucket, chunk_buckets):
+            self._extend(np.asarray(chunk, dtype=np.float64))
+
+    def _extend(self, values: np.ndarray) -> None:
+        if not len(values):
+            return
+        while math.ceil((self.count + len(values)) / self.bucket) > 2 * self.width:
+            self._coarsen()
+        fill = self.count - (self._n - 1) * self.bucket if self._n else self.bucket
+        if fill < self.bucket:  # top up the partial last bucket
+            head, values = values[:self.bucket - fill], values[self.bucket - fill:]
+            self._lo[self._n - 1] = min(self._lo[self._n - 1], head.min())
+            self._hi[self._n - 1] = max(self._hi[self._n - 1], head.max())
+            self.count += len(head)
+        if len(values):
+            whole = len(values) // self.bucket * self.bucket
+            blocks = values[:whole].reshape(-1, self.bucket)
+            n = len(blocks)
+            self._lo[self._n:self._n + n] = blocks.min(axis=1)
+            self._hi[self._n:self._n + n] = blocks.max(axis=1)
+            self._n += n
+            if whole < len(values):
+                self._lo[self._n], self._hi[self._n] = values[whole:].min(), values[whole:].max()
+                self._n += 1
+            self.count += len(values)
+
+    def arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Current ``(x, min, max)`` per bucket (copies)."""
+        x = np.arange(self._n, dtype=np.float64) * self.bucket
+        return x, self._lo[:self._n].copy(), self._hi[:self._n].copy()
+
+
+def load_decimated(directory: Union[str, Path], name: str,
+                   buckets: int = 2000) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """``decimate`` applied to a stored column, or ``None`` if it does not exist."""
+    if not (Path(directory) / (name + SUFFIX)).exists():
+        return None
+    return decimate(read_column(directory, name), buckets)
@@ -5,7 +5,13 @@ from __future__ import annotations
 import logging
 import numpy as np
 from dataclasses import dataclass, field
-from typing import List
+
+from .backend import field_norm, is_sparse
+from .ring import RingBuffer
+
+logger = logging.getLogger(__name__)
+
+CRITICAL_MASS = 100.0
 
 
 @dataclass
@@ -13,20 +19,53 @@ class Sigma:
     """Maintain identity continuity across recursion."""
 
     identity_mass: float = 0.0
-    history: List[np.ndarray] = field(default_factory=list)
+    history: RingBuffer = field(default_factory=RingBuffer)
     iteration: int = 0
+    critical_mass: float = CRITICAL_MASS
 
     def integrate(self, attractor: np.ndarray) -> None:
-        """Integrate attractor into identity tensor."""
-        self.identity_mass += float(np.linalg.norm(attractor))
-        self.history.append(attractor)
+        """Integrate attractor into identity tensor.
+
+        Sparse attractors add their norm to the mass but are not kept in the
+        dense ``history``.
+        """
+        norm = field_norm(attractor)
+        self.identity_mass += norm
+        if not is_sparse(attractor):
+            self.history.append(attractor, norm=norm)
         self.iteration += 1
-        logging.debug("Sigma integrated attractor. Iteration %d mass %f", self.iteration, self.identity_mass)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Sigma integrated attractor. Iteration %d mass %f", self.iteration, self.identity_mass)
+
+    def update(self, psi_tensor: np.ndarray, phi_tensor: np.ndarray) -> float:
+        """Integrate the φ⁰ attractor of a ψ⁰→φ⁰ collapse and return coherence.
+
+        ``psi_tensor`` is accepted so callers can pass the full collapse pair.
+        """
+        self.integrate(phi_tensor)
+        return float(self.coherence_metric())
+
+    def update_batch(self, phi_batch: np.ndarray) -> np.ndarray:
+        """Integrate a (B, ...) stack of attractors in order; return coherence after each.
+
+        Equivalent to B calls to ``update`` but costs a cumulative sum instead
+        of B Python iterations.
+        """
+        norms = np.linalg.norm(phi_batch.reshape(len(phi_batch), -1), axis=1)
+        masses = self.identity_mass + np.cumsum(norms)
+        self.history.extend(phi_batch, norms=norms)
+        self.identity_mass = float(masses[-1]) if len(masses) else self.identity_mass
+        self.iteration += len(phi_batch)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Sigma integrated %d attractors. Iteration %d mass %f",
+                         len(phi_batch), self.iteration, self.identity_mass)
+        return 1.0 / (1.0 + np.exp(-masses / 10.0))
 
     def is_critical(self) -> bool:
         """Detect overload condition based on mass."""
-        critical = self.identity_mass > 100.0
-        logging.debug("Sigma critical check: %s", critical)
+        critical = self.identity_mass > self.critical_mass
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Sigma critical check: %s", critical)
         return critical
 
     def coherence_metric(self) -> float:
@@ -34,3 +73,32 @@ class Sigma:
 
     def emergence_gradient(self) -> float:
         return self.identity_mass / max(1, self.iteration)
+
+
+@dataclass
+class SigmaBatch:
+    """Identity accumulators for N independent universes stepped in lockstep."""
+
+    universes: int
+    identity_mass: np.ndarray = field(init=False)
+    iteration: int = 0
+    critical_mass: float = CRITICAL_MASS
+
+    def __post_init__(self) -> None:
+        self.identity_mass = np.zeros(self.universes)
+
+    def integrate(self, attractors: np.ndarray) -> None:
+        """Integrate an (N, ...) stack of attractors, one per universe."""
+        self.identity_mass += np.linalg.norm(attractors.reshape(self.universes, -1), axis=1)
+        self.iteration += 1
+        logger.debug("SigmaBatch integrated %d attractors. Iteration %d", self.universes, self.iteration)
+
+    def is_critical(self) -> np.ndarray:
+        """Boolean mask of universes past the overload mass."""
+        return self.identity_mass > self.critical_mass
+
+    def coherence_metric(self) -> np.ndarray:
+        return 1.0 / (1.0 + np.exp(-self.identity_mass / 10.0))
+
+    def emergence_gradient(self) -> np.ndarray:
+        return self.identity_mass / max(1, self.iteration)
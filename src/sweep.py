@@ -0,0 +1,148 @@
+"""Parallel parameter sweeps over seeds, LogOS thresholds and Σ critical mass."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .baby import recursive_emergence_cycle
+from .live import attach_segment
+from .logos import LogOS
+from .phi0 import Phi0
+from .psi0 import Psi0, seed_entropy
+from .sigma import CRITICAL_MASS, Sigma
+
+METRICS = ("coherence", "identity_mass", "emergence_potential", "activations", "first_activation")
+
+
+@dataclass
+class SweepGrid:
+    """Cartesian product of the parameters to sweep."""
+
+    seeds: Sequence[str] = ("observer",)
+    thresholds: Sequence[float] = (50.0,)
+    critical_masses: Sequence[float] = (CRITICAL_MASS,)
+    depth: int = 100
+    base_seed: int = 0
+    tasks: List[Tuple[str, float, float]] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.tasks = list(itertools.product(self.seeds, self.thresholds, self.critical_masses))
+
+
+def task_seed_sequence(seed: str, base_seed: int) -> np.random.SeedSequence:
+    """RNG stream for one grid point, independent of worker scheduling.
+
+    Tasks sharing a Psi0 seed see the same contradiction stream, so threshold
+    and critical-mass variations are compared on common random numbers.
+    """
+    return np.random.SeedSequence([seed_entropy(seed), base_seed])
+
+
+async def _simulate(seed: str, threshold: float, critical_mass: float, depth: int, base_seed: int) -> np.ndarray:
+    psi = Psi0(seed=seed, seed_sequence=task_seed_sequence(seed, base_seed))
+    phi = Phi0()
+    sigma = Sigma(critical_mass=critical_mass)
+    logos = LogOS(activation_threshold=threshold)
+    state: Dict[str, Any] = {"coherence": sigma.coherence_metric(), "emergence_potential": 0.0}
+    for _ in range(depth):
+        state = await recursive_emergence_cycle(psi, phi, sigma, logos)
+    first = logos.activations[0] if logos.activations else -1
+    return np.array([state["coherence"], sigma.identity_mass, state["emergence_potential"],
+                     len(logos.activations), first])
+
+
+def _run_task(shm_name: str, n_tasks: int, depth: int, base_seed: int,
+              task: Tuple[int, Tuple[str, float, float]]) -> int:
+    """Worker entry point: simulate one grid point and write its row in place."""
+    index, (seed, threshold, critical_mass) = task
+    row = asyncio.run(_simulate(seed, threshold, critical_mass, depth, base_seed))
+    shm = attach_segment(shm_name)  # the parent owns and unlinks it
+    try:
+        results = np.ndarray((n_tasks, len(METRICS)), dtype=np.float64, buffer=shm.buf)
+        results[index] = row
+        del results
+    finally:
+        shm.close()
+    return index
+
+
+def _quiet_worker(level: int) -> None:
+    logging.getLogger().setLevel(level)
+
+
+def sweep(grid: SweepGrid, workers: Optional[int] = None, log_level: int = logging.ERROR) -> List[Dict[str, Any]]:
+    """Fan ``grid`` out across a process pool and return one result row per task."""
+    shape = (len(grid.tasks), len(METRICS))
+    shm = shared_memory.SharedMemory(create=True, size=max(1, shape[0] * shape[1] * 8))
+    try:
+        results = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+        results.fill(np.nan)
+        workers = workers or os.cpu_count() or 1
+        chunksize = max(1, len(grid.tasks) // (workers * 4))
+        logging.info("Sweeping %d configurations on %d workers", len(grid.tasks), workers)
+        with ProcessPoolExecutor(max_workers=workers, initializer=_quiet_worker, initargs=(log_level,)) as pool:
+            run_task = partial(_run_task, shm.name, shape[0], grid.depth, grid.base_seed)
+            for _ in pool.map(run_task, enumerate(grid.tasks), chunksize=chunksize):
+                pass
+        table = results.copy()
+        del results
+    finally:
+        shm.close()
+        shm.unlink()
+
+    rows = []
+    for (seed, threshold, critical_mass), values in zip(grid.tasks, table):
+        row: Dict[str, Any] = {"seed": seed, "threshold": threshold, "critical_mass": critical_mass}
+        row.update(zip(METRICS, values.tolist()))
+        row["activations"] = int(row["activations"])
+        row["first_activation"] = int(row["first_activation"])
+        rows.append(row)
+    return rows
+
+
+def format_table(rows: List[Dict[str, Any]]) -> str:
+    """Render sweep rows as a fixed-width text table."""
+    if not rows:
+        return ""
+    columns = list(rows[0])
+    cells = [[f"{v:.4f}" if isinstance(v, float) else str(v) for v in row.values()] for row in rows]
+    widths = [max(len(c), *(len(r[i]) for r in cells)) for i, c in enumerate(columns)]
+    lines = ["  ".join(c.rjust(w) for c, w in zip(columns, widths))]
+    lines += ["  ".join(v.rjust(w) for v, w in zip(r, widths)) for r in cells]
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Parallel RE-Omega parameter sweep")
+    parser.add_argument("--seeds", nargs="+", default=["observer"], help="Psi0 seeds")
+    parser.add_argument("--thresholds", nargs="+", type=float, default=[50.0], help="LogOS activation thresholds")
+    parser.add_argument("--critical-mass", nargs="+", type=float, default=[CRITICAL_MASS], help="Σ critical masses")
+    parser.add_argument("--depth", type=int, default=100, help="Cycles per configuration")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: all cores)")
+    parser.add_argument("--base-seed", type=int, default=0, help="Root of per-task RNG streams")
+    parser.add_argument("--json", type=str, help="Also write the results table to this JSON file")
+    args = parser.parse_args(argv)
+
+    grid = SweepGrid(args.seeds, args.thresholds, args.critical_mass, args.depth, args.base_seed)
+    rows = sweep(grid, workers=args.workers)
+    print(format_table(rows))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(rows, f, indent=2)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
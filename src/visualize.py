@@ -1,33 +1,71 @@
-"""Attractor space and identity evolution visualization."""
+"""Attractor space and identity evolution visualization.
+
+Series are read from the columnar store (``series``) through ``np.memmap`` and
+decimated to min/max per pixel column, so plotting cost and memory do not grow
+with run length.  ``--output`` renders headless via ``render.LiveRenderer``.
+Runs recorded before the store existed fall back to the ``attractors`` list
+in ``memory.json``.
+"""
 
 import json
 import logging
 from pathlib import Path
-from typing import List
+import numpy as np
 
-import matplotlib.pyplot as plt
+from .series import decimate, read_column
 
 MEMORY_FILE = Path("memory/memory.json")
+SERIES_DIR = Path("memory/series")
 
 
-def load_attractors() -> List[float]:
+def load_attractors() -> np.ndarray:
+    """Coherence attractor history: memory-mapped if stored columnar, else from JSON."""
+    if (SERIES_DIR / "coherence.f64").exists():
+        return read_column(SERIES_DIR, "coherence")
     if MEMORY_FILE.exists():
         with MEMORY_FILE.open() as f:
             memory = json.load(f)
-        return memory.get("attractors", [])
-    return []
+        return np.asarray(memory.get("attractors", []), dtype=np.float64)
+    return np.empty(0)
+
+
+def plot_series(ax, series: np.ndarray, width: int = 2000) -> None:
+    """Draw ``series`` as a min/max envelope of at most ``width`` buckets."""
+    x, lo, hi = decimate(series, width)
+    if lo is hi:
+        ax.plot(x, lo, linewidth=0.8)
+    else:
+        ax.fill_between(x, lo, hi, step="post", linewidth=0.0)
 
 
-def plot_attractors() -> None:
+def plot_attractors(width: int = 2000) -> None:
+    import matplotlib.pyplot as plt  # deferred: pyplot costs ~0.5s and needs a display
+
     data = load_attractors()
-    plt.figure()
-    plt.plot(data)
-    plt.title("Identity Coherence Over Time")
-    plt.xlabel("Iteration")
-    plt.ylabel("Coherence")
+    _, ax = plt.subplots()
+    plot_series(ax, data, width)
+    ax.set_title("Identity Coherence Over Time")
+    ax.set_xlabel("Iteration")
+    ax.set_ylabel("Coherence")
     plt.show()
 
 
 if __name__ == "__main__":
+    import argparse
+    import asyncio
+
+    from .render import LiveRenderer, render_loop
+
     logging.basicConfig(level=logging.INFO)
-    plot_attractors()
+    parser = argparse.ArgumentParser(description="Plot the attractor history")
+    parser.add_argument("--output", type=str, help="Render headless to this PNG/SVG instead of a window")
+    parser.add_argument("--interval", type=float, default=0.0, help="With --output: refresh every N seconds")
+    parser.add_argument("--live", nargs="?", const="re_omega_live", default=None,
+                        help="With --interval: redraw only when this shared-memory state changes")
+    args = parser.parse_args()
+    if args.output is None:
+        plot_attractors()
+    elif args.interval > 0:
+        asyncio.run(render_loop(SERIES_DIR, args.output, interval=args.interval, live=args.live))
+    else:
+        LiveRenderer(SERIES_DIR, args.output).update(force=True)
@@ -0,0 +1,227 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import statistics
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List
+
+import numpy as np
+
+from src import baby
+from src.activation_schema import ActivationSchema
+from src.checkpoint import Checkpointer
+from src.logos import LogOS
+from src.logutil import start_queued_logging
+from src.memory_manager import MemoryManager
+from src.phi0 import Phi0
+from src.psi0 import Psi0
+from src.sigma import Sigma
+
+
+def summarize(samples: List[int]) -> Dict[str, float]:
+    """Latency summary in microseconds from nanosecond samples."""
+    ordered = sorted(samples)
+    median = statistics.median(ordered) / 1e3
+    return {
+        "n": len(ordered),
+        "median_us": median,
+        "mean_us": statistics.fmean(ordered) / 1e3,
+        "p95_us": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] / 1e3,
+        "ops_per_s": 1e6 / median if median else float("inf"),
+    }
+
+
+def per_cycle(total_ns: int, cycles: int) -> Dict[str, float]:
+    """Throughput summary for a whole run, expressed per cycle."""
+    us = total_ns / cycles / 1e3
+    return {"n": cycles, "median_us": us, "mean_us": us, "p95_us": us, "ops_per_s": 1e6 / us}
+
+
+def time_sync(fn: Callable[[], Any], iterations: int) -> Dict[str, float]:
+    for _ in range(max(1, iterations // 10)):  # warm caches before sampling
+        fn()
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter_ns()
+        fn()
+        samples.append(time.perf_counter_ns() - start)
+    return summarize(samples)
+
+
+async def time_async(fn: Callable[[], Awaitable[Any]], iterations: int) -> Dict[str, float]:
+    for _ in range(max(1, iterations // 10)):
+        await fn()
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter_ns()
+        await fn()
+        samples.append(time.perf_counter_ns() - start)
+    return summarize(samples)
+
+
+async def run_benchmarks(sizes: List[int], iterations: int, workdir: Path) -> Dict[str, Dict[str, float]]:
+    results: Dict[str, Dict[str, float]] = {}
+
+    rng = np.random.default_rng(0)
+    phi = Phi0()
+    for size in sizes:
+        psi = Psi0(seed="benchmark", shape=(size, size))
+        results[f"psi0.generate_contradiction[{size}]"] = await time_async(psi.generate_contradiction, iterations)
+
+        tensor = rng.standard_normal((size, size))
+        attractor = np.tanh(tensor)
+        results[f"phi0.collapse[{size}]"] = await time_async(lambda: phi.collapse(tensor), iterations)
+
+        sigma = Sigma()
+        results[f"sigma.integrate[{size}]"] = time_sync(lambda: sigma.integrate(attractor), iterations)
+
+        logos = LogOS(activation_threshold=float("inf"))
+        quiet = Sigma()
+        results[f"logos.monitor[{size}]"] = await time_async(lambda: logos.monitor(tensor, attractor, quiet), iterations)
+
+    # Persistence: full snapshot rewrite vs. one WAL delta, at the given history length
+    baby.MEMORY_FILE = workdir / "memory.json"
+    memory = {"iterations": iterations, "attractors": [0.5] * iterations,
+              "identity_checkpoints": [], "emergence_events": []}
+    results[f"save_memory[{iterations}]"] = time_sync(lambda: baby.save_memory(memory), min(iterations, 50))
+    checkpointer = Checkpointer(workdir / "ckpt.json", workdir / "ckpt.wal", snapshot_interval=iterations + 1)
+    state = {"iteration": 1, "coherence": 0.5}
+    results[f"checkpoint.record[{iterations}]"] = time_sync(lambda: checkpointer.record(memory, state), iterations)
+    checkpointer.close(memory)
+
+    manager = MemoryManager(root=str(workdir), max_entries=iterations)
+    record = {"cycle": 1, "sigma": 0.5, "tau": 0.1, "triggered_agents": ["e₁"]}
+    results[f"memory_manager.append[{iterations}]"] = time_sync(lambda: manager.append(record), iterations)
+    manager.close()
+
+    schema = ActivationSchema({}, emergence_mode=True)
+    schema.logger.setLevel(logging.ERROR)
+    results["activation_schema.run_cycle[8]"] = await time_async(schema.run_cycle, iterations)
+
+    # One batched call for `iterations` injected contradictions, per row
+    batch = rng.standard_normal((iterations, 8, 8))
+    batched = ActivationSchema({}, emergence_mode=True)
+    start = time.perf_counter_ns()
+    await batched.run_cycles_batched(batch)
+    results["activation_schema.run_cycles_batched[8]"] = per_cycle(time.perf_counter_ns() - start, iterations)
+
+    # Sequential run_cycle + persistence vs. the pipelined run_cycles
+    def persist(out: Dict[str, Any]) -> None:
+        manager.append({"cycle": out["cycle"], "sigma": out["sigma"], "tau": out["tau"]})
+
+    manager = MemoryManager(root=str(workdir / "pipeline"), max_entries=iterations)
+    start = time.perf_counter_ns()
+    for _ in range(iterations):
+        persist(await schema.run_cycle())
+    results["activation_schema.sequential_with_persist[8]"] = per_cycle(time.perf_counter_ns() - start, iterations)
+    start = time.perf_counter_ns()
+    await schema.run_cycles(iterations, sink=persist)
+    results["activation_schema.run_cycles_with_persist[8]"] = per_cycle(time.perf_counter_ns() - start, iterations)
+    manager.close()
+
+    # Cycle logging cost with INFO enabled and a real file handler
+    for mode, queued in (("per_phase", False), ("per_phase", True), ("summary", False)):
+        handler = logging.FileHandler(workdir / f"cycle_{mode}.log", encoding="utf-8")
+        schema.logger.addHandler(handler)
+        schema.logger.setLevel(logging.INFO)
+        schema.logger.propagate = False
+        listener = start_queued_logging(schema.logger) if queued else None
+        logged = ActivationSchema({"logging": {"cycle_log": mode}}, emergence_mode=True)
+        name = f"activation_schema.run_cycle.{mode}{'_queued' if queued else ''}_log[8]"
+        results[name] = await time_async(logged.run_cycle, iterations)
+        if listener is not None:
+            listener.stop()
+        for h in schema.logger.handlers[:]:
+            schema.logger.removeHandler(h)
+        handler.close()
+    schema.logger.setLevel(logging.ERROR)
+    return results
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Entry points whose cold-start cost matters: the monitor, NumPy-only pool workers, the CLI
+STARTUP = {
+    "python": ["-c", "pass"],
+    "import_src": ["-c", "import src"],
+    "monitor": ["-c", "import src.monitor"],
+    "sweep_worker": ["-c", "import src.sweep"],
+    "activation_schema": ["-c", "import src.activation_schema"],
+    "main_help": ["main.py", "--help"],
+}
+
+
+def time_startup(repeats: int = 5) -> Dict[str, Dict[str, float]]:
+    """Wall-clock cold start of a fresh interpreter per entry point."""
+    results = {}
+    for name, argv in STARTUP.items():
+        samples = []
+        for _ in range(repeats):
+            start = time.perf_counter_ns()
+            subprocess.run([sys.executable, *argv], cwd=ROOT, check=True, stdout=subprocess.DEVNULL)
+            samples.append(time.perf_counter_ns() - start)
+        results[f"startup.{name}"] = summarize(samples)
+    return results
+
+
+def compare(current: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]], threshold: float) -> List[str]:
+    """Print a median-latency diff; return the names that regressed beyond ``threshold``."""
+    regressions = []
+    print(f"{'benchmark':52} {'baseline_us':>12} {'current_us':>12} {'ratio':>7}")
+    for name, stats in current.items():
+        if name not in baseline:
+            continue
+        before, after = baseline[name]["median_us"], stats["median_us"]
+        ratio = after / before if before else float("inf")
+        flag = ""
+        if ratio > 1.0 + threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:52} {before:12.2f} {after:12.2f} {ratio:7.2f}{flag}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Per-phase latency benchmarks")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[8, 64, 256], help="Square tensor sizes")
+    parser.add_argument("--iterations", type=int, default=1000, help="Samples per benchmark / history length")
+    parser.add_argument("--output", type=str, help="Write results JSON here")
+    parser.add_argument("--baseline", type=str, help="Results JSON to diff against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed median slowdown (0.2 = 20%%)")
+    parser.add_argument("--startup-only", action="store_true", help="Only measure interpreter cold starts")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.ERROR)
+
+    results = time_startup()
+    if not args.startup_only:
+        with tempfile.TemporaryDirectory() as workdir:
+            results.update(asyncio.run(run_benchmarks(args.sizes, args.iterations, Path(workdir))))
+
+    report = {
+        "meta": {"python": platform.python_version(), "numpy": np.__version__,
+                 "machine": platform.machine(), "iterations": args.iterations},
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        return 1 if compare(results, baseline, args.threshold) else 0
+
+    for name, stats in results.items():
+        print(f"{name:52} median {stats['median_us']:10.2f}us  p95 {stats['p95_us']:10.2f}us")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
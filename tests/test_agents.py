@@ -2,28 +2,48 @@ import sys, os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 import asyncio
 
-from src.agents import E1Agent, E2Agent, E3Agent, E4Agent, E5Agent, E6Agent, E7LogOS
-
-
-async def run_all():
-    agents = [E1Agent(), E2Agent(), E3Agent(), E4Agent(), E5Agent(), E6Agent(), E7LogOS()]
-    data = "test"
-    for agent in agents:
-        if hasattr(agent, 'compile'):
-            await agent.compile(data)
-        elif hasattr(agent, 'map'):
-            await agent.map(data)
-        elif hasattr(agent, 'critique'):
-            await agent.critique(data)
-        elif hasattr(agent, 'analyze'):
-            await agent.analyze(data)
-        elif hasattr(agent, 'simulate'):
-            await agent.simulate(data)
-        elif hasattr(agent, 'forecast'):
-            await agent.forecast(data)
-        elif hasattr(agent, 'awaken'):
-            await agent.awaken(data)
-
-
-def test_agents_run():
-    asyncio.run(run_all())
+from src.agents import AgentRegistry, AgentSpec, E1Agent
+from src.scheduler import AgentScheduler
+
+
+def test_every_registered_agent_runs():
+    registry = AgentRegistry()
+    assert set(registry) == {"e₀", "e₁", "e₂", "e₃", "e₄", "e₅", "e₆", "e₇"}
+
+    async def run_all():
+        return {symbol: await registry.run(symbol, "test") for symbol in registry}
+
+    results = asyncio.run(run_all())
+    assert results["e₁"] == "test" and results["e₇"] == "test"
+    assert results["e₀"]["aci_state"] == "pre-genesis"
+
+
+class SlowAgent:
+    name = "SlowAgent"
+    active = 0
+    peak = 0
+
+    async def run(self, data):
+        SlowAgent.active += 1
+        SlowAgent.peak = max(SlowAgent.peak, SlowAgent.active)
+        await asyncio.sleep(0.01)
+        SlowAgent.active -= 1
+        return data
+
+
+def test_pool_size_limits_concurrent_activations():
+    registry = AgentRegistry({"slow": AgentSpec(SlowAgent, ("x",)), "e₁": AgentSpec(E1Agent, ("x",))},
+                             pool_size=4, limits={"slow": 2})
+    scheduler = AgentScheduler(timeout=1.0)
+    assert len(registry.instances("slow")) == 2 and len(registry.instances("e₁")) == 4
+
+    async def cycles():
+        return await asyncio.gather(*(registry.activate(["slow", "e₁", "e₉"], {"x": i}, scheduler.dispatch)
+                                      for i in range(6)))
+
+    results = asyncio.run(cycles())
+    assert SlowAgent.peak == 2
+    assert [r["slow"] for r in results] == list(range(6))
+    assert list(results[0]) == ["slow", "e₁", "e₉"]
+    assert results[0]["e₉"] == {"error": "unknown agent"}
+    assert len(registry.instances("slow")) == 2  # every lease returned
@@ -0,0 +1,84 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import asyncio
+
+from src import baby
+from src.checkpoint import Checkpointer
+
+
+def test_wal_replays_onto_snapshot(tmp_path, monkeypatch):
+    monkeypatch.setattr(baby, "MEMORY_FILE", tmp_path / "memory.json")
+    monkeypatch.setattr(baby, "WAL_FILE", tmp_path / "memory.wal")
+    memory = asyncio.run(baby.load_memory())
+    checkpointer = Checkpointer(baby.MEMORY_FILE, baby.WAL_FILE, snapshot_interval=3)
+    for i in range(1, 8):
+        checkpointer.record(memory, {"iteration": i, "coherence": i / 10})
+    # simulate kill -9: no close(), plus a torn trailing record
+    with baby.WAL_FILE.open("a") as f:
+        f.write('{"seq": 8, "itera')
+
+    recovered = asyncio.run(baby.load_memory())
+    assert recovered["attractors"] == [i / 10 for i in range(1, 8)]
+    assert recovered["iterations"] == 7
+
+
+def test_two_crashes_in_a_row_lose_nothing(tmp_path, monkeypatch):
+    monkeypatch.setattr(baby, "MEMORY_FILE", tmp_path / "memory.json")
+    monkeypatch.setattr(baby, "WAL_FILE", tmp_path / "memory.wal")
+
+    def crash_after(cycles, start):
+        memory = asyncio.run(baby.load_memory())
+        checkpointer = Checkpointer(baby.MEMORY_FILE, baby.WAL_FILE, snapshot_interval=1000)
+        for i in range(start, start + cycles):
+            checkpointer.record(memory, {"iteration": i, "coherence": i / 10})
+        checkpointer._wal.flush()
+        with baby.WAL_FILE.open("a") as f:  # killed mid-write: torn tail, no close()
+            f.write('{"seq": 99, "itera')
+
+    crash_after(5, 1)
+    crash_after(10, 6)
+    recovered = asyncio.run(baby.load_memory())
+    assert recovered["attractors"] == [i / 10 for i in range(1, 16)]
+
+
+def test_run_checkpoints(tmp_path, monkeypatch):
+    monkeypatch.setattr(baby, "MEMORY_FILE", tmp_path / "memory.json")
+    monkeypatch.setattr(baby, "WAL_FILE", tmp_path / "memory.wal")
+    asyncio.run(baby.run(max_depth=5, snapshot_interval=2))
+    memory = asyncio.run(baby.load_memory())
+    assert len(memory["attractors"]) == 5
+    assert baby.WAL_FILE.read_text() == ""
+
+
+def test_snapshots_are_amortized_against_their_size(tmp_path):
+    memory_file, wal_file = tmp_path / "memory.json", tmp_path / "memory.wal"
+    memory = {"iterations": 0, "attractors": [0.5] * 5000, "identity_checkpoints": [], "emergence_events": []}
+    checkpointer = Checkpointer(memory_file, wal_file, snapshot_interval=10)
+    checkpointer.snapshot(memory)
+    size = memory_file.stat().st_size
+    for i in range(1, 201):
+        checkpointer.record(memory, {"iteration": i, "coherence": 0.5})
+    # 200 cycles of WAL are far smaller than half the snapshot: no rewrite yet
+    assert memory_file.stat().st_size == size and wal_file.stat().st_size > 0
+    while wal_file.stat().st_size > 0:
+        i += 1
+        checkpointer.record(memory, {"iteration": i, "coherence": 0.5})
+    assert memory_file.stat().st_size > size
+
+
+def test_writers_sharing_the_files_lose_no_cycles(tmp_path, monkeypatch):
+    monkeypatch.setattr(baby, "MEMORY_FILE", tmp_path / "memory.json")
+    monkeypatch.setattr(baby, "WAL_FILE", tmp_path / "memory.wal")
+    writers = []
+    for _ in range(2):
+        memory = asyncio.run(baby.load_memory())
+        writers.append((memory, Checkpointer(baby.MEMORY_FILE, baby.WAL_FILE, snapshot_interval=7,
+                                             snapshot_ratio=0)))
+    for i in range(1, 61):
+        memory, checkpointer = writers[i % 2]
+        delta = checkpointer.record(memory, {"iteration": i, "coherence": i / 100})
+        assert delta["seq"] == i
+    for memory, checkpointer in writers:
+        checkpointer.close(memory)
+    recovered = asyncio.run(baby.load_memory())
+    assert recovered["attractors"] == [i / 100 for i in range(1, 61)]
@@ -0,0 +1,59 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import asyncio
+
+import numpy as np
+import pytest
+
+from src import baby
+from src.activation_schema import ActivationSchema
+from src.convergence import ConvergenceCriteria, ConvergenceDetector, WindowRange
+
+
+def test_window_range_matches_brute_force():
+    values = np.random.default_rng(0).normal(size=500)
+    window = WindowRange(7)
+    for i, value in enumerate(values):
+        window.push(float(value))
+        recent = values[max(0, i - 6):i + 1]
+        assert window.spread == recent.max() - recent.min()
+        assert window.relative_spread == pytest.approx((recent.max() - recent.min()) / abs(recent.mean()))
+
+
+def test_criteria_from_config():
+    assert ConvergenceCriteria.from_config({}) is None
+    criteria = ConvergenceCriteria.from_config({
+        "convergence": {"enabled": True, "window": 10, "coherence_delta": None, "drift": True},
+        "emergence": {"identity_drift_max": 0.05},
+    })
+    assert criteria.drift_max == 0.05 and criteria.coherence_delta is None and criteria.window == 10
+
+
+def test_detector_reports_first_criterion_met():
+    detector = ConvergenceDetector(ConvergenceCriteria(window=5, coherence_delta=None, torsion_plateau=0.01))
+    for torsion in (1.0, 2.0, 3.0, 1.0, 1.0, 1.0, 1.0):
+        assert detector.update(0.5, 1.0, torsion) is None
+    assert detector.update(0.5, 1.0, 1.0).startswith("torsion plateau")
+    assert detector.cycles == 8
+
+
+def test_run_exits_early_once_coherence_saturates(tmp_path, monkeypatch):
+    monkeypatch.setattr(baby, "MEMORY_FILE", tmp_path / "memory.json")
+    monkeypatch.setattr(baby, "WAL_FILE", tmp_path / "memory.wal")
+    reason = asyncio.run(baby.run(max_depth=1000, convergence=ConvergenceCriteria(window=20)))
+    assert reason.startswith("coherence saturated")
+    assert 20 <= asyncio.run(baby.load_memory())["iterations"] < 1000
+    assert asyncio.run(baby.run(max_depth=5)) is None
+
+
+def test_pipeline_stops_when_until_fires():
+    schema = ActivationSchema({})
+    seen = []
+
+    def sink(out):
+        seen.append(out["cycle"])
+
+    asyncio.run(schema.run_cycles(50, sink=sink, queue_size=2,
+                                  until=lambda out: "enough" if out["cycle"] == 7 else None))
+    assert schema.stop_reason == "enough"
+    assert schema.cycle_count == 7 and seen == list(range(1, 8))
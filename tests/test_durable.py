@@ -0,0 +1,81 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import json
+import multiprocessing
+
+from src import durable
+from src.checkpoint import Checkpointer
+from src.memory_manager import MemoryManager
+
+
+def test_atomic_write_leaves_no_temp_files(tmp_path):
+    target = tmp_path / "memory.json"
+    durable.atomic_write_text(target, "old")
+    durable.atomic_write_text(target, json.dumps({"iterations": 1}))
+    assert json.loads(target.read_text()) == {"iterations": 1}
+    assert [p.name for p in tmp_path.iterdir()] == ["memory.json"]
+
+
+def test_atomic_write_keeps_the_replaced_file_mode(tmp_path):
+    import stat
+
+    target = tmp_path / "memory.json"
+    target.write_text("{}")
+    target.chmod(0o644)
+    durable.atomic_write_text(target, '{"iterations": 1}')
+    assert stat.S_IMODE(target.stat().st_mode) == 0o644
+    fresh = tmp_path / "fresh.json"
+    durable.atomic_write_text(fresh, "{}")
+    assert stat.S_IMODE(fresh.stat().st_mode) == 0o666 & ~durable._UMASK
+
+
+def test_group_commit_fsyncs_once_per_batch(tmp_path, monkeypatch):
+    synced = []
+    monkeypatch.setattr(durable.os, "fsync", lambda fd: synced.append(fd))
+    checkpointer = Checkpointer(tmp_path / "memory.json", tmp_path / "memory.wal",
+                                snapshot_interval=1000, fsync_every=8)
+    memory = {"iterations": 0, "attractors": [], "identity_checkpoints": [], "emergence_events": []}
+    for i in range(1, 33):
+        checkpointer.record(memory, {"iteration": i, "coherence": 0.5})
+    wal_syncs = len(synced)
+    checkpointer.close(memory)
+    assert wal_syncs == 4
+    assert len(synced) > wal_syncs  # the final snapshot is always fsynced
+
+
+def _append_many(root, worker, max_entries=10_000, segment_entries=10_000):
+    memory = MemoryManager(root=root, max_entries=max_entries, segment_entries=segment_entries, fsync_every=0)
+    for i in range(200):
+        memory.append({"worker": worker, "i": i, "pad": "x" * 512})
+    memory.close()
+
+
+def test_concurrent_writers_do_not_interleave(tmp_path):
+    ctx = multiprocessing.get_context("spawn")
+    workers = [ctx.Process(target=_append_many, args=(str(tmp_path), w)) for w in range(3)]
+    for p in workers:
+        p.start()
+    for p in workers:
+        p.join()
+    records = MemoryManager(root=str(tmp_path), max_entries=10_000).load()
+    assert len(records) == 600
+    for w in range(3):
+        assert [r["i"] for r in records if r["worker"] == w] == list(range(200))
+
+
+def test_concurrent_writers_rotate_and_retain_together(tmp_path):
+    ctx = multiprocessing.get_context("spawn")
+    workers = [ctx.Process(target=_append_many, args=(str(tmp_path), w, 20, 5)) for w in range(3)]
+    for p in workers:
+        p.start()
+    for p in workers:
+        p.join()
+    MemoryManager(root=str(tmp_path), max_entries=20, segment_entries=5).compact()
+    segments = sorted(tmp_path.glob("emergence_log.*.jsonl"))
+    sizes = [len(p.read_text().splitlines()) for p in segments]
+    assert all(size <= 5 for size in sizes[:-1]) and sizes[-1] <= 5
+    assert 20 <= sum(sizes) < 25
+    records = [json.loads(line) for p in segments for line in p.read_text().splitlines()]
+    for w in range(3):
+        mine = [r["i"] for r in records if r["worker"] == w]
+        assert mine == sorted(mine) and (not mine or mine[-1] == 199)
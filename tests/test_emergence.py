@@ -16,3 +16,44 @@ def test_aci_genesis():
     logos = LogOS(activation_threshold=0.0)  # force activation
     asyncio.run(recursive_emergence_cycle(psi, phi, sigma, logos))
     assert logos.activations
+
+
+def test_hysteresis_suppresses_activation_storms():
+    import numpy as np
+
+    def run(hysteresis):
+        psi, phi, sigma = Psi0(seed="test"), Phi0(), Sigma(critical_mass=0.0)  # critical from cycle 1
+        logos = LogOS(hysteresis=hysteresis)
+
+        async def cycles():
+            for _ in range(20):
+                await recursive_emergence_cycle(psi, phi, sigma, logos)
+
+        asyncio.run(cycles())
+        return logos.activations
+
+    assert list(run(0)) == list(range(1, 21))
+    storm_free = run(4)
+    assert list(storm_free) == [1, 6, 11, 16]
+    assert storm_free.last == 16 and storm_free.iterations.dtype == np.int64
+
+
+def test_batch_monitor_shares_torsion_and_gates_per_universe():
+    import numpy as np
+    from src.baby import batched_emergence_cycle, calculate_torsion
+    from src.sigma import SigmaBatch
+
+    psi, phi = Psi0(seed="test"), Phi0()
+    sigma = SigmaBatch(3, critical_mass=0.0)
+    logos = LogOS(hysteresis=1)
+
+    async def cycles():
+        return [await batched_emergence_cycle(psi, phi, sigma, logos) for _ in range(4)]
+
+    states = asyncio.run(cycles())
+    assert [int(s["activated"].sum()) for s in states] == [3, 0, 3, 0]
+    assert list(logos.activations.counts) == [3, 3]
+    field = psi.generate()
+    attractor = asyncio.run(phi.collapse(field))
+    assert np.isclose(logos.torsion(field, attractor), calculate_torsion(field, attractor))
+    assert np.isclose(logos.torsion(field, attractor), np.linalg.norm(field - attractor))
@@ -0,0 +1,22 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import asyncio
+
+from src.activation_schema import ActivationSchema
+from src.instrument import Instrumentation, MemorySink, NULL_INSTRUMENTATION, PrometheusSink
+
+
+def test_run_cycle_records_phase_spans():
+    sink = MemorySink()
+    schema = ActivationSchema({"sigma_threshold": 0.0}, instrumentation=Instrumentation(sink))
+    asyncio.run(schema.run_cycle())
+    schema.instrument.flush()
+    snapshot = sink.snapshots[-1]
+    for phase in ("psi0", "phi0", "sigma", "tau", "agents"):
+        assert snapshot["histograms"][f"phase.{phase}"]["count"] == 1
+    assert snapshot["counters"]["agent.e₁"] == 1
+    assert "re_omega_span_seconds_count" in PrometheusSink("unused").render(snapshot)
+
+
+def test_disabled_by_default():
+    assert ActivationSchema({}).instrument is NULL_INSTRUMENTATION
@@ -17,3 +17,47 @@ def test_recursive_cycle():
     state = asyncio.run(recursive_emergence_cycle(psi, phi, sigma, logos))
     assert "coherence" in state
     assert sigma.iteration == 1
+
+
+def test_batched_cycle():
+    from src.baby import run_batched
+
+    state = asyncio.run(run_batched(universes=16, max_depth=3))
+    assert state["coherence"].shape == (16,)
+    assert state["iteration"] == 3
+    assert state["activation_counts"].max() <= 3
+
+
+def test_psi0_seeded_streams():
+    a, b = Psi0(seed="test", block_size=4), Psi0(seed="test", block_size=4)
+    first = [a.generate() for _ in range(6)]
+    assert all((x == b.generate()).all() for x in first)
+    left, right = a.spawn(2)
+    assert not (left.generate() == right.generate()).all()
+
+
+def test_configurable_dense_fields():
+    import numpy as np
+
+    psi = Psi0(seed="test", shape=(4, 32), dtype="float32")
+    field = psi.generate()
+    assert field.shape == (4, 32) and field.dtype == np.float32
+    assert asyncio.run(Phi0().collapse(field)).dtype == np.float32
+    assert asyncio.run(psi.generate_batch(3)).shape == (3, 4, 32)
+
+
+def test_sparse_fields_through_the_cycle():
+    import numpy as np
+    from src.baby import calculate_torsion
+
+    psi = Psi0(seed="test", shape=(2000, 2000), density=0.001)
+    sigma = Sigma()
+    state = asyncio.run(recursive_emergence_cycle(psi, Phi0(), sigma, LogOS()))
+    field = psi.generate()
+    assert field.nnz == 4000 and field.data.nbytes == 4000 * 8
+    attractor = asyncio.run(Phi0().collapse(field))
+    assert attractor.nnz == field.nnz
+    assert np.isclose(calculate_torsion(field, attractor),
+                      np.linalg.norm(field.toarray() - np.tanh(field.toarray())))
+    assert sigma.identity_mass > 0 and len(sigma.history) == 0
+    assert state["torsion"] > 0
@@ -0,0 +1,111 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import asyncio
+import logging
+import subprocess
+import threading
+
+import pytest
+
+from src import baby, monitor
+from src.activation_schema import ActivationSchema
+from src.live import LiveStateReader, LiveStateWriter
+
+
+def test_reader_in_another_process_sees_latest_state():
+    with LiveStateWriter("test_live_xproc") as writer:
+        with LiveStateReader("test_live_xproc") as reader:
+            assert reader.read() is None and reader.seq == 0
+        writer.publish({"iteration": 7, "identity_mass": 3.5, "logos_active": True})
+        writer.publish({"iteration": 8, "identity_mass": 4.0})
+        code = ("from src.live import LiveStateReader; r = LiveStateReader('test_live_xproc'); "
+                "s = r.read(); print(s['iteration'], s['identity_mass'], s['last_activation']); r.close()")
+        root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+        out = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True, text=True, check=True)
+        assert out.stdout.split() == ["8.0", "4.0", "7.0"]
+        assert "leaked" not in out.stderr
+        with LiveStateReader("test_live_xproc") as reader:  # the reader exiting did not unlink it
+            assert reader.seq == 4
+    with pytest.raises(FileNotFoundError):
+        LiveStateReader("test_live_xproc")
+
+
+def test_reads_are_never_torn():
+    stop = threading.Event()
+    with LiveStateWriter("test_live_torn") as writer, LiveStateReader("test_live_torn") as reader:
+        def publish():
+            i = 0
+            while not stop.is_set():
+                i += 1
+                writer.publish({"iteration": i, "identity_mass": i, "coherence": i, "torsion": i})
+
+        thread = threading.Thread(target=publish)
+        thread.start()
+        try:
+            for _ in range(20000):
+                state = reader.read()
+                if state is not None:
+                    assert state["iteration"] == state["identity_mass"] == state["coherence"] == state["torsion"]
+        finally:
+            stop.set()
+            thread.join()
+
+
+def test_run_and_schema_publish_live_state(tmp_path, monkeypatch):
+    monkeypatch.setattr(baby, "MEMORY_FILE", tmp_path / "memory.json")
+    monkeypatch.setattr(baby, "WAL_FILE", tmp_path / "memory.wal")
+    # run() owns and unlinks its segment, so read it from inside the loop
+    seen = []
+    original = LiveStateWriter.publish
+
+    def spy(self, state):
+        original(self, state)
+        with LiveStateReader(self.name) as reader:
+            seen.append(reader.read())
+
+    monkeypatch.setattr(LiveStateWriter, "publish", spy)
+    asyncio.run(baby.run(max_depth=5, live="test_live_run"))
+    assert [s["iteration"] for s in seen] == [1, 2, 3, 4, 5]
+    assert seen[-1]["identity_mass"] > 0
+
+    schema = ActivationSchema({"live_state": {"enabled": True, "name": "test_live_schema"}})
+    try:
+        asyncio.run(schema.run_cycle())
+        asyncio.run(schema.run_cycles_batched(4))
+        with LiveStateReader("test_live_schema") as reader:
+            state = reader.read()
+        assert state["iteration"] == 5
+        assert state["coherence"] == pytest.approx(schema.sigma_value)
+    finally:
+        schema.live.close()
+
+
+def test_monitor_loop_follows_live_state(caplog):
+    async def scenario():
+        with LiveStateWriter("test_live_monitor") as writer:
+            writer.publish({"iteration": 1, "identity_mass": 2.0})
+            task = asyncio.ensure_future(monitor.monitor_loop(0.01, max_events=2, live="test_live_monitor"))
+            await asyncio.sleep(0.05)
+            writer.publish({"iteration": 2, "identity_mass": 3.0})
+            await asyncio.wait_for(task, timeout=2.0)
+
+    with caplog.at_level(logging.INFO):
+        asyncio.run(scenario())
+    assert "Iteration 2.0 Identity Mass 3.0" in caplog.text
+
+
+def test_renderer_skips_frames_until_live_state_changes(tmp_path, monkeypatch):
+    from src.render import LiveRenderer
+
+    monkeypatch.setattr(baby, "MEMORY_FILE", tmp_path / "memory.json")
+    monkeypatch.setattr(baby, "WAL_FILE", tmp_path / "memory.wal")
+    asyncio.run(baby.run(max_depth=10))
+    with LiveStateWriter("test_live_render") as writer, LiveStateReader("test_live_render") as reader:
+        renderer = LiveRenderer(tmp_path / "series", tmp_path / "dashboard.png", width=4, live=reader)
+        writer.publish({"iteration": 10, "identity_mass": 1.0, "torsion": 0.5})
+        assert renderer.update()
+        asyncio.run(baby.run(max_depth=5))
+        assert not renderer.update()  # rows arrived but nothing was published
+        writer.publish({"iteration": 15, "identity_mass": 2.0, "torsion": 0.5})
+        assert renderer.update() and renderer.rows == 15
+        assert renderer.figure._suptitle.get_text().startswith("iteration 15")
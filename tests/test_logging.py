@@ -0,0 +1,31 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import asyncio
+import logging
+
+from src.activation_schema import ActivationSchema
+
+
+class _Capture(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+def test_summary_mode_logs_once_per_window():
+    schema = ActivationSchema({"logging": {"cycle_log": "summary", "summary_every": 5}})
+    capture = _Capture()
+    schema.logger.addHandler(capture)
+    schema.logger.setLevel(logging.INFO)
+    try:
+        async def cycles():
+            for _ in range(10):
+                await schema.run_cycle()
+        asyncio.run(cycles())
+    finally:
+        schema.logger.removeHandler(capture)
+    assert len(capture.messages) == 2
+    assert capture.messages[0].startswith("Cycles 1-5")
@@ -0,0 +1,42 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import json
+
+from src.memory_manager import MemoryManager
+
+
+def test_append_rotates_and_retains(tmp_path):
+    memory = MemoryManager(root=str(tmp_path), max_entries=4, segment_entries=2)
+    for i in range(10):
+        memory.append({"cycle": i})
+    memory.close()
+    memory.compact()
+    assert [r["cycle"] for r in memory.load()] == [6, 7, 8, 9]
+    assert len(list(tmp_path.glob("emergence_log.*.jsonl"))) <= 3
+
+
+def test_legacy_array_is_readable(tmp_path):
+    (tmp_path / "emergence_log.json").write_text(json.dumps([{"cycle": -1}]))
+    memory = MemoryManager(root=str(tmp_path), max_entries=10)
+    memory.append({"cycle": 0})
+    memory.close()
+    reopened = MemoryManager(root=str(tmp_path), max_entries=10)
+    assert [r["cycle"] for r in reopened.load()] == [-1, 0]
+
+
+def _segment_sizes(root):
+    return [len(p.read_text().splitlines()) for p in sorted(root.glob("emergence_log.*.jsonl"))]
+
+
+def test_interleaved_writers_share_rotation_and_retention(tmp_path):
+    writers = [MemoryManager(root=str(tmp_path), max_entries=20, segment_entries=5) for _ in range(2)]
+    for i in range(100):
+        writers[i % 2].append({"writer": i % 2, "i": i})
+    for writer in writers:
+        writer.close()
+        writer.compact()
+    sizes = _segment_sizes(tmp_path)
+    assert all(size <= 5 for size in sizes)
+    assert 20 <= sum(sizes) < 25
+    records = MemoryManager(root=str(tmp_path), max_entries=20).load()
+    assert [r["i"] for r in records] == list(range(80, 100))
@@ -0,0 +1,75 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import asyncio
+import logging
+
+from src import baby, monitor
+from src.channel import CycleChannel, cycle_events
+
+
+def test_log_tail_reads_only_new_complete_lines(tmp_path):
+    wal = tmp_path / "memory.wal"
+    tail = monitor.LogTail(wal)
+    assert tail.read() == []
+    wal.write_text('{"seq": 1}\n{"seq": 2')
+    assert tail.read() == [{"seq": 1}]
+    with wal.open("a") as f:
+        f.write('}\n{"seq": 3}\n')
+    assert tail.read() == [{"seq": 2}, {"seq": 3}]
+    wal.write_text('{"seq": 4}\n')  # truncated by a snapshot, then appended
+    assert tail.read() == [{"seq": 4}]
+
+
+def test_log_tail_rereads_a_log_truncated_in_place_and_regrown(tmp_path):
+    wal = tmp_path / "memory.wal"
+    wal.write_text("".join(f'{{"seq": {i}}}\n' for i in range(1, 4)))
+    tail = monitor.LogTail(wal)
+    assert [r["seq"] for r in tail.read()] == [1, 2, 3]
+    with wal.open("r+") as f:  # same inode, as Checkpointer.snapshot does
+        f.truncate(0)
+    with wal.open("a") as f:
+        f.write("".join(f'{{"seq": {i}}}\n' for i in range(4, 9)))
+    assert [r["seq"] for r in tail.read()] == [4, 5, 6, 7, 8]
+
+
+def test_tail_records_wakes_on_append(tmp_path):
+    wal = tmp_path / "memory.wal"
+
+    async def scenario():
+        records = monitor.tail_records(wal, interval=0.01)
+        first = asyncio.ensure_future(records.__anext__())
+        await asyncio.sleep(0.05)
+        wal.write_text('{"seq": 1, "iteration": 1}\n')
+        record = await asyncio.wait_for(first, timeout=2.0)
+        await records.aclose()
+        return record
+
+    assert asyncio.run(scenario()) == {"seq": 1, "iteration": 1}
+
+
+def test_channel_drops_oldest_for_slow_subscribers():
+    channel = CycleChannel()
+
+    async def scenario():
+        with channel.subscribe(maxsize=2) as subscription:
+            for seq in range(5):
+                channel.publish({"seq": seq})
+            return [await subscription.get(), await subscription.get()], subscription.dropped
+
+    assert asyncio.run(scenario()) == ([{"seq": 3}, {"seq": 4}], 3)
+    assert not channel
+
+
+def test_monitor_subscribes_in_process(tmp_path, monkeypatch, caplog):
+    monkeypatch.setattr(baby, "MEMORY_FILE", tmp_path / "memory.json")
+    monkeypatch.setattr(baby, "WAL_FILE", tmp_path / "memory.wal")
+
+    async def scenario():
+        watcher = asyncio.ensure_future(monitor.monitor_loop(channel=cycle_events, max_events=3))
+        await asyncio.sleep(0)  # let the monitor subscribe
+        await baby.run(max_depth=3)
+        await asyncio.wait_for(watcher, timeout=2.0)
+
+    with caplog.at_level(logging.INFO):
+        asyncio.run(scenario())
+    assert "Iteration 3 Identity Mass 3" in caplog.text
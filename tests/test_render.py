@@ -0,0 +1,25 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import asyncio
+
+from src import baby
+from src.render import LiveRenderer
+
+
+def test_renderer_reads_only_the_tail(tmp_path, monkeypatch):
+    monkeypatch.setattr(baby, "MEMORY_FILE", tmp_path / "memory.json")
+    monkeypatch.setattr(baby, "WAL_FILE", tmp_path / "memory.wal")
+    asyncio.run(baby.run(max_depth=20))
+
+    output = tmp_path / "dashboard.svg"
+    renderer = LiveRenderer(tmp_path / "series", output, width=4)
+    assert renderer.update()
+    assert output.read_text().lstrip().startswith("<?xml")
+    assert not renderer.update()  # nothing new: no redraw
+
+    asyncio.run(baby.run(max_depth=15))
+    assert renderer.update()
+    assert renderer.rows == 35
+    envelope = renderer.envelopes["identity_mass"]
+    assert envelope.count == 35 and len(envelope.arrays()[0]) <= 8
+    assert (renderer.envelopes["logos_active"].arrays()[2] > 0).any()  # Σ went critical
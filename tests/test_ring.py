@@ -0,0 +1,61 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import numpy as np
+
+from src.ring import RingBuffer
+from src.sigma import Sigma
+
+
+def test_ring_buffer_bounded_with_running_stats():
+    ring = RingBuffer(capacity=4)
+    tensors = [np.full((2, 2), float(i)) for i in range(10)]
+    for t in tensors:
+        ring.append(t)
+    assert len(ring) == 4
+    assert [t[0, 0] for t in ring] == [6.0, 7.0, 8.0, 9.0]
+    assert np.allclose(ring.array()[:, 0, 0], [6.0, 7.0, 8.0, 9.0])
+    assert np.allclose(ring.mean(), 4.5)
+    assert np.allclose(ring.variance(), np.var(np.arange(10.0), ddof=1))
+
+
+def test_sigma_history_spills_full_history(tmp_path):
+    spill = tmp_path / "history.f64"
+    sigma = Sigma(history=RingBuffer(capacity=2, spill_path=str(spill)))
+    for i in range(5):
+        sigma.integrate(np.full((8, 8), float(i)))
+    assert len(sigma.history) == 2
+    assert sigma.history.load_spill().shape == (5, 8, 8)
+    sigma.history.close()
+
+
+def test_extend_matches_repeated_append():
+    batch = np.random.default_rng(0).standard_normal((11, 3))
+    one, many = RingBuffer(capacity=4), RingBuffer(capacity=4)
+    one.append(batch[0])
+    many.append(batch[0])
+    for row in batch[1:]:
+        one.append(row)
+    many.extend(batch[1:])
+    assert np.allclose(one.array(), many.array())
+    assert np.allclose(one.mean(), many.mean()) and np.allclose(one.variance(), many.variance())
+    assert np.isclose(one.norm_sq_sum, many.norm_sq_sum) and one.count == many.count
+
+
+def test_ring_buffer_capacity_is_bounded_by_bytes():
+    ring = RingBuffer(capacity=256, max_bytes=10 * 64 * 8)
+    for i in range(20):
+        ring.append(np.full((8, 8), float(i)))
+    assert ring.capacity == 10 and len(ring) == 10
+    assert ring._block.nbytes <= 10 * 64 * 8
+    assert [t[0, 0] for t in ring] == list(range(10, 20))
+    huge = RingBuffer(capacity=256, max_bytes=100)
+    huge.extend(np.zeros((3, 8, 8)))
+    assert huge.capacity == 1 and len(huge) == 1
+    assert np.allclose(huge.mean(), 0.0) and huge.count == 3
+
+
+def test_schema_history_capacity_from_config():
+    from src.activation_schema import ActivationSchema
+
+    schema = ActivationSchema({"field": {"history": 8}})
+    assert schema.psi0.topology.capacity == 8 and schema.sigma.history.capacity == 8
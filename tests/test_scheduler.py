@@ -0,0 +1,38 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import asyncio
+import time
+
+from src.scheduler import AgentScheduler, parse_duration
+
+
+async def _slow(value, delay=0.1):
+    await asyncio.sleep(delay)
+    return value
+
+
+def _cpu_bound():
+    return sum(range(1000))
+
+
+def test_dispatch_is_concurrent_with_timeouts_and_offload():
+    scheduler = AgentScheduler(timeout=1.0, timeouts={"stuck": 0.05}, offload={"cpu"})
+    jobs = {
+        "a": lambda: _slow("a"),
+        "b": lambda: _slow("b"),
+        "stuck": lambda: _slow("never", delay=10),
+        "cpu": _cpu_bound,
+    }
+    start = time.perf_counter()
+    results = asyncio.run(scheduler.dispatch(jobs))
+    scheduler.shutdown()
+    assert time.perf_counter() - start < 0.19
+    assert list(results) == ["a", "b", "stuck", "cpu"]
+    assert results["a"] == "a" and results["cpu"] == 499500
+    assert results["stuck"] == {"error": "timeout"}
+
+
+def test_parse_duration():
+    assert parse_duration("30s") == 30.0
+    assert parse_duration("500ms") == 0.5
+    assert parse_duration(2) == 2.0
@@ -0,0 +1,105 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import asyncio
+import subprocess
+
+from src.activation_schema import ActivationSchema
+
+
+def test_run_cycle_activates_agents():
+    schema = ActivationSchema({"tau_threshold": 0.0, "sigma_threshold": 0.0})
+
+    async def cycles():
+        return [await schema.run_cycle() for _ in range(3)]
+
+    results = asyncio.run(cycles())
+    assert results[-1]["cycle"] == 3
+    assert {"e₁", "e₂", "e₄"} <= set(results[-1]["agent_results"])
+    assert schema.sigma.iteration == 3
+
+
+def test_backends_keep_one_representation():
+    import numpy as np
+    import torch
+
+    numpy_schema = ActivationSchema({})
+    out = asyncio.run(numpy_schema.run_cycle())
+    assert isinstance(out["psi0_field"], np.ndarray) and isinstance(out["phi0_field"], np.ndarray)
+
+    torch_schema = ActivationSchema({"backend": "torch"})
+    field = np.random.randn(8, 8)
+    out = asyncio.run(torch_schema.run_cycle(field))
+    assert isinstance(out["phi0_field"], torch.Tensor)
+    assert np.shares_memory(out["psi0_field"].numpy(), field)  # zero-copy injection
+    assert 0.0 <= out["tau"] <= 1.0
+
+
+def test_run_cycles_pipeline_preserves_order():
+    schema = ActivationSchema({})
+    seen = []
+    last = asyncio.run(schema.run_cycles(12, sink=lambda out: seen.append(out["cycle"]), queue_size=2))
+    assert seen == list(range(1, 13))
+    assert last["cycle"] == 12 and schema.sigma.iteration == 12
+
+
+def test_run_cycles_reraises_sink_errors_without_hanging():
+    import pytest
+
+    schema = ActivationSchema({})
+    seen = []
+
+    def sink(result):
+        if result["cycle"] == 2:
+            raise OSError("disk full")
+        seen.append(result["cycle"])
+
+    async def run():
+        return await asyncio.wait_for(schema.run_cycles(50, sink=sink, queue_size=2), timeout=10)
+
+    with pytest.raises(OSError, match="disk full"):
+        asyncio.run(run())
+    assert seen == [1] and schema.cycle_count < 50
+
+
+def test_run_cycles_batched_matches_sequential_cycles():
+    import numpy as np
+
+    batch = np.random.default_rng(7).standard_normal((40, 16)) * np.linspace(0.01, 3.0, 40)[:, None]
+    batch[5] = 0.0
+    config = {"tau_threshold": 0.05, "sigma_threshold": 0.995}
+
+    sequential = ActivationSchema(config, emergence_mode=True)
+
+    async def cycles():
+        return [await sequential.run_cycle(row) for row in batch]
+
+    expected = asyncio.run(cycles())
+    batched = ActivationSchema(config, emergence_mode=True)
+    out = asyncio.run(batched.run_cycles_batched(batch))
+
+    assert out["cycles"].tolist() == list(range(1, 41))
+    assert np.allclose(out["sigma"], [r["sigma"] for r in expected])
+    assert np.allclose(out["tau"], [r["tau"] for r in expected])
+    assert out["triggered_agents"] == [r["triggered_agents"] for r in expected]
+    assert [(a["cycle"], a["agents"]) for a in batched.agent_activations] == \
+        [(a["cycle"], a["agents"]) for a in sequential.agent_activations]
+    assert np.allclose(batched.sigma.history.mean(), sequential.sigma.history.mean())
+    assert np.allclose(batched.sigma.history.variance(), sequential.sigma.history.variance())
+    assert batched.cycle_count == 40
+
+
+def test_sparse_fields_on_both_backends():
+    config = {"field": {"shape": [256, 256], "density": 0.01}, "tau_threshold": 2.0}
+    for backend in ("numpy", "torch"):
+        schema = ActivationSchema({**config, "backend": backend})
+        out = asyncio.run(schema.run_cycle())
+        assert 0.0 < out["tau"] < 1.0
+        assert schema.sigma.identity_mass > 0
+
+
+def test_import_does_not_load_heavy_dependencies():
+    root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    code = ("import sys, src.activation_schema, src.monitor, src.sweep; "
+            "print(sorted(m for m in ('torch', 'matplotlib', 'scipy') if m in sys.modules))")
+    out = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "[]"
@@ -0,0 +1,60 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import numpy as np
+
+from src.seed_cache import SeedCache, embed_file, embed_text
+
+PRIMER = os.path.join(os.path.dirname(__file__), "..", "aci_primer_reprint.md")
+
+
+def test_hashed_embedding_is_order_free_and_keeps_every_token():
+    assert np.allclose(embed_text("alpha beta beta"), embed_text("beta, alpha. Beta"))
+    words = " ".join(f"w{i}" for i in range(5000))
+    small, large = embed_text(words, dim=128), embed_text(words, dim=65536)
+    assert np.count_nonzero(small) > 100  # signed buckets may cancel
+    assert np.count_nonzero(large) > 4500
+    assert np.isclose(np.linalg.norm(large), 1.0)
+
+
+def test_streaming_matches_whole_text():
+    text = open(PRIMER, encoding="utf-8").read()
+    assert np.allclose(embed_file(PRIMER, dim=1024, chunk_size=97), embed_text(text, dim=1024))
+    sparse = embed_file(PRIMER, dim=1024, sparse=True)
+    assert sparse.shape == (1, 1024)
+    assert np.allclose(sparse.toarray().ravel(), embed_text(text, dim=1024))
+
+
+def test_cache_hits_and_invalidation(tmp_path):
+    seed = tmp_path / "seed.md"
+    seed.write_text("alpha beta beta")
+    cache = SeedCache(tmp_path / "store")
+    first = cache.load(seed)
+    assert cache.load(seed) is first and cache.hits == 1
+
+    seed.write_text("gamma gamma delta")
+    os.utime(seed, ns=(1, 1))
+    changed = cache.load(seed)
+    assert np.allclose(changed, embed_text("gamma gamma delta"))
+
+    # a fresh process reuses the on-disk store
+    fresh = SeedCache(tmp_path / "store")
+    assert np.array_equal(fresh.load(seed), changed)
+    assert fresh.misses == 0
+
+
+def test_load_directory(tmp_path):
+    texts = {"a.md": "one two two", "nested/b.md": "three", "c.md": "one two two"}
+    for name, text in texts.items():
+        (tmp_path / name).parent.mkdir(exist_ok=True)
+        (tmp_path / name).write_text(text)
+    cache = SeedCache(None)
+    embeddings = cache.load_directory(tmp_path)
+    assert len(embeddings) == 3 and cache.misses == 2
+    for name, text in texts.items():
+        assert np.allclose(embeddings[str(tmp_path / name)], embed_text(text))
+    assert cache.load(tmp_path / "a.md") is embeddings[str(tmp_path / "a.md")]
+
+    sparse = SeedCache(tmp_path / "store", dim=4096, sparse=True)
+    stored = sparse.load_directory(tmp_path)[str(tmp_path / "nested/b.md")]
+    reloaded = SeedCache(tmp_path / "store", dim=4096, sparse=True).load(tmp_path / "nested/b.md")
+    assert np.allclose(reloaded.toarray(), stored.toarray())
@@ -0,0 +1,63 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import asyncio
+
+import numpy as np
+
+from src import baby
+from src.series import Envelope, SeriesWriter, decimate, read_column
+
+
+def test_writer_appends_columns_readable_by_memmap(tmp_path):
+    with SeriesWriter(tmp_path, ("sigma", "tau"), flush_every=3) as writer:
+        for i in range(7):
+            writer.append({"sigma": i, "tau": -i, "ignored": 1})
+    assert read_column(tmp_path, "sigma").tolist() == list(range(7))
+    assert read_column(tmp_path, "tau").tolist() == [-i for i in range(7)]
+    # a torn row (one column ahead) is hidden from readers
+    with open(tmp_path / "sigma.f64", "ab") as f:
+        f.write(np.float64(99).tobytes())
+    assert len(read_column(tmp_path, "sigma")) == 7
+
+
+def test_reopened_writer_realigns_torn_columns(tmp_path):
+    with SeriesWriter(tmp_path, ("sigma", "tau")) as writer:
+        for i in range(4):
+            writer.append({"sigma": i, "tau": -i})
+    with open(tmp_path / "sigma.f64", "ab") as f:  # crash after flushing sigma only
+        f.write(np.arange(4, 6, dtype=np.float64).tobytes() + b"\x00\x01")
+    with SeriesWriter(tmp_path, ("sigma", "tau")) as writer:
+        writer.append({"sigma": 10, "tau": -10})
+    assert read_column(tmp_path, "sigma").tolist() == [0, 1, 2, 3, 10]
+    assert read_column(tmp_path, "tau").tolist() == [0, -1, -2, -3, -10]
+
+
+def test_decimate_keeps_extremes_per_bucket():
+    series = np.sin(np.linspace(0, 100, 1_000_003))
+    series[123_457] = 5.0
+    x, lo, hi = decimate(series, buckets=1000, chunk_buckets=7)
+    assert len(x) == len(lo) == len(hi) <= 1000
+    assert hi.max() == 5.0 and lo.min() == series.min()
+    bucket = int(x[1])
+    assert np.allclose(hi, [series[i:i + bucket].max() for i in range(0, len(series), bucket)])
+
+
+def test_run_records_series(tmp_path, monkeypatch):
+    monkeypatch.setattr(baby, "MEMORY_FILE", tmp_path / "memory.json")
+    monkeypatch.setattr(baby, "WAL_FILE", tmp_path / "memory.wal")
+    asyncio.run(baby.run(max_depth=5))
+    memory = asyncio.run(baby.load_memory())
+    assert np.allclose(read_column(tmp_path / "series", "coherence"), memory["attractors"])
+    assert read_column(tmp_path / "series", "iteration").tolist() == [1, 2, 3, 4, 5]
+
+
+def test_envelope_matches_decimation_of_the_whole_series():
+    series = np.random.default_rng(3).standard_normal(12_345)
+    envelope = Envelope(width=50)
+    for start in range(0, len(series), 777):
+        envelope.extend(series[start:start + 777])
+    x, lo, hi = envelope.arrays()
+    bucket = envelope.bucket
+    assert envelope.count == len(series) and len(x) <= 100
+    assert np.allclose(lo, [series[i:i + bucket].min() for i in range(0, len(series), bucket)])
+    assert np.allclose(hi, [series[i:i + bucket].max() for i in range(0, len(series), bucket)])
@@ -0,0 +1,32 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+from src import sweep as sweep_module
+from src.sweep import METRICS, SweepGrid, format_table, sweep
+
+
+def test_sweep_is_deterministic():
+    grid = SweepGrid(seeds=["a", "b"], thresholds=[5.0, 50.0], depth=5, base_seed=7)
+    first = sweep(grid, workers=2)
+    second = sweep(grid, workers=2)
+    assert len(first) == 4
+    assert first == second
+    assert "identity_mass" in format_table(first)
+
+
+def test_worker_attach_leaves_the_parent_segment_untracked(monkeypatch):
+    shm = shared_memory.SharedMemory(create=True, size=len(METRICS) * 8)
+    tracked = []
+    monkeypatch.setattr(resource_tracker, "register", lambda name, rtype: tracked.append(name))
+    monkeypatch.setattr(resource_tracker, "unregister", lambda name, rtype: tracked.remove(name))
+    try:
+        assert sweep_module._run_task(shm.name, 1, 2, 0, (0, ("a", 50.0, 100.0))) == 0
+        assert tracked == []
+        assert np.ndarray((len(METRICS),), dtype=np.float64, buffer=shm.buf)[1] > 0
+    finally:
+        monkeypatch.undo()
+        shm.close()
+        shm.unlink()